@@ -0,0 +1,70 @@
+"""Drain a bursty producer: one `get` per message vs `get_batch`.
+
+python -m benchmark.bench_batch_drain [--messages 500000] [--burst 200]
+"""
+
+from argparse import ArgumentParser
+from threading import Thread
+from time import perf_counter
+
+from robot_one.api.bingx.future.ws.model.bounded_queue import BoundedQueue
+
+
+def produce(queue: BoundedQueue[int], messages: int, burst: int) -> None:
+    for i in range(0, messages, burst):
+        for j in range(i, min(i + burst, messages)):
+            queue.put(j)
+
+
+def consume_get(queue: BoundedQueue[int], messages: int) -> int:
+    get = queue.get
+    wake_count = 0
+
+    for _ in range(messages):
+        get()
+        wake_count += 1
+
+    return wake_count
+
+
+def consume_batch(queue: BoundedQueue[int], messages: int) -> int:
+    get_batch = queue.get_batch
+    received = 0
+    wake_count = 0
+
+    while received < messages:
+        received += len(get_batch(max_items=1000))
+        wake_count += 1
+
+    return wake_count
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500_000)
+    parser.add_argument("--burst", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"messages: {args.messages}, burst: {args.burst}")
+    for name, consume in [("get", consume_get), ("get_batch", consume_batch)]:
+        queue = BoundedQueue[int]()
+        producer = Thread(
+            target=produce,
+            kwargs={"queue": queue, "messages": args.messages, "burst": args.burst},
+            daemon=True,
+        )
+
+        start_s = perf_counter()
+        producer.start()
+        wake_count = consume(queue=queue, messages=args.messages)
+        elapsed_s = perf_counter() - start_s
+        producer.join()
+
+        print(
+            f"{name:<10} {args.messages / elapsed_s:12,.0f} messages/s"
+            f" {wake_count:10,} wake-ups"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Decompress and route websocket frames: previous read loop vs `classify`.
+
+python -m benchmark.bench_channel_classify [--frames 100000]
+"""
+
+import gzip
+import json
+import random
+from argparse import ArgumentParser
+from re import match
+from time import perf_counter
+
+from robot_one.api.bingx.future.ws.stream_channel import (
+    MessageKind,
+    ProducerChannel,
+)
+
+
+def build_frame_list(frames: int) -> list[bytes]:
+    def dumps(obj: dict) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    frame_list = []
+    for i in range(frames):
+        draw = random.random()
+        if draw < 0.90:
+            message = dumps(
+                {
+                    "code": 0,
+                    "dataType": "BTC-USDT@lastPrice",
+                    "data": {
+                        "e": "lastPriceUpdate",
+                        "E": 1710351327012 + i,
+                        "s": "BTC-USDT",
+                        "c": f"{random.uniform(60_000, 70_000):.1f}",
+                    },
+                }
+            )
+        elif draw < 0.95:
+            message = dumps(
+                {
+                    "e": "ORDER_TRADE_UPDATE",
+                    "E": 1710664488898 + i,
+                    "o": {"s": "XRP-USDT", "i": i, "X": "NEW", "q": "80.0"},
+                }
+            )
+        elif draw < 0.99:
+            message = b"Ping"
+        else:
+            message = dumps(
+                {"id": str(i), "code": 0, "msg": "", "dataType": "", "data": None}
+            )
+        frame_list.append(gzip.compress(message))
+
+    return frame_list
+
+
+def route_previous(frame: bytes) -> MessageKind:
+    """The read loop before `classify`."""
+
+    message = gzip.decompress(frame)
+
+    if message == b"Ping":
+        return MessageKind.PING
+    elif not (message.find(b'"code":0') > 0 or message.startswith(b'{"e":"')):
+        return MessageKind.ERROR
+    elif match(
+        pattern=r"""\{"id":"[^"]*","code":0,"msg":"","dataType":"","data":null\}""",
+        string=message.decode(encoding="utf-8"),
+    ):
+        return MessageKind.CONFIRMATION
+
+    return MessageKind.CONTENT
+
+
+def route_classify(frame: bytes) -> MessageKind:
+    return ProducerChannel.classify(message=ProducerChannel.decompress(data=frame))
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--frames", type=int, default=100_000)
+    args = parser.parse_args()
+
+    frame_list = build_frame_list(frames=args.frames)
+
+    assert [route_previous(f) for f in frame_list[:1000]] == [
+        route_classify(f) for f in frame_list[:1000]
+    ]
+
+    print(f"frames: {args.frames}")
+    for name, route in [("previous", route_previous), ("classify", route_classify)]:
+        start_s = perf_counter()
+        for frame in frame_list:
+            route(frame)
+        elapsed_s = perf_counter() - start_s
+
+        print(f"{name:<10} {args.frames / elapsed_s:12,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Decode hot websocket payloads: pydantic models vs `fast_decode` records.
+
+python -m benchmark.bench_fast_decode [--messages 100000]
+"""
+
+import json
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any, Callable
+
+from orjson import loads
+
+from robot_one.api.bingx.future.ws.model.fast_decode import (
+    decode_account_data,
+    decode_last_price,
+)
+from robot_one.api.bingx.future.ws.stream_account import ResponseData
+from robot_one.api.bingx.future.ws.stream_last_price import ResponseLastPrice
+from robot_one.api.bingx.spot.ws.model.fast_decode import decode_execution_report
+from robot_one.api.bingx.spot.ws.stream_account import (
+    ResponseData as SpotResponseData,
+)
+
+
+def dumps(obj: dict) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+LAST_PRICE = dumps(
+    {
+        "code": 0,
+        "dataType": "BTC-USDT@lastPrice",
+        "data": {
+            "e": "lastPriceUpdate",
+            "E": 1710351327012,
+            "s": "BTC-USDT",
+            "c": "64123.4",
+        },
+    }
+)
+ORDER_TRADE_UPDATE = dumps(
+    {
+        "e": "ORDER_TRADE_UPDATE",
+        "E": 1710664488898,
+        "o": {
+            "s": "XRP-USDT",
+            "c": "",
+            "i": 1769281218845814784,
+            "S": "SELL",
+            "o": "LIMIT",
+            "q": "80.00000000",
+            "p": "0.61670000",
+            "sp": "0.00000000",
+            "ap": "0.00000000",
+            "x": "TRADE",
+            "X": "NEW",
+            "N": "USDT",
+            "n": "0.00000000",
+            "T": 0,
+            "wt": "MARK_PRICE",
+            "ps": "SHORT",
+            "rp": "0.00000000",
+            "z": "0.00000000",
+            "sg": "false",
+        },
+    }
+)
+EXECUTION_REPORT = dumps(
+    {
+        "code": 0,
+        "dataType": "spot.executionReport",
+        "data": {
+            "e": "executionReport",
+            "E": 1712620300043,
+            "s": "CKB-USDT",
+            "S": "BUY",
+            "o": "LIMIT",
+            "q": 228,
+            "p": 0.021851,
+            "x": "CANCELED",
+            "X": "CANCELED",
+            "i": 1777483570864881664,
+            "l": 0,
+            "z": 0,
+            "L": 0,
+            "n": 0,
+            "N": "",
+            "T": 0,
+            "t": 0,
+            "O": 1712620082103,
+            "Z": 0,
+            "Y": 0,
+            "Q": 5,
+            "m": False,
+        },
+    }
+)
+
+CASE_LIST: list[tuple[str, bytes, Callable[[bytes], Any], Callable[[bytes], Any]]] = [
+    (
+        "lastPrice",
+        LAST_PRICE,
+        lambda m: ResponseLastPrice.model_validate_json(json_data=m).data,
+        decode_last_price,
+    ),
+    (
+        "ORDER_TRADE_UPDATE",
+        ORDER_TRADE_UPDATE,
+        lambda m: ResponseData(data=loads(m)),
+        lambda m: decode_account_data(data=loads(m)),
+    ),
+    (
+        "executionReport",
+        EXECUTION_REPORT,
+        lambda m: SpotResponseData.model_validate_json(json_data=m),
+        decode_execution_report,
+    ),
+]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"messages: {args.messages}")
+    for name, message, decode_model, decode_record in CASE_LIST:
+        for decoder_name, decode in [
+            ("pydantic", decode_model),
+            ("fast", decode_record),
+        ]:
+            start_s = perf_counter()
+            for _ in range(args.messages):
+                decode(message)
+            elapsed_s = perf_counter() - start_s
+
+            print(
+                f"{name:<20} {decoder_name:<10} {args.messages / elapsed_s:12,.0f} messages/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
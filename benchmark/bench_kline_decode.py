@@ -0,0 +1,113 @@
+"""Decode a 1000 candles KLine body: pydantic models vs columns.
+
+python -m benchmark.bench_kline_decode [--rows 1000] [--number 200]
+"""
+
+import json
+import random
+from argparse import ArgumentParser
+from timeit import timeit
+
+import numpy as np
+
+from robot_one.api.bingx.future.rest import read_kline as future_read_kline
+from robot_one.api.bingx.kline.model import (
+    build_kline_columns,
+    decode_future_kline_columns,
+    decode_spot_kline_columns,
+    to_polars,
+)
+from robot_one.api.bingx.spot.rest import read_kline as spot_read_kline
+
+START_TIME = 1_700_000_000_000
+INTERVAL_MS = 60_000
+
+
+def build_future_content(rows: int) -> bytes:
+    data = []
+    for i in range(rows):
+        price = random.uniform(60_000, 70_000)
+        data.append(
+            {
+                "open": f"{price:.1f}",
+                "close": f"{price * random.uniform(0.99, 1.01):.1f}",
+                "high": f"{price * 1.01:.1f}",
+                "low": f"{price * 0.99:.1f}",
+                "volume": f"{random.uniform(0, 500):.4f}",
+                "time": START_TIME + i * INTERVAL_MS,
+            }
+        )
+
+    return json.dumps({"code": 0, "msg": "", "data": data}).encode()
+
+
+def build_spot_content(rows: int) -> bytes:
+    data = []
+    for i in range(rows):
+        price = random.uniform(60_000, 70_000)
+        open_time = START_TIME + i * INTERVAL_MS
+        data.append(
+            [
+                open_time,
+                price,
+                price * 1.01,
+                price * 0.99,
+                price * random.uniform(0.99, 1.01),
+                random.uniform(0, 5_000_000),
+                open_time + INTERVAL_MS - 1,
+                random.uniform(0, 500),
+            ]
+        )
+
+    return json.dumps({"code": 0, "timestamp": START_TIME, "data": data}).encode()
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    future_content = build_future_content(rows=args.rows)
+    spot_content = build_spot_content(rows=args.rows)
+
+    def future_model():
+        return build_kline_columns(
+            kline_list=future_read_kline.ResponseKline.model_validate_json(
+                future_content
+            ).data,
+        )
+
+    def spot_model():
+        return build_kline_columns(
+            kline_list=spot_read_kline.ResponseKline.model_validate_json(
+                spot_content
+            ).data,
+            time_attribute="open_time",
+        )
+
+    case_map = {
+        "future model": future_model,
+        "future numpy": lambda: decode_future_kline_columns(future_content),
+        "future polars": lambda: to_polars(decode_future_kline_columns(future_content)),
+        "spot model": spot_model,
+        "spot numpy": lambda: decode_spot_kline_columns(spot_content),
+        "spot polars": lambda: to_polars(decode_spot_kline_columns(spot_content)),
+    }
+
+    for expected, actual in [
+        (future_model(), decode_future_kline_columns(future_content)),
+        (spot_model(), decode_spot_kline_columns(spot_content)),
+    ]:
+        for expected_column, actual_column in zip(expected, actual):
+            np.testing.assert_array_equal(expected_column, actual_column)
+
+    print(f"rows: {args.rows}, number: {args.number}")
+    for name, case in case_map.items():
+        case()
+        elapsed_s = timeit(case, number=args.number) / args.number
+        print(f"{name:<14} {elapsed_s * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
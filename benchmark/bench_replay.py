@@ -0,0 +1,190 @@
+"""Decode path throughput on recorded websocket traffic, without a network.
+
+python -m benchmark.bench_replay [--directory DIR] [--speed 0] [--repeat 5]
+    [--rate 5000] [--symbols 50] [--record-seconds 3]
+
+`prices.bxws` and `account.bxws` in `--directory` are replayed through the
+last price and account streamers. A missing recording is first made from
+`MockWsServer` (`--rate`, `--symbols`, `--record-seconds`); copy there the
+recordings of a production `ProducerChannel(frame_recorder=...)` to profile
+real bursts. `--speed 0` replays as fast as possible, messages/s is then the
+throughput of decompression, classification and decoding; `--speed 1`
+reproduces the recorded timing.
+"""
+
+import os
+import tempfile
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Callable
+
+from robot_one.api.bingx.future.ws.model.base_streamer import BaseStreamer
+from robot_one.api.bingx.future.ws.model.frame_recorder import FrameRecorder
+from robot_one.api.bingx.future.ws.stream_account import (
+    ProducerAccount,
+    StreamerAccount,
+)
+from robot_one.api.bingx.future.ws.stream_channel import ProducerChannel
+from robot_one.api.bingx.future.ws.stream_last_price import (
+    ProducerLastPrice,
+    StreamerLastPrice,
+)
+from robot_one.api.bingx.future.ws.stream_replay import (
+    ProducerReplay,
+    StreamerReplay,
+)
+from robot_one.api.bingx.mock.ws_server import MockListenKey, MockWsServer
+
+PRICE_FILENAME = "prices.bxws"
+ACCOUNT_FILENAME = "account.bxws"
+
+
+def record(args: Namespace, path: Path, account: bool) -> int:
+    server = MockWsServer(
+        account_event_rate=args.rate if account else 0.0,
+        message_rate=0.0 if account else args.rate,
+        symbol_count=args.symbols,
+    )
+    server.start()
+
+    listen_key = MockListenKey() if account else None
+    recorder = FrameRecorder(path=path)
+    producer = ProducerChannel(
+        daemon=True,
+        frame_recorder=recorder,
+        listen_key=listen_key,
+        subscription_list=ProducerLastPrice.build_subscription_list(
+            symbol_list=[] if account else server.symbol_list,
+        ),
+        url=server.url,
+    )
+
+    if listen_key is not None:
+        listen_key.start()
+
+    producer.start()
+    sleep(args.record_seconds)
+
+    producer.event_stop.set()
+    websocket = producer.websocket
+    if websocket is not None:
+        websocket.close()
+    producer.join(timeout=5)
+
+    recorder.close()
+    server.stop()
+
+    if listen_key is not None:
+        listen_key.stop()
+
+    return recorder.frame_count
+
+
+def build_last_price(
+    streamer_replay: StreamerReplay,
+    fast_decode: bool,
+) -> StreamerLastPrice:
+    return StreamerLastPrice(
+        producer=ProducerLastPrice(
+            daemon=True,
+            fast_decode=fast_decode,
+            streamer_channel=streamer_replay,
+        )
+    )
+
+
+def build_account(
+    streamer_replay: StreamerReplay,
+    fast_decode: bool,
+) -> StreamerAccount:
+    return StreamerAccount(
+        producer=ProducerAccount(
+            daemon=True,
+            fast_decode=fast_decode,
+            streamer_channel=streamer_replay,
+        )
+    )
+
+
+CASE_LIST: list[
+    tuple[str, str, Callable[[StreamerReplay, bool], BaseStreamer], bool]
+] = [
+    ("last_price", PRICE_FILENAME, build_last_price, False),
+    ("last_price_fast", PRICE_FILENAME, build_last_price, True),
+    ("account", ACCOUNT_FILENAME, build_account, False),
+    ("account_fast", ACCOUNT_FILENAME, build_account, True),
+]
+
+
+def run_case(
+    args: Namespace,
+    path: Path,
+    build_streamer: Callable[[StreamerReplay, bool], BaseStreamer],
+    fast_decode: bool,
+) -> tuple[int, float]:
+    producer_replay = ProducerReplay(
+        daemon=True,
+        path=path,
+        repeat=args.repeat,
+        speed=args.speed or None,
+    )
+    streamer = build_streamer(StreamerReplay(producer=producer_replay), fast_decode)
+    event_done = producer_replay.event_done
+    received_count = 0
+
+    start_s = perf_counter()
+
+    while not (event_done.is_set() and received_count >= producer_replay.content_count):
+        received_count += len(streamer.next_batch(timeout=0.1))
+
+    elapsed_s = perf_counter() - start_s
+
+    streamer.stop()
+
+    return received_count, elapsed_s
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--directory", type=Path, default=Path(tempfile.gettempdir()))
+    parser.add_argument("--speed", type=float, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=5_000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--record-seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    for filename in [PRICE_FILENAME, ACCOUNT_FILENAME]:
+        path = args.directory / filename
+
+        if not path.exists():
+            frame_count = record(
+                args=args,
+                path=path,
+                account=filename == ACCOUNT_FILENAME,
+            )
+            print(f"recorded {frame_count:,} frames in {path}")
+
+    print(f"speed: {args.speed or 'max'}, repeat: {args.repeat}")
+    print(f"{'case':<16} {'messages':>12} {'seconds':>10} {'messages/s':>12}")
+
+    for name, filename, build_streamer, fast_decode in CASE_LIST:
+        message_count, elapsed_s = run_case(
+            args=args,
+            path=args.directory / filename,
+            build_streamer=build_streamer,
+            fast_decode=fast_decode,
+        )
+
+        print(
+            f"{name:<16} {message_count:12,} {elapsed_s:10.2f}"
+            f" {message_count / elapsed_s:12,.0f}"
+        )
+
+    # Producers blocked on an empty channel queue never return, do not wait.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Throughput and latency of the REST endpoints against `MockRestServer`.
+
+python -m benchmark.bench_rest [--requests 2000] [--concurrency 16]
+    [--latency-ms 0]
+
+Every case goes through the real `query_*` functions: parameters, signing,
+the shared connection pool and response validation. `sync` runs one request
+after another, `threads` spreads them over a thread pool sharing the
+`Transport`, `aio` gathers them on the `AsyncTransport`. The server runs in
+the same process, `--latency-ms` models the network round trip.
+"""
+
+import asyncio
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from robot_one.api.bingx.aio import future as aio_future
+from robot_one.api.bingx.aio.core import AsyncTransport, set_async_transport
+from robot_one.api.bingx.future.rest.core import set_transport, Transport
+from robot_one.api.bingx.future.rest.create_order import (
+    query_create_order,
+    QueryCreateOrder,
+)
+from robot_one.api.bingx.future.rest.read_kline import query_kline, QueryKLine
+from robot_one.api.bingx.future.rest.read_position_list import (
+    query_position_list,
+)
+from robot_one.api.bingx.mock.rest_server import MockRestServer
+
+SYMBOL = "S0001-USDT"
+CREATE_ORDER = QueryCreateOrder(
+    position_side="LONG",
+    price=10.0,
+    quantity=1,
+    side="BUY",
+    symbol=SYMBOL,
+    type="LIMIT",
+)
+KLINE = QueryKLine(symbol=SYMBOL, limit=100)
+
+CASE_LIST: list[tuple[str, Callable[[], Any], Callable[[], Awaitable[Any]]]] = [
+    (
+        "kline",
+        lambda: query_kline(query=KLINE),
+        lambda: aio_future.query_kline(query=KLINE),
+    ),
+    (
+        "position_list",
+        query_position_list,
+        aio_future.query_position_list,
+    ),
+    (
+        "create_order",
+        lambda: query_create_order(query=CREATE_ORDER),
+        lambda: aio_future.query_create_order(query=CREATE_ORDER),
+    ),
+]
+
+
+def timed(call: Callable[[], Any]) -> float:
+    start_s = perf_counter()
+    call()
+    return perf_counter() - start_s
+
+
+async def timed_async(
+    call: Callable[[], Awaitable[Any]],
+    semaphore: asyncio.Semaphore,
+) -> float:
+    async with semaphore:
+        start_s = perf_counter()
+        await call()
+        return perf_counter() - start_s
+
+
+def run_sync(args: Namespace, call: Callable[[], Any]) -> list[float]:
+    return [timed(call=call) for _ in range(args.requests)]
+
+
+def run_threads(args: Namespace, call: Callable[[], Any]) -> list[float]:
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        return list(executor.map(lambda _: timed(call=call), range(args.requests)))
+
+
+def run_aio(args: Namespace, call: Callable[[], Awaitable[Any]]) -> list[float]:
+    async def gather() -> list[float]:
+        async with AsyncTransport(base_url=args.url) as transport:
+            set_async_transport(transport)
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            return await asyncio.gather(
+                *[
+                    timed_async(call=call, semaphore=semaphore)
+                    for _ in range(args.requests)
+                ]
+            )
+
+    return asyncio.run(gather())
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"requests: {args.requests}, concurrency: {args.concurrency},"
+        f" latency: {args.latency_ms} ms"
+    )
+    print(f"{'case':<16} {'mode':<8} {'requests/s':>12} {'p50 us':>10} {'p99 us':>10}")
+
+    with MockRestServer(latency_s=args.latency_ms / 1_000) as server:
+        args.url = server.url
+        set_transport(Transport(base_url=server.url, pool_maxsize=args.concurrency))
+
+        for name, call, call_async in CASE_LIST:
+            for mode, run in [
+                ("sync", lambda: run_sync(args=args, call=call)),
+                ("threads", lambda: run_threads(args=args, call=call)),
+                ("aio", lambda: run_aio(args=args, call=call_async)),
+            ]:
+                start_s = perf_counter()
+                latency_list = run()
+                elapsed_s = perf_counter() - start_s
+
+                p50_us, p99_us = np.percentile(np.array(latency_list) * 1e6, [50, 99])
+
+                print(
+                    f"{name:<16} {mode:<8} {args.requests / elapsed_s:12,.0f}"
+                    f" {p50_us:10,.0f} {p99_us:10,.0f}"
+                )
+
+        print(f"server errors: {server.error_count}")
+
+
+if __name__ == "__main__":
+    main()
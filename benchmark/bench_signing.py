@@ -0,0 +1,107 @@
+"""Per-order signing overhead: previous `get_signed_request` vs `Signer`.
+
+python -m benchmark.bench_signing [--orders 100000]
+
+`legacy` reproduces the previous implementation: the timestamp and the
+signature are merged with `prepare_url` (the URL is parsed and re-encoded
+twice), the secret is encoded and a new `hmac` is keyed for every request,
+then the URL is printed (to a discarded buffer here). `signer` is the
+current `get_signed_request`, `query_string` is `Signer.build_query_string`
+as used by the asyncio endpoints.
+"""
+
+import contextlib
+import hmac
+import io
+from argparse import ArgumentParser
+from hashlib import sha256
+from time import perf_counter
+from typing import Callable
+from urllib.parse import unquote
+
+from requests import PreparedRequest, Request
+
+from robot_one.api.bingx.future.rest.core import (
+    get_signed_request,
+    get_timestamp,
+    set_signer,
+    Signer,
+)
+from robot_one.api.bingx.future.rest.create_order import QueryCreateOrder
+from robot_one.api.bingx.future.rest.url import SWAP_V2_TRADE_ORDER
+
+API_KEY = "k" * 64
+API_SECRET = "s" * 64
+PARAMS_MAP = QueryCreateOrder(
+    client_order_id="bench-0001",
+    position_side="LONG",
+    price=64123.4,
+    quantity=0.0123,
+    side="BUY",
+    symbol="BTC-USDT",
+    type="LIMIT",
+).model_dump(by_alias=True, exclude_none=True)
+
+
+def build_prepared_request() -> PreparedRequest:
+    return Request(method="POST", params=PARAMS_MAP, url=SWAP_V2_TRADE_ORDER).prepare()
+
+
+def sign_legacy(prepared_request: PreparedRequest) -> None:
+    prepared_request.prepare_headers({"X-BX-APIKEY": API_KEY})
+    prepared_request.prepare_url(
+        url=prepared_request.url,
+        params={"timestamp": get_timestamp()},
+    )
+
+    query_string = unquote(prepared_request.url.split("?")[1])  # type: ignore
+    signature = hmac.new(
+        key=API_SECRET.encode("utf-8"),
+        msg=query_string.encode("utf-8"),
+        digestmod=sha256,
+    ).hexdigest()
+    prepared_request.prepare_url(
+        url=prepared_request.url,
+        params={"signature": signature},
+    )
+
+    url = prepared_request.url
+    assert url is not None
+
+    print(prepared_request.method, len(url), url)
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--orders", type=int, default=100_000)
+    args = parser.parse_args()
+
+    signer = Signer(api_key=API_KEY, api_secret=API_SECRET)
+    set_signer(signer)
+
+    case_list: list[tuple[str, Callable[[], object]]] = [
+        ("legacy", lambda: sign_legacy(build_prepared_request())),
+        (
+            "signer",
+            lambda: get_signed_request(prepared_request=build_prepared_request()),
+        ),
+        ("query_string", lambda: signer.build_query_string(params_map=PARAMS_MAP)),
+        ("prepare only", build_prepared_request),
+    ]
+
+    print(f"orders: {args.orders}")
+    for name, sign in case_list:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_s = perf_counter()
+            for _ in range(args.orders):
+                sign()
+            elapsed_s = perf_counter() - start_s
+
+        print(
+            f"{name:<14} {args.orders / elapsed_s:12,.0f} orders/s"
+            f" {elapsed_s / args.orders * 1e6:8.2f} us/order"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""End-to-end throughput and latency of the streamers against `MockWsServer`.
+
+python -m benchmark.bench_ws_streams [--rate 5000] [--symbols 50] [--seconds 5]
+    [--disconnect-every 0] [--latency-metrics]
+
+The server stamps `E` with `perf_counter_ns` when it builds a frame, the
+latency is measured when the consumer gets the decoded item. The server runs
+in the same process and competes for the GIL, compare cases with each other
+rather than with the live endpoint.
+
+`--latency-metrics` times every stage of the pipeline with `LatencyMetrics`
+and prints its percentiles after each case; compare the messages/s with and
+without it for the cost of the instrumentation. `SKEW` is not printed: the
+mock `E` is not a wall clock.
+"""
+
+import os
+import re
+from argparse import ArgumentParser, Namespace
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Any, Callable
+
+import numpy as np
+
+from robot_one.api.bingx.future.ws.model.base_streamer import BaseStreamer
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.stream_account import (
+    ProducerAccount,
+    StreamerAccount,
+)
+from robot_one.api.bingx.future.ws.stream_channel import (
+    ProducerChannel,
+    StreamerChannel,
+)
+from robot_one.api.bingx.future.ws.stream_last_price import (
+    ProducerLastPrice,
+    StreamerLastPrice,
+)
+from robot_one.api.bingx.mock.ws_server import MockListenKey, MockWsServer
+
+EVENT_TIME_PATTERN = re.compile(rb'"E":(\d+)')
+
+
+def build_channel(
+    server: MockWsServer,
+    fast_decode: bool,
+    latency_metrics: LatencyMetrics | None,
+) -> StreamerChannel:
+    return StreamerChannel(
+        producer=ProducerChannel(
+            daemon=True,
+            latency_metrics=latency_metrics,
+            subscription_list=ProducerLastPrice.build_subscription_list(
+                symbol_list=server.symbol_list,
+            ),
+            url=server.url,
+        )
+    )
+
+
+def build_last_price(
+    server: MockWsServer,
+    fast_decode: bool,
+    latency_metrics: LatencyMetrics | None,
+) -> StreamerLastPrice:
+    return StreamerLastPrice(
+        producer=ProducerLastPrice(
+            daemon=True,
+            fast_decode=fast_decode,
+            latency_metrics=latency_metrics,
+            streamer_channel=build_channel(
+                server=server,
+                fast_decode=fast_decode,
+                latency_metrics=latency_metrics,
+            ),
+        )
+    )
+
+
+def build_account(
+    server: MockWsServer,
+    fast_decode: bool,
+    latency_metrics: LatencyMetrics | None,
+) -> StreamerAccount:
+    return StreamerAccount(
+        producer=ProducerAccount(
+            daemon=True,
+            fast_decode=fast_decode,
+            latency_metrics=latency_metrics,
+            listen_key=MockListenKey(),
+            url=server.url,
+        )
+    )
+
+
+BuildStreamer = Callable[[MockWsServer, bool, LatencyMetrics | None], BaseStreamer]
+CASE_LIST: list[tuple[str, BuildStreamer, Callable[[Any], int], bool]] = [
+    (
+        "channel",
+        build_channel,
+        lambda m: int(EVENT_TIME_PATTERN.search(m).group(1)),  # type: ignore
+        False,
+    ),
+    ("last_price", build_last_price, lambda p: p.E, False),
+    ("last_price_fast", build_last_price, lambda p: p.E, True),
+    ("account", build_account, lambda r: r.data.E, False),
+    ("account_fast", build_account, lambda r: r.data.E, True),
+]
+
+
+def stop_streamer(streamer: BaseStreamer) -> None:
+    """Stop the producer and the channel it reads, before the server."""
+
+    streamer.stop()
+
+    streamer_channel = getattr(streamer.producer, "streamer_channel", None)
+    if streamer_channel is not None:
+        streamer_channel.stop()
+
+
+def run_case(
+    args: Namespace,
+    build_streamer: BuildStreamer,
+    get_event_time: Callable[[Any], int],
+    fast_decode: bool,
+    account: bool,
+    latency_metrics: LatencyMetrics | None,
+) -> tuple[float, float, float, int]:
+    server = MockWsServer(
+        account_event_rate=args.rate if account else 0.0,
+        disconnect_every=args.disconnect_every,
+        event_time=perf_counter_ns,
+        message_rate=0.0 if account else args.rate,
+        symbol_count=args.symbols,
+    )
+    server.start()
+
+    streamer = build_streamer(server, fast_decode, latency_metrics)
+    latency_list: list[int] = []
+
+    streamer.next_batch(timeout=10)
+    start_s = perf_counter()
+    deadline_s = start_s + args.seconds
+
+    while perf_counter() < deadline_s:
+        item_list = streamer.next_batch(timeout=0.1)
+        received_ns = perf_counter_ns()
+
+        latency_list.extend(received_ns - get_event_time(i) for i in item_list)
+
+    elapsed_s = perf_counter() - start_s
+
+    stop_streamer(streamer=streamer)
+    sleep(0.2)
+    server.stop()
+
+    latency_array = np.array(latency_list) / 1_000
+    p50_us, p99_us = np.percentile(latency_array, [50, 99]) if latency_list else (0, 0)
+
+    return len(latency_list) / elapsed_s, p50_us, p99_us, server.connection_count
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--rate", type=float, default=5_000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--disconnect-every", type=int, default=0)
+    parser.add_argument("--latency-metrics", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"rate: {args.rate:,.0f} messages/s, symbols: {args.symbols},"
+        f" disconnect every: {args.disconnect_every or '-'}"
+    )
+    print(f"{'case':<16} {'messages/s':>12} {'p50 us':>10} {'p99 us':>10} connections")
+
+    for name, build_streamer, get_event_time, fast_decode in CASE_LIST:
+        latency_metrics = LatencyMetrics() if args.latency_metrics else None
+        rate, p50_us, p99_us, connection_count = run_case(
+            args=args,
+            build_streamer=build_streamer,
+            get_event_time=get_event_time,
+            fast_decode=fast_decode,
+            account=name.startswith("account"),
+            latency_metrics=latency_metrics,
+        )
+
+        print(
+            f"{name:<16} {rate:12,.0f} {p50_us:10,.0f} {p99_us:10,.0f}"
+            f" {connection_count:11}"
+        )
+
+        if latency_metrics is None:
+            continue
+
+        for stage, snapshot in latency_metrics.snapshot().items():
+            if stage is not LatencyStage.SKEW:
+                print(
+                    f"  {stage.value:<14} {snapshot.sample_count:12,}"
+                    f" {snapshot.p50_us:10,.1f} {snapshot.p99_us:10,.1f}"
+                )
+
+    # Account producers open non-daemon channels, do not wait for them.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
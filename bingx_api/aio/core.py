@@ -0,0 +1,161 @@
+import os
+from threading import Lock
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from yarl import URL
+
+from robot_one.api.bingx.future.rest import core
+from robot_one.api.bingx.future.rest.core import encode_params
+
+__all__ = [
+    "AsyncTransport",
+    "build_signed_query_string",
+    "encode_params",
+    "get_async_transport",
+    "send_request",
+    "set_async_transport",
+]
+
+
+def build_signed_query_string(params_map: dict) -> str:
+    return core.get_signer().build_query_string(params_map=params_map)
+
+
+class AsyncTransport:
+    """Keep-alive connection pool shared by every asynchronous endpoint.
+
+    The underlying `ClientSession` is created on first use, it is bound to
+    the event loop running at that time.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        headers: dict | None = None,
+        keepalive_timeout: float = 30,
+        limit: int = 256,
+        limit_per_host: int = 64,
+        timeout_s: float = 30,
+    ) -> None:
+        """
+        Args:
+            base_url (str, optional):
+                Send the requests to this base URL instead of `BASE_URL`.
+            headers (dict, optional):
+                Headers used by every request.
+            keepalive_timeout (float):
+                Seconds an idle connection is kept open.
+            limit (int):
+                Maximum number of simultaneous connections.
+            limit_per_host (int):
+                Maximum number of simultaneous connections per host.
+            timeout_s (float):
+                Total timeout of one request.
+        """
+
+        self._base_url = base_url
+        self._headers = headers
+        self._keepalive_timeout = keepalive_timeout
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout_s = timeout_s
+
+        self._session: ClientSession | None = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @property
+    def base_url(self) -> str | None:
+        return self._base_url
+
+    @property
+    def session(self) -> ClientSession:
+        session = self._session
+
+        if session is None or session.closed:
+            connector = TCPConnector(
+                keepalive_timeout=self._keepalive_timeout,
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+            )
+            session = ClientSession(
+                connector=connector,
+                headers=self._headers,
+                timeout=ClientTimeout(total=self._timeout_s),
+            )
+            self._session = session
+
+        return session
+
+    async def close(self) -> None:
+        session = self._session
+
+        if session is not None and not session.closed:
+            await session.close()
+
+        self._session = None
+
+
+ASYNC_TRANSPORT_LOCK = Lock()
+_async_transport: AsyncTransport | None = None
+
+
+def get_async_transport() -> AsyncTransport:
+    global _async_transport
+
+    with ASYNC_TRANSPORT_LOCK:
+        if _async_transport is None:
+            _async_transport = AsyncTransport(
+                base_url=os.environ.get("BINGX_API_BASE_URL"),
+            )
+
+        return _async_transport
+
+
+def set_async_transport(transport: AsyncTransport) -> AsyncTransport | None:
+    """Replace the process-wide AsyncTransport, returns the previous one."""
+
+    global _async_transport
+
+    with ASYNC_TRANSPORT_LOCK:
+        previous_transport = _async_transport
+        _async_transport = transport
+
+    return previous_transport
+
+
+async def send_request(
+    method: str,
+    url: str,
+    params_map: dict | None = None,
+    session: ClientSession | None = None,
+    signed: bool = False,
+) -> bytes:
+    transport = get_async_transport()
+    session = session or transport.session
+    params_map = params_map or {}
+    url = core.rebase_url(url=url, base_url=transport.base_url)
+
+    if signed:
+        signer = core.get_signer()
+        headers = {"X-BX-APIKEY": signer.api_key}
+        query_string = signer.build_query_string(params_map=params_map)
+    else:
+        headers = None
+        query_string = encode_params(params_map=params_map)
+
+    full_url = URL(f"{url}?{query_string}" if query_string else url, encoded=True)
+
+    async with session.request(
+        method=method,
+        url=full_url,
+        headers=headers,
+    ) as response:
+        response.raise_for_status()
+        content = await response.read()
+
+    return content
@@ -0,0 +1,454 @@
+import asyncio
+
+from aiohttp import ClientSession
+
+from robot_one.api.bingx.aio.core import send_request
+from robot_one.api.bingx.future.rest.create_order import (
+    CreatedOrder,
+    QueryCreateOrder,
+    ResponseCreateOrder,
+)
+from robot_one.api.bingx.future.rest.create_order_list import (
+    build_batch_order_chunk_list,
+    MAX_URL_LENGTH,
+    merge_chunk_result_list,
+    QueryCreateOrderList,
+    ResponseCreateOrderList,
+)
+from robot_one.api.bingx.future.rest.delete_all_order import (
+    QueryDeleteOrder as QueryDeleteAllOpenOrder,
+    ResponseDeleteOrder as ResponseDeleteAllOpenOrder,
+)
+from robot_one.api.bingx.future.rest.delete_order import (
+    DeletedOrder,
+    QueryDeleteOrder,
+    ResponseDeleteOrder,
+)
+from robot_one.api.bingx.future.rest.delete_order_list import (
+    QueryDeleteOrderList,
+    ResponseDeleteOrderlist,
+)
+from robot_one.api.bingx.future.rest.read_commission_rate import (
+    CommissionRate,
+    EndpointResponse as ResponseCommissionRate,
+    QueryCommissionRate,
+)
+from robot_one.api.bingx.future.rest.read_contract_list import (
+    Contract,
+    QueryContractList,
+    ResponseContractList,
+)
+from robot_one.api.bingx.future.rest.read_funding_rate import (
+    FundingRate,
+    FundingRateResponse,
+    PreniumIndex,
+    PreniumIndexResponse,
+    QueryFundingRate,
+    QueryPreniumIndex,
+)
+from robot_one.api.bingx.future.rest.read_kline import (
+    OHLCV,
+    QueryKLine,
+    ResponseKline,
+)
+from robot_one.api.bingx.future.rest.read_last_price import (
+    LastPrice,
+    QueryLastPrice,
+    ResponseLastPrice,
+)
+from robot_one.api.bingx.future.rest.read_leverage import (
+    Leverage,
+    QueryLeverage,
+    ResponseLeverage,
+)
+from robot_one.api.bingx.future.rest.read_open_order_list import (
+    QueryOpenOrderList,
+    ResponseOpenOrderList,
+)
+from robot_one.api.bingx.future.rest.read_order import QueryOrder, ResponseOrder
+from robot_one.api.bingx.future.rest.read_order_list import (
+    EndpointResponse as ResponseOrderList,
+    OrderUpdate,
+    QueryOrderList,
+)
+from robot_one.api.bingx.future.rest.read_position_list import (
+    Position,
+    QueryPosition,
+    ResponsePosition,
+)
+from robot_one.api.bingx.future.rest.update_position_margin import (
+    QueryUpdatePositionMargin,
+    ResponseUpdatePositionMargin,
+)
+from robot_one.api.bingx.future.rest.url import (
+    SWAP_V1_TICKER_PRICE,
+    SWAP_V2_QUOTE_CONTRACTS,
+    SWAP_V2_QUOTE_FUNDING_RATE,
+    SWAP_V2_QUOTE_PREMIUM_INDEX,
+    SWAP_V2_TRADE_ALL_OPEN_ORDERS,
+    SWAP_V2_TRADE_ALL_ORDERS,
+    SWAP_V2_TRADE_BATCH_ORDERS,
+    SWAP_V2_TRADE_LEVERAGE,
+    SWAP_V2_TRADE_OPEN_ORDERS,
+    SWAP_V2_TRADE_ORDER,
+    SWAP_V2_TRADE_POSITION_MARGIN,
+    SWAP_V2_USER_COMMISSION_RATE,
+    SWAP_V2_USER_POSITIONS,
+    SWAP_V3_QUOTE_KLINES,
+)
+
+__all__ = [
+    "fetch_current_funding_rate",
+    "query_commission_rate",
+    "query_contract_list",
+    "query_create_order_list",
+    "query_create_order",
+    "query_delete_all_open_order",
+    "query_delete_order_list",
+    "query_delete_order",
+    "query_funding_rate_history",
+    "query_kline",
+    "query_last_price",
+    "query_leverage",
+    "query_open_order_list",
+    "query_order_list",
+    "query_order",
+    "query_position_list",
+    "query_update_position_margin",
+]
+
+
+async def query_create_order(
+    query: QueryCreateOrder,
+    session: ClientSession | None = None,
+) -> CreatedOrder:
+    content = await send_request(
+        method="POST",
+        url=SWAP_V2_TRADE_ORDER,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseCreateOrder.model_validate_json(content)
+
+    return endpoint_response.data.order
+
+
+async def query_create_order_chunk(
+    query: QueryCreateOrderList,
+    session: ClientSession | None = None,
+) -> ResponseCreateOrderList:
+    content = await send_request(
+        method="POST",
+        url=SWAP_V2_TRADE_BATCH_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseCreateOrderList.model_validate_json(content)
+
+    return endpoint_response
+
+
+async def query_create_order_list(
+    query: QueryCreateOrderList,
+    max_url_length: int = MAX_URL_LENGTH,
+    session: ClientSession | None = None,
+) -> ResponseCreateOrderList:
+    """Accepts any number of orders, see the synchronous version."""
+
+    chunk_list = build_batch_order_chunk_list(
+        query=query,
+        max_url_length=max_url_length,
+    )
+
+    if len(chunk_list) <= 1:
+        return await query_create_order_chunk(query=query, session=session)
+
+    chunk_query_list = [
+        query.model_copy(update={"batch_orders": chunk}) for chunk in chunk_list
+    ]
+    result_list = await asyncio.gather(
+        *(
+            query_create_order_chunk(query=chunk_query, session=session)
+            for chunk_query in chunk_query_list
+        ),
+        return_exceptions=True,
+    )
+
+    return merge_chunk_result_list(
+        chunk_query_list=chunk_query_list,
+        result_list=list(result_list),
+    )
+
+
+async def query_delete_all_open_order(
+    query: QueryDeleteAllOpenOrder,
+    session: ClientSession | None = None,
+) -> ResponseDeleteAllOpenOrder:
+    content = await send_request(
+        method="DELETE",
+        url=SWAP_V2_TRADE_ALL_OPEN_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseDeleteAllOpenOrder.model_validate_json(content)
+
+    return endpoint_response
+
+
+async def query_delete_order(
+    query: QueryDeleteOrder,
+    session: ClientSession | None = None,
+) -> DeletedOrder:
+    content = await send_request(
+        method="DELETE",
+        url=SWAP_V2_TRADE_ORDER,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseDeleteOrder.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_delete_order_list(
+    query: QueryDeleteOrderList,
+    session: ClientSession | None = None,
+) -> ResponseDeleteOrderlist:
+    content = await send_request(
+        method="DELETE",
+        url=SWAP_V2_TRADE_BATCH_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseDeleteOrderlist.model_validate_json(content)
+
+    return endpoint_response
+
+
+async def query_commission_rate(
+    query: QueryCommissionRate | None = None,
+    session: ClientSession | None = None,
+) -> CommissionRate:
+    query = query or QueryCommissionRate()
+
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_USER_COMMISSION_RATE,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseCommissionRate.model_validate_json(content)
+
+    return endpoint_response.data.commission
+
+
+async def query_contract_list(
+    query: QueryContractList | None = None,
+    session: ClientSession | None = None,
+) -> list[Contract]:
+    query = query or QueryContractList()
+
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_QUOTE_CONTRACTS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseContractList.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def fetch_current_funding_rate(
+    query: QueryPreniumIndex,
+    session: ClientSession | None = None,
+) -> PreniumIndex:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_QUOTE_PREMIUM_INDEX,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+    )
+    endpoint_response = PreniumIndexResponse.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_funding_rate_history(
+    query: QueryFundingRate,
+    session: ClientSession | None = None,
+) -> list[FundingRate]:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_QUOTE_FUNDING_RATE,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+    )
+    endpoint_response = FundingRateResponse.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_kline(
+    query: QueryKLine,
+    session: ClientSession | None = None,
+) -> list[OHLCV]:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V3_QUOTE_KLINES,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+    )
+    endpoint_response = ResponseKline.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_last_price(
+    query: QueryLastPrice,
+    session: ClientSession | None = None,
+) -> LastPrice:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V1_TICKER_PRICE,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseLastPrice.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_leverage(
+    query: QueryLeverage,
+    session: ClientSession | None = None,
+) -> Leverage:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_TRADE_LEVERAGE,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseLeverage.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_open_order_list(
+    query: QueryOpenOrderList,
+    session: ClientSession | None = None,
+) -> list[OrderUpdate]:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_TRADE_OPEN_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOpenOrderList.model_validate_json(content)
+
+    return endpoint_response.data.orders
+
+
+async def query_order(
+    query: QueryOrder,
+    session: ClientSession | None = None,
+) -> OrderUpdate:
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_TRADE_ORDER,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOrder.model_validate_json(content)
+
+    return endpoint_response.data.order
+
+
+async def query_order_list(
+    query: QueryOrderList,
+    session: ClientSession | None = None,
+) -> list[OrderUpdate]:
+    """Query the user's historical orders (order status is canceled or filled)."""
+
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_TRADE_ALL_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOrderList.model_validate_json(content)
+
+    return endpoint_response.data.orders
+
+
+async def query_position_list(
+    query: QueryPosition | None = None,
+    session: ClientSession | None = None,
+) -> list[Position]:
+    query = query or QueryPosition()
+
+    content = await send_request(
+        method="GET",
+        url=SWAP_V2_USER_POSITIONS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponsePosition.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_update_position_margin(
+    query: QueryUpdatePositionMargin,
+    session: ClientSession | None = None,
+) -> ResponseUpdatePositionMargin:
+    content = await send_request(
+        method="POST",
+        url=SWAP_V2_TRADE_POSITION_MARGIN,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseUpdatePositionMargin.model_validate_json(content)
+
+    return endpoint_response
+
+
+if __name__ == "__main__":
+    from datetime import datetime
+
+    from robot_one.api.bingx.aio.core import get_async_transport
+
+    async def main() -> None:
+        async with get_async_transport():
+            end_time = int(datetime.now().timestamp() * 1000)
+            kline_list_list = await asyncio.gather(
+                *(
+                    query_kline(
+                        query=QueryKLine(
+                            end_time=end_time,
+                            start_time=end_time - 3 * 3600 * 1000,
+                            symbol=symbol,
+                        ),
+                    )
+                    for symbol in ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
+                )
+            )
+
+        for kline_list in kline_list_list:
+            print("result:", kline_list)
+
+    asyncio.run(main())
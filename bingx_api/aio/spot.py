@@ -0,0 +1,190 @@
+from aiohttp import ClientSession
+
+from robot_one.api.bingx.aio.core import send_request
+from robot_one.api.bingx.spot.rest.create_order import (
+    CreatedOrder,
+    QueryCreateOrder,
+    ResponseCreateOrder,
+)
+from robot_one.api.bingx.spot.rest.create_order_list import (
+    QueryCreateOrderList,
+    ResponseCreateOrderList,
+)
+from robot_one.api.bingx.spot.rest.delete_order_list import (
+    QueryDeleteOrderList,
+    ResponseDeleteOrderlist,
+)
+from robot_one.api.bingx.spot.rest.read_contract_list import (
+    Contract,
+    QueryContractList,
+    ResponseContractList,
+)
+from robot_one.api.bingx.spot.rest.read_kline import (
+    KLineEntry,
+    QueryKLine,
+    ResponseKline,
+)
+from robot_one.api.bingx.spot.rest.read_open_order_list import (
+    EndpointResponse as ResponseOpenOrderList,
+    OrderUpdate as OpenOrderUpdate,
+    QueryOpenOrderList,
+)
+from robot_one.api.bingx.spot.rest.read_order import QueryOrder, ResponseOrder
+from robot_one.api.bingx.spot.rest.read_order_list import (
+    EndpointResponse as ResponseOrderList,
+    OrderUpdate,
+    QueryOrderList,
+)
+from robot_one.api.bingx.spot.rest.url import (
+    SPOT_V1_COMMON_SYMBOLS,
+    SPOT_V1_TRADE_BATCH_ORDERS,
+    SPOT_V1_TRADE_CANCEL_ORDERS,
+    SPOT_V1_TRADE_HISTORY_ORDERS,
+    SPOT_V1_TRADE_OPEN_ORDERS,
+    SPOT_V1_TRADE_ORDER,
+    SPOT_V1_TRADE_QUERY,
+    SPOT_V2_MARKET_KLINE,
+)
+
+__all__ = [
+    "query_contract_list",
+    "query_create_order_list",
+    "query_create_order",
+    "query_delete_order_list",
+    "query_kline",
+    "query_open_order_list",
+    "query_order_list",
+    "query_order",
+]
+
+
+async def query_create_order(
+    query: QueryCreateOrder,
+    session: ClientSession | None = None,
+) -> CreatedOrder:
+    content = await send_request(
+        method="POST",
+        url=SPOT_V1_TRADE_ORDER,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseCreateOrder.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_create_order_list(
+    query: QueryCreateOrderList,
+    session: ClientSession | None = None,
+) -> list[CreatedOrder]:
+    content = await send_request(
+        method="POST",
+        url=SPOT_V1_TRADE_BATCH_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseCreateOrderList.model_validate_json(content)
+
+    return endpoint_response.data.orders
+
+
+async def query_delete_order_list(
+    query: QueryDeleteOrderList,
+    session: ClientSession | None = None,
+) -> ResponseDeleteOrderlist:
+    content = await send_request(
+        method="POST",
+        url=SPOT_V1_TRADE_CANCEL_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseDeleteOrderlist.model_validate_json(content)
+
+    return endpoint_response
+
+
+async def query_contract_list(
+    query: QueryContractList | None = None,
+    session: ClientSession | None = None,
+) -> list[Contract]:
+    query = query or QueryContractList()
+
+    content = await send_request(
+        method="GET",
+        url=SPOT_V1_COMMON_SYMBOLS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+    )
+    endpoint_response = ResponseContractList.model_validate_json(content)
+
+    return endpoint_response.data.symbols
+
+
+async def query_kline(
+    query: QueryKLine,
+    session: ClientSession | None = None,
+) -> list[KLineEntry]:
+    content = await send_request(
+        method="GET",
+        url=SPOT_V2_MARKET_KLINE,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+    )
+    endpoint_response = ResponseKline.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_open_order_list(
+    query: QueryOpenOrderList | None = None,
+    session: ClientSession | None = None,
+) -> list[OpenOrderUpdate]:
+    query = query or QueryOpenOrderList()
+
+    content = await send_request(
+        method="GET",
+        url=SPOT_V1_TRADE_OPEN_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOpenOrderList.model_validate_json(content)
+
+    return endpoint_response.data.orders
+
+
+async def query_order(
+    query: QueryOrder,
+    session: ClientSession | None = None,
+) -> OrderUpdate:
+    content = await send_request(
+        method="GET",
+        url=SPOT_V1_TRADE_QUERY,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOrder.model_validate_json(content)
+
+    return endpoint_response.data
+
+
+async def query_order_list(
+    query: QueryOrderList,
+    session: ClientSession | None = None,
+) -> list[OrderUpdate]:
+    """Query the user's historical orders (order status is completed or canceled)."""
+
+    content = await send_request(
+        method="GET",
+        url=SPOT_V1_TRADE_HISTORY_ORDERS,
+        params_map=query.model_dump(by_alias=True, exclude_none=True),
+        session=session,
+        signed=True,
+    )
+    endpoint_response = ResponseOrderList.model_validate_json(content)
+
+    return endpoint_response.data.orders
@@ -0,0 +1,240 @@
+import asyncio
+from logging import getLogger, Logger
+from typing import AsyncIterable, AsyncIterator
+
+from robot_one.api.bingx.aio.stream_channel import (
+    AsyncListenKey,
+    AsyncStreamerChannel,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import (
+    GapMarker,
+    ReconnectPolicy,
+)
+from robot_one.api.bingx.spot.ws.stream_account import ResponseData
+from robot_one.api.bingx.spot.ws.stream_channel import (
+    ProducerChannel,
+    Subscription,
+)
+from robot_one.api.bingx.spot.ws.stream_last_price import (
+    LastPrice,
+    ProducerLastPrice,
+    ResponseLastPrice,
+)
+from robot_one.api.bingx.spot.ws.url import MARKET
+
+__all__ = [
+    "AsyncStreamerAccount",
+    "AsyncStreamerLastPrice",
+]
+
+SymbolType = str
+
+
+class AsyncStreamerLastPrice:
+    """`async for` counterpart of the spot `StreamerLastPrice`."""
+
+    def __init__(
+        self,
+        logger: Logger | None = None,
+        streamer_channel: AsyncStreamerChannel[Subscription] | None = None,
+        symbol_list: list[str] | None = None,
+    ) -> None:
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._streamer_channel = streamer_channel or AsyncStreamerChannel[Subscription](
+            channel_class=ProducerChannel,
+            subscription_list=ProducerLastPrice.build_subscription_list(
+                symbol_list=symbol_list or [],
+            ),
+            url=MARKET,
+        )
+
+    def __aiter__(self) -> AsyncIterator[LastPrice | GapMarker]:
+        return self.iter_last_price()
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def streamer_channel(self) -> AsyncStreamerChannel[Subscription]:
+        return self._streamer_channel
+
+    @property
+    def symbol_list(self) -> list[SymbolType]:
+        return ProducerLastPrice.parse_symbol_list(
+            subscription_list=self._streamer_channel.subscription_list,
+        )
+
+    async def iter_last_price(self) -> AsyncIterator[LastPrice | GapMarker]:
+        logger = self._logger
+
+        async for message in self._streamer_channel:
+            if isinstance(message, GapMarker):
+                yield message
+                continue
+
+            last_price = ResponseLastPrice.model_validate_json(json_data=message).data
+
+            logger.debug("LAST_PRICE:%s", last_price)
+
+            yield last_price
+
+    async def stop(self) -> None:
+        await self._streamer_channel.stop()
+
+    async def update_symbol_list(self, symbol_list: list[SymbolType]) -> None:
+        await self._streamer_channel.subscribe(
+            expected_list=ProducerLastPrice.build_subscription_list(
+                symbol_list=symbol_list,
+            ),
+        )
+
+
+class AsyncStreamerAccount:
+    """`async for` counterpart of the spot `StreamerAccount`.
+
+    The listen key of the account is shared through an `AsyncListenKey`,
+    with every other streamer of the account.
+    """
+
+    def __init__(
+        self,
+        catch_exception: bool = True,
+        gap_marker: bool = False,
+        listen_key: AsyncListenKey | None = None,
+        logger: Logger | None = None,
+        reconnect_policy: ReconnectPolicy | None = None,
+    ) -> None:
+        """
+        Args:
+            gap_marker (bool):
+                Yield a `GapMarker` after each reconnection of the channel:
+                account events may have been missed.
+            reconnect_policy (ReconnectPolicy, optional):
+                Backoff of the channel reconnections, and of the new listen
+                key and channel once the channel gave up.
+        """
+
+        self._catch_exception = catch_exception
+        self._gap_marker = gap_marker
+        self._listen_key = listen_key
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy()
+
+        self._event_stop = asyncio.Event()
+        self._streamer_channel: AsyncStreamerChannel[Subscription] | None = None
+
+    def __aiter__(self) -> AsyncIterator[ResponseData | GapMarker]:
+        return self.iter_response_data()
+
+    @property
+    def catch_exception(self) -> bool:
+        return self._catch_exception
+
+    @property
+    def gap_marker(self) -> bool:
+        return self._gap_marker
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy:
+        return self._reconnect_policy
+
+    async def iter_response_data(self) -> AsyncIterator[ResponseData | GapMarker]:
+        catch_exception = self._catch_exception
+        event_stop = self._event_stop
+        gap_marker = self._gap_marker
+        logger = self._logger
+        reconnect_policy = self._reconnect_policy
+
+        failure_count = 0
+
+        while not event_stop.is_set():
+            async with self._listen_key or AsyncListenKey() as listen_key:
+                streamer_channel = AsyncStreamerChannel[Subscription](
+                    catch_exception=catch_exception,
+                    gap_marker=gap_marker,
+                    channel_class=ProducerChannel,
+                    listen_key=listen_key,
+                    reconnect_policy=reconnect_policy,
+                    subscription_list=[
+                        Subscription(id="0", data_type="spot.executionReport"),
+                    ],
+                    url=MARKET,
+                )
+                self._streamer_channel = streamer_channel
+
+                logger.debug("<ACCOUNT_READER>:START_READING")
+
+                async for message in streamer_channel:
+                    failure_count = 0
+
+                    if isinstance(message, GapMarker):
+                        yield message
+                        continue
+
+                    response_update = ResponseData.model_validate_json(
+                        json_data=message
+                    )
+
+                    logger.debug(
+                        "<ACCOUNT_READER>:READ:RESPONSE_UPDATE:%s",
+                        response_update,
+                    )
+
+                    yield response_update
+
+            if event_stop.is_set():
+                break
+
+            # The channel gave up: a new listen key and channel, not at once.
+            failure_count += 1
+            delay_s = reconnect_policy.next_delay(failure_count=failure_count)
+            if delay_s is None:
+                logger.fatal(
+                    "<ACCOUNT_READER>:GIVING_UP:FAILURE_COUNT:%s", failure_count
+                )
+                break
+
+            logger.debug("<ACCOUNT_READER>:RESTARTING:DELAY_S:%s", delay_s)
+
+            try:
+                await asyncio.wait_for(event_stop.wait(), timeout=delay_s)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.debug("<ACCOUNT_READER>:STOP_READING")
+
+    async def stop(self) -> None:
+        streamer_channel = self._streamer_channel
+
+        self._event_stop.set()
+
+        if streamer_channel is not None:
+            await streamer_channel.stop()
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.basicConfig(level=logging.FATAL)
+
+    async def print_stream(streamer: AsyncIterable) -> None:
+        async for received_message in streamer:
+            print(received_message)
+
+    async def main() -> None:
+        await asyncio.gather(
+            print_stream(
+                AsyncStreamerLastPrice(symbol_list=["BTC-USDT", "ETH-USDT"]),
+            ),
+            print_stream(AsyncStreamerAccount()),
+        )
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Closing the websocket connection.")
@@ -0,0 +1,398 @@
+import asyncio
+from logging import getLogger, Logger
+from time import time_ns
+from typing import Any, AsyncIterator, Generic, Protocol, Sequence, TypeVar
+
+from pydantic import BaseModel
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import WebSocketException
+
+from robot_one.api.bingx.future.ws.model.reconnect_policy import (
+    GapMarker,
+    ReconnectPolicy,
+)
+from robot_one.api.bingx.future.ws.stream_channel import (
+    MessageKind,
+    ProducerChannel,
+    Subscription,
+)
+from robot_one.api.bingx.future.ws.url import SWAP_MARKET
+from robot_one.api.bingx.future.ws.valid_listen_key import (
+    get_valid_listen_key,
+    ValidListenKey,
+)
+
+__all__ = [
+    "AsyncListenKey",
+    "AsyncStreamerChannel",
+    "ChannelClass",
+]
+
+SubscriptionType = TypeVar("SubscriptionType")
+
+
+class ChannelClass(Protocol):
+    """Static methods of a `ProducerChannel`, futures or spot, used here.
+
+    Each reads the `Subscription` of its own module.
+    """
+
+    @staticmethod
+    def build_query_channel_list(
+        subscription_list: list[Any],
+    ) -> Sequence[BaseModel]: ...
+
+    @staticmethod
+    def build_query_channel_list_diff(
+        current_list: list[Any],
+        expected_list: list[Any],
+    ) -> Sequence[BaseModel]: ...
+
+    @staticmethod
+    def classify(message: bytes) -> MessageKind: ...
+
+    @staticmethod
+    def decompress(data: str | bytes) -> bytes: ...
+
+
+class AsyncListenKey:
+    """`ValidListenKey` for asyncio streamers, not a copy of it.
+
+    Backed by the key of the account (`get_valid_listen_key`), shared with
+    every other streamer, sync or async, and refreshed by the single
+    `ListenKeyService` thread. Only `start`, which may create the key with
+    a blocking REST call, runs in the default executor: the event loop is
+    never blocked.
+    """
+
+    def __init__(
+        self,
+        logger: Logger | None = None,
+        ready_poll_s: float = 0.1,
+        valid_listen_key: ValidListenKey | None = None,
+    ) -> None:
+        """
+        Args:
+            ready_poll_s (float):
+                Delay between two checks of the key readiness in `start`.
+            valid_listen_key (ValidListenKey, optional):
+                Key to use, defaults to `get_valid_listen_key()` on `start`.
+        """
+
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._ready_poll_s = ready_poll_s
+        self._valid_listen_key = valid_listen_key
+
+        self._started = False
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def valid_listen_key(self) -> ValidListenKey | None:
+        return self._valid_listen_key
+
+    def get_key(self) -> str | None:
+        valid_listen_key = self._valid_listen_key
+
+        return None if valid_listen_key is None else valid_listen_key.get_key()
+
+    async def start(self) -> None:
+        """Add a user of the shared key, wait until the key is available."""
+
+        if self._started:
+            return
+
+        valid_listen_key = self._valid_listen_key = (
+            self._valid_listen_key or get_valid_listen_key()
+        )
+
+        await asyncio.to_thread(valid_listen_key.start)
+        self._started = True
+
+        ready_event = valid_listen_key.ready_event
+        while not ready_event.is_set():
+            await asyncio.sleep(self._ready_poll_s)
+
+        self._logger.debug("<BINGX:REST>::READY:LISTEN_KEY")
+
+    async def stop(self) -> None:
+        """Remove the user, the key is dropped once it has none left."""
+
+        valid_listen_key = self._valid_listen_key
+
+        if self._started and valid_listen_key is not None:
+            self._started = False
+            valid_listen_key.stop()
+
+
+class AsyncStreamerChannel(Generic[SubscriptionType]):
+    """`async for` counterpart of `StreamerChannel`.
+
+    Messages are read, decompressed and yielded on the running event loop:
+    no producer thread and no queue between the socket and the consumer.
+    Run as many streamers as needed on the same loop, e.g. with
+    `asyncio.gather` or a `TaskGroup`.
+
+    Message classification (ping, error, confirmation) is delegated to the
+    static methods of `channel_class`, the spot `ProducerChannel` for spot.
+    Reconnections follow a `ReconnectPolicy`, as the `ProducerChannel` ones.
+    """
+
+    def __init__(
+        self,
+        catch_exception: bool = True,
+        channel_class: ChannelClass = ProducerChannel,
+        gap_marker: bool = False,
+        listen_key: AsyncListenKey | None = None,
+        logger: Logger | None = None,
+        max_connection_retry: int | None = None,
+        reconnect_policy: ReconnectPolicy | None = None,
+        subscription_list: list[SubscriptionType] | None = None,
+        url: str = SWAP_MARKET,
+    ) -> None:
+        """
+        Args:
+            gap_marker (bool):
+                Yield a `GapMarker` once reconnected, covering the time
+                without a connection.
+            max_connection_retry (int, optional):
+                Failed reconnections in a row before giving up, ignored
+                with `reconnect_policy`. Defaults to never giving up, until
+                stopped.
+            reconnect_policy (ReconnectPolicy, optional):
+                Backoff and circuit breaker of the reconnections.
+        """
+
+        self._catch_exception = catch_exception
+        self._channel_class = channel_class
+        self._gap_marker = gap_marker
+        self._listen_key = listen_key
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._max_connection_retry = max_connection_retry
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy(
+            max_failure=max_connection_retry,
+        )
+        self._subscription_list = subscription_list or []
+        self._url = url
+
+        self._event_stop = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._websocket: ClientConnection | None = None
+
+    def __aiter__(self) -> AsyncIterator[bytes | GapMarker]:
+        return self.iter_message()
+
+    @property
+    def catch_exception(self) -> bool:
+        return self._catch_exception
+
+    @property
+    def gap_marker(self) -> bool:
+        return self._gap_marker
+
+    @property
+    def listen_key(self) -> AsyncListenKey | None:
+        return self._listen_key
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def max_connection_retry(self) -> int | None:
+        return self._max_connection_retry
+
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy:
+        return self._reconnect_policy
+
+    @property
+    def subscription_list(self) -> list[SubscriptionType]:
+        return self._subscription_list
+
+    @property
+    def websocket(self) -> ClientConnection | None:
+        return self._websocket
+
+    def build_url(self) -> str:
+        listen_key = self._listen_key
+        url = self._url
+
+        if listen_key and listen_key.get_key():
+            url = f"{url}?listenKey={listen_key.get_key()}"
+
+        return url
+
+    async def send_query_channel_list(
+        self,
+        query_channel_list: Sequence[BaseModel],
+        websocket: ClientConnection,
+    ) -> None:
+        logger = self._logger
+
+        for query_channel in query_channel_list:
+            query_channel_json = query_channel.model_dump_json(
+                exclude_none=True,
+                by_alias=True,
+            )
+            await websocket.send(query_channel_json)
+
+            logger.debug("<BINGX:WS>:SUBSCRIBING:CHANNEL:%s", query_channel)
+
+    async def subscribe(
+        self,
+        expected_list: list[SubscriptionType] | None = None,
+    ) -> None:
+        channel_class = self._channel_class
+        current_list = self._subscription_list
+
+        async with self._lock:
+            websocket = self._websocket
+
+            if websocket is None:
+                if expected_list is not None:
+                    current_list[:] = expected_list
+            elif expected_list is not None:
+                await self.send_query_channel_list(
+                    query_channel_list=channel_class.build_query_channel_list_diff(
+                        current_list=current_list,
+                        expected_list=expected_list,
+                    ),
+                    websocket=websocket,
+                )
+                current_list[:] = expected_list
+            else:
+                await self.send_query_channel_list(
+                    query_channel_list=channel_class.build_query_channel_list(
+                        subscription_list=current_list,
+                    ),
+                    websocket=websocket,
+                )
+
+    async def iter_message(self) -> AsyncIterator[bytes | GapMarker]:
+        catch_exception = self._catch_exception
+        classify = self._channel_class.classify
+        decompress = self._channel_class.decompress
+        event_stop = self._event_stop
+        gap_marker = self._gap_marker
+        logger = self._logger
+        reconnect_policy = self._reconnect_policy
+
+        failure_count = 0
+        gap_start_ms = None
+
+        while not event_stop.is_set():
+            try:
+                async with connect(self.build_url()) as websocket:
+                    self._websocket = websocket
+
+                    logger.debug("<BINGX:WS>:READING")
+
+                    await self.subscribe()
+
+                    if gap_start_ms is not None:
+                        if gap_marker:
+                            yield GapMarker(
+                                start_ms=gap_start_ms,
+                                end_ms=time_ns() // 1_000_000,
+                                failure_count=failure_count,
+                                url=self._url,
+                            )
+
+                        gap_start_ms = None
+
+                    async for message_gzip in websocket:
+                        if failure_count:
+                            failure_count = 0
+
+                        message = decompress(data=message_gzip)
+                        message_kind = classify(message=message)
+
+                        if message_kind is MessageKind.CONTENT:
+                            logger.debug("<BINGX:WS>:CONTENT:MESSAGE:%s", message)
+                            yield message
+                        elif message_kind is MessageKind.PING:
+                            await websocket.send(b"Pong")
+                            logger.debug("<BINGX:WS>:SENDING:MESSAGE:%s", b"Pong")
+                        elif message_kind is MessageKind.ERROR:
+                            logger.fatal("<BINGX:WS>:ERROR:MESSAGE:%s", message)
+                        else:
+                            logger.debug("<BINGX:WS>:CONFIRMATION:MESSAGE:%s", message)
+            except (OSError, WebSocketException) as e:
+                if event_stop.is_set():
+                    break
+
+                if not catch_exception:
+                    raise e
+
+                logger.fatal("<BINGX:WS>:%s", e)
+            finally:
+                self._websocket = None
+
+            if event_stop.is_set():
+                break
+
+            if gap_start_ms is None:
+                gap_start_ms = time_ns() // 1_000_000
+
+            delay_s = reconnect_policy.next_delay(failure_count=failure_count)
+            if delay_s is None:
+                logger.fatal("<BINGX:WS>:GIVING_UP:FAILURE_COUNT:%s", failure_count)
+                break
+
+            failure_count += 1
+            logger.debug("<BINGX:WS>:RECONNECTING:DELAY_S:%s", delay_s)
+
+            if delay_s:
+                await self.wait_stop(timeout=delay_s)
+
+        logger.debug("<BINGX:WS>:STOP_READING")
+
+    async def wait_stop(self, timeout: float) -> bool:
+        """Sleep `timeout` seconds at most, `True` when stopped meanwhile."""
+
+        try:
+            await asyncio.wait_for(self._event_stop.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    async def stop(self) -> None:
+        websocket = self._websocket
+
+        self._event_stop.set()
+
+        if websocket is not None:
+            await websocket.close()
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.basicConfig(level=logging.FATAL)
+
+    async def main() -> None:
+        streamer = AsyncStreamerChannel(
+            subscription_list=[
+                Subscription(id="id1", data_type="BTC-USDT@lastPrice"),
+                Subscription(id="id1", data_type="ETH-USDT@lastPrice"),
+            ],
+        )
+
+        async for received_message in streamer:
+            print(received_message)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Closing the websocket connection.")
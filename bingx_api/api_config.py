@@ -1,5 +1,8 @@
+import os
 from pathlib import Path
+from threading import Lock
 
+from orjson import loads
 from pydantic import BaseModel
 
 PATH_PROJECT_FOLDER = (Path(__file__) / ".." / ".." / ".." / "..").resolve()
@@ -7,6 +10,10 @@ PATH_CONFIG_FOLDER = PATH_PROJECT_FOLDER / "config"
 PATH_CONFIG_FILE = PATH_CONFIG_FOLDER / "bingx" / "bingx_api.json"
 PATH_LOG_FOLDER = PATH_PROJECT_FOLDER / "log"
 
+ENV_API_KEY = "BINGX_API_KEY"
+ENV_API_SECRET = "BINGX_API_SECRET"
+ENV_CONFIG_FILE = "BINGX_API_CONFIG_FILE"
+
 
 class APIConfig(BaseModel):
     API_KEY: str
@@ -14,17 +21,62 @@ class APIConfig(BaseModel):
 
 
 def build_api_config(
-    location: Path = PATH_CONFIG_FILE,
+    location: Path | None = None,
     override: dict | None = None,
 ) -> APIConfig:
-    if not location and not override:
-        raise AttributeError("You need to provide at least on argument.")
+    """Credentials from, by increasing priority: file, environment, `override`.
+
+    The file (`location`, else `BINGX_API_CONFIG_FILE`, else
+    `PATH_CONFIG_FILE`) is only read when the environment variables
+    `BINGX_API_KEY`/`BINGX_API_SECRET` and `override` miss a field.
+    """
 
-    config = {}
+    config = {
+        field: os.environ[env]
+        for field, env in [("API_KEY", ENV_API_KEY), ("API_SECRET", ENV_API_SECRET)]
+        if env in os.environ
+    }
 
     if override:
         config.update(override)
 
-    api_config = APIConfig.model_validate_json(location.read_text())
+    if not APIConfig.model_fields.keys() <= config.keys():
+        location = location or Path(os.environ.get(ENV_CONFIG_FILE, PATH_CONFIG_FILE))
+        config = loads(location.read_bytes()) | config
+
+    return APIConfig.model_validate(config)
+
+
+API_CONFIG_LOCK = Lock()
+_api_config: APIConfig | None = None
+
+
+def get_api_config() -> APIConfig:
+    """Process-wide credentials, built on first use."""
+
+    global _api_config
+
+    api_config = _api_config
+
+    if api_config is None:
+        with API_CONFIG_LOCK:
+            if _api_config is None:
+                _api_config = build_api_config()
+            api_config = _api_config
 
     return api_config
+
+
+def set_api_config(api_config: APIConfig | None) -> APIConfig | None:
+    """Replace the process-wide credentials, returns the previous ones.
+
+    `None` makes the next `get_api_config` read the sources again.
+    """
+
+    global _api_config
+
+    with API_CONFIG_LOCK:
+        previous_api_config = _api_config
+        _api_config = api_config
+
+    return previous_api_config
@@ -1,13 +1,41 @@
 import hmac
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from hashlib import sha256
-from urllib.parse import unquote
+from logging import getLogger
+from threading import Lock, local
+from typing import Iterator
+from urllib.parse import unquote, urlencode
 
+from pydantic import BaseModel
 from requests import PreparedRequest, Session
+from requests.adapters import HTTPAdapter
 
-from robot_one.api.bingx.api_config import build_api_config
+from robot_one.api.bingx.api_config import APIConfig, get_api_config
+from robot_one.api.bingx.future.rest.url import BASE_URL
 
-API_CONFIG = build_api_config()
+__all__ = [
+    "build_session",
+    "encode_params",
+    "get_session",
+    "get_signature",
+    "get_signed_request",
+    "get_signer",
+    "get_timestamp",
+    "get_transport",
+    "PoolStats",
+    "RebaseAdapter",
+    "rebase_url",
+    "set_signer",
+    "set_transport",
+    "Signer",
+    "Transport",
+    "use_signer",
+]
+
+LOGGER = getLogger(name="bingx_api.rest")
 
 
 def build_session(
@@ -39,13 +67,316 @@ def build_session(
     return session
 
 
+def rebase_url(url: str, base_url: str | None) -> str:
+    """`url` with `BASE_URL` replaced by `base_url`, e.g. a local mock."""
+
+    if base_url and url.startswith(BASE_URL):
+        url = base_url.rstrip("/") + url[len(BASE_URL) :]
+
+    return url
+
+
+class RebaseAdapter(HTTPAdapter):
+    """`HTTPAdapter` sending the `BASE_URL` requests to `base_url`.
+
+    The endpoints keep their `BASE_URL` constants. The host is swapped at
+    send time, after signing: the signature only covers the query string.
+    """
+
+    def __init__(self, *args, base_url: str | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._base_url = base_url
+
+    @property
+    def base_url(self) -> str | None:
+        return self._base_url
+
+    def send(self, request: PreparedRequest, *args, **kwargs):  # type: ignore
+        if self._base_url and request.url:
+            request.url = rebase_url(url=request.url, base_url=self._base_url)
+
+        return super().send(request, *args, **kwargs)
+
+
+class PoolStats(BaseModel):
+    host: str
+    port: int | None
+    request_count: int
+    hit_count: int
+    miss_count: int
+
+
+class Transport:
+    """Keep-alive connection pool shared by every REST endpoint.
+
+    The `HTTPAdapter` (and its urllib3 pools) is shared by all threads, while
+    each thread gets its own `Session` mounted on it: the connections are
+    reused process-wide without sharing the cookies/headers state of a
+    `Session` across threads.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        headers: dict | None = None,
+        hooks: dict | None = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+    ) -> None:
+        """
+        Args:
+            base_url (str, optional):
+                Send the requests to this base URL instead of `BASE_URL`,
+                e.g. "http://127.0.0.1:8080" for a `MockRestServer`.
+            headers (dict, optional):
+                Headers used by every Session.
+            hooks (dict, optional):
+                Hooks used by every Session.
+            pool_connections (int):
+                Number of hosts to keep a pool for.
+            pool_maxsize (int):
+                Number of keep-alive connections kept per host.
+            pool_block (bool):
+                Wait for a free connection instead of opening an extra one
+                when `pool_maxsize` connections are busy.
+        """
+
+        self._adapter = RebaseAdapter(
+            base_url=base_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._headers = headers
+        self._hooks = hooks
+        self._local = local()
+
+    @property
+    def adapter(self) -> RebaseAdapter:
+        return self._adapter
+
+    @property
+    def base_url(self) -> str | None:
+        return self._adapter.base_url
+
+    @property
+    def session(self) -> Session:
+        """Session of the calling thread, mounted on the shared pool."""
+
+        session = getattr(self._local, "session", None)
+
+        if session is None:
+            session = build_session(headers=self._headers, hooks=self._hooks)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+
+        return session
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Hit/miss counts of the host pools currently alive.
+
+        A miss is a request which had to open a new connection.
+        """
+
+        pool_manager = self._adapter.poolmanager
+        pool_stats_list = []
+
+        for key in pool_manager.pools.keys():
+            pool = pool_manager.pools.get(key)
+
+            if pool is None:
+                continue
+
+            request_count = pool.num_requests
+            miss_count = pool.num_connections
+            pool_stats_list.append(
+                PoolStats(
+                    host=pool.host,
+                    port=pool.port,
+                    request_count=request_count,
+                    hit_count=max(request_count - miss_count, 0),
+                    miss_count=miss_count,
+                )
+            )
+
+        return pool_stats_list
+
+    def close(self) -> None:
+        self._adapter.close()
+
+
+TRANSPORT_LOCK = Lock()
+_transport: Transport | None = None
+
+
+def get_transport() -> Transport:
+    global _transport
+
+    transport = _transport
+
+    if transport is None:
+        with TRANSPORT_LOCK:
+            if _transport is None:
+                _transport = Transport(base_url=os.environ.get("BINGX_API_BASE_URL"))
+            transport = _transport
+
+    return transport
+
+
+def set_transport(transport: Transport) -> Transport | None:
+    """Replace the process-wide Transport, returns the previous one."""
+
+    global _transport
+
+    with TRANSPORT_LOCK:
+        previous_transport = _transport
+        _transport = transport
+
+    return previous_transport
+
+
+def get_session() -> Session:
+    """Session of the calling thread, backed by the process-wide pool."""
+
+    return get_transport().session
+
+
+def encode_params(params_map: dict) -> str:
+    """Same encoding as `requests` does for `Request(params=...)`.
+
+    The signature is computed on this exact string, so it has to stay
+    byte-for-byte compatible with the synchronous endpoints.
+    """
+
+    pair_list = []
+
+    for key, value in params_map.items():
+        value_list = value if isinstance(value, list | tuple) else [value]
+
+        for item in value_list:
+            if item is None:
+                continue
+
+            if isinstance(item, str):
+                item = item.encode("utf-8")
+
+            pair_list.append((key, item))
+
+    return urlencode(pair_list)
+
+
+class Signer:
+    """HMAC-SHA256 signer keyed once with the API secret.
+
+    The keyed `hmac` object is copied for every signature instead of being
+    rebuilt, which skips encoding the secret and hashing the key pads.
+    """
+
+    def __init__(self, api_key: str, api_secret: str) -> None:
+        self._api_key = api_key
+        self._hmac = hmac.new(key=api_secret.encode("utf-8"), digestmod=sha256)
+
+    @classmethod
+    def from_api_config(cls, api_config: APIConfig) -> "Signer":
+        return cls(api_key=api_config.API_KEY, api_secret=api_config.API_SECRET)
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    def sign(self, query_string: str) -> str:
+        """Signature of the decoded `query_string`."""
+
+        keyed_hmac = self._hmac.copy()
+        keyed_hmac.update(query_string.encode("utf-8"))
+
+        return keyed_hmac.hexdigest()
+
+    def sign_query_string(self, query_string: str) -> str:
+        """Encoded `query_string` with its `timestamp` and `signature` appended."""
+
+        timestamp_param = f"timestamp={get_timestamp()}"
+
+        if query_string:
+            query_string = f"{query_string}&{timestamp_param}"
+        else:
+            query_string = timestamp_param
+
+        signature = self.sign(query_string=unquote(query_string))
+
+        return f"{query_string}&signature={signature}"
+
+    def build_query_string(self, params_map: dict) -> str:
+        return self.sign_query_string(query_string=encode_params(params_map))
+
+
+SIGNER_LOCK = Lock()
+SIGNER_VAR: ContextVar[Signer | None] = ContextVar("SIGNER_VAR", default=None)
+_signer: Signer | None = None
+_default_signer: tuple[APIConfig, Signer] | None = None
+
+
+def get_signer() -> Signer:
+    """Signer of the current `use_signer` block, else the process-wide one.
+
+    Without `set_signer`, it is keyed with `get_api_config()`, so the
+    credentials are only loaded by the first signed request.
+    """
+
+    global _default_signer
+
+    signer = SIGNER_VAR.get() or _signer
+
+    if signer is None:
+        api_config = get_api_config()
+        default_signer = _default_signer
+
+        if default_signer is None or default_signer[0] is not api_config:
+            with SIGNER_LOCK:
+                default_signer = (api_config, Signer.from_api_config(api_config))
+                _default_signer = default_signer
+
+        signer = default_signer[1]
+
+    return signer
+
+
+def set_signer(signer: Signer | None) -> Signer | None:
+    """Replace the process-wide Signer, returns the previous one.
+
+    `None` goes back to the Signer keyed with `get_api_config()`.
+    """
+
+    global _signer
+
+    with SIGNER_LOCK:
+        previous_signer = _signer
+        _signer = signer
+
+    return previous_signer
+
+
+@contextmanager
+def use_signer(signer: Signer) -> Iterator[Signer]:
+    """Sign the requests of the current thread or task with `signer`.
+
+    One process can trade several accounts, e.g. one `use_signer` block per
+    worker thread or asyncio task.
+    """
+
+    token = SIGNER_VAR.set(signer)
+
+    try:
+        yield signer
+    finally:
+        SIGNER_VAR.reset(token)
+
+
 def get_signature(query_string: str) -> str:
-    signature = hmac.new(
-        key=API_CONFIG.API_SECRET.encode("utf-8"),
-        msg=query_string.encode("utf-8"),
-        digestmod=sha256,
-    ).hexdigest()
-    return signature
+    return get_signer().sign(query_string=query_string)
 
 
 def get_timestamp() -> int:
@@ -54,27 +385,21 @@ def get_timestamp() -> int:
 
 def get_signed_request(
     prepared_request: PreparedRequest,
-    api_key: str = API_CONFIG.API_KEY,
+    api_key: str | None = None,
+    signer: Signer | None = None,
 ) -> PreparedRequest:
+    """Append `timestamp` and `signature` to the already encoded URL."""
+
     if prepared_request.url is None:
         raise AttributeError("No URL provided.")
 
-    prepared_request.prepare_headers({"X-BX-APIKEY": api_key})
-
-    timestamp = get_timestamp()
-    prepared_request.prepare_url(
-        url=prepared_request.url,
-        params={"timestamp": timestamp},
-    )
+    signer = signer or get_signer()
 
-    query_string = unquote(prepared_request.url.split("?")[1])
+    prepared_request.headers["X-BX-APIKEY"] = api_key or signer.api_key
 
-    signature = get_signature(query_string=query_string)
-    prepared_request.prepare_url(
-        url=prepared_request.url,
-        params={"signature": signature},
-    )
+    url, _, query_string = prepared_request.url.partition("?")
+    prepared_request.url = f"{url}?{signer.sign_query_string(query_string)}"
 
-    print(prepared_request.method, len(prepared_request.url), prepared_request.url)
+    LOGGER.debug("<BINGX:REST>:%s:%s", prepared_request.method, url)
 
     return prepared_request
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from urllib.parse import urlencode, quote_plus
 
 from pydantic import (
     BaseModel,
@@ -11,8 +13,10 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
+    get_signer,
+    use_signer,
 )
 from robot_one.api.bingx.future.rest.url import (
     SWAP_V2_TRADE_BATCH_ORDERS,
@@ -27,18 +31,28 @@ from robot_one.api.bingx.future.rest.create_order import (
 
 
 __all__ = [
+    "build_batch_order_chunk_list",
     "CreatedOrder",
+    "CreateOrderListError",
     "DataCreateOrderList",
+    "MAX_URL_LENGTH",
+    "merge_chunk_result_list",
+    "merge_response_create_order_list",
     "SideType",
     "OrderType",
     "PositionSideType",
     "query_create_order_list",
+    "query_create_order_chunk",
     "QueryCreateOrder",
     "QueryCreateOrderList",
     "request_create_order_list",
     "ResponseCreateOrderList",
 ]
 
+MAX_URL_LENGTH = 4000
+# "&timestamp=<13 digits>&signature=<64 hexadecimal digits>" added on signing.
+SIGNATURE_PARAMS_LENGTH = len("&timestamp=") + 13 + len("&signature=") + 64
+
 
 class QueryCreateOrderList(BaseModel):
     model_config = ConfigDict(
@@ -89,19 +103,143 @@ class ResponseCreateOrderList(BaseModel):
         return data
 
 
+class CreateOrderListError(Exception):
+    """Some chunks of a batch failed, the others were still sent.
+
+    `response` merges the orders created by the chunks that succeeded,
+    `failed_chunk_list` pairs each failed chunk with its error.
+    """
+
+    def __init__(
+        self,
+        response: ResponseCreateOrderList,
+        failed_chunk_list: list[tuple[QueryCreateOrderList, BaseException]],
+    ) -> None:
+        super().__init__(
+            f"{len(failed_chunk_list)} chunk(s) failed: "
+            + "; ".join(str(error) for _, error in failed_chunk_list)
+        )
+
+        self.response = response
+        self.failed_chunk_list = failed_chunk_list
+
+
+def build_batch_order_chunk_list(
+    query: QueryCreateOrderList,
+    max_url_length: int = MAX_URL_LENGTH,
+) -> list[list[QueryCreateOrder]]:
+    """Pack `batch_orders` into the fewest consecutive chunks whose signed URL
+    stays under `max_url_length`.
+
+    The length is measured on the URL-encoded `batchOrders` JSON, so small
+    orders are packed more densely than big ones.
+    """
+
+    extra_params_map = query.model_dump(
+        by_alias=True,
+        exclude={"batch_orders"},
+        exclude_none=True,
+    )
+    extra_params_length = len(urlencode(extra_params_map))
+    fixed_length = (
+        len(SWAP_V2_TRADE_BATCH_ORDERS)
+        + len("?batchOrders=")
+        + (extra_params_length + 1 if extra_params_length else 0)
+        + SIGNATURE_PARAMS_LENGTH
+    )
+    budget_length = max_url_length - fixed_length
+    brackets_length = len(quote_plus("[]"))
+    separator_length = len(quote_plus(","))
+
+    chunk_list: list[list[QueryCreateOrder]] = []
+    chunk: list[QueryCreateOrder] = []
+    chunk_length = brackets_length
+
+    for order in query.batch_orders:
+        order_json = order.model_dump_json(by_alias=True, exclude_none=True)
+        order_length = len(quote_plus(order_json))
+
+        if brackets_length + order_length > budget_length:
+            raise ValueError(
+                f"Order doesn't fit in a {max_url_length} characters URL: {order_json}"
+            )
+
+        if chunk and chunk_length + separator_length + order_length > budget_length:
+            chunk_list.append(chunk)
+            chunk = []
+            chunk_length = brackets_length
+
+        if chunk:
+            chunk_length += separator_length
+
+        chunk.append(order)
+        chunk_length += order_length
+
+    if chunk:
+        chunk_list.append(chunk)
+
+    return chunk_list
+
+
+def merge_response_create_order_list(
+    response_list: list[ResponseCreateOrderList],
+) -> ResponseCreateOrderList:
+    """Merge the responses of consecutive chunks, keeping the orders order."""
+
+    code = next((r.code for r in response_list if r.code != 0), 0)
+    msg_list = [r.msg for r in response_list if r.msg]
+    order_list = [order for r in response_list for order in r.data.orders]
+
+    return ResponseCreateOrderList(
+        code=code,
+        msg="; ".join(dict.fromkeys(msg_list)),
+        data=DataCreateOrderList(orders=order_list),
+    )
+
+
+def merge_chunk_result_list(
+    chunk_query_list: list[QueryCreateOrderList],
+    result_list: list[ResponseCreateOrderList | BaseException],
+) -> ResponseCreateOrderList:
+    """Merge the result of each chunk, a response or the error it raised.
+
+    Raises `CreateOrderListError`, carrying the orders of the chunks that
+    succeeded, when any chunk failed.
+    """
+
+    response_list = []
+    failed_chunk_list = []
+
+    for chunk_query, result in zip(chunk_query_list, result_list):
+        if isinstance(result, BaseException):
+            failed_chunk_list.append((chunk_query, result))
+        else:
+            response_list.append(result)
+
+    response = merge_response_create_order_list(response_list=response_list)
+
+    if failed_chunk_list:
+        raise CreateOrderListError(
+            response=response,
+            failed_chunk_list=failed_chunk_list,
+        )
+
+    return response
+
+
 def request_create_order_list(
     query: QueryCreateOrderList,
     session: Session | None = None,
 ) -> Response:
     """
     BEWARE :
-    - (BAD) GET LIMIT of 4000 characters: send by batch of 15 max.
+    - (BAD) GET LIMIT of 4000 characters: see `build_batch_order_chunk_list`.
     - (GOOD) Accepts multiple symbol at the time.
     - (GOOD) If one failed the order are still created: but data are still sent in `data` field.
     - (GOOD) It truncate automatically the price and quantity when incorrect.
     """
 
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_TRADE_BATCH_ORDERS
 
@@ -121,11 +259,7 @@ def request_create_order_list(
     return response
 
 
-def query_create_order_list(query: QueryCreateOrderList) -> ResponseCreateOrderList:
-    """Beware : GET requests with more than 4000 characters are rejected by the API.
-    So it is better not send more than 15 order at the time.
-    """
-
+def query_create_order_chunk(query: QueryCreateOrderList) -> ResponseCreateOrderList:
     response = request_create_order_list(query=query)
     response.raise_for_status()
     endpoint_response = ResponseCreateOrderList.model_validate_json(response.text)
@@ -133,6 +267,59 @@ def query_create_order_list(query: QueryCreateOrderList) -> ResponseCreateOrderL
     return endpoint_response
 
 
+def query_create_order_list(
+    query: QueryCreateOrderList,
+    max_url_length: int = MAX_URL_LENGTH,
+    max_workers: int = 8,
+) -> ResponseCreateOrderList:
+    """Accepts any number of orders.
+
+    GET requests with more than 4000 characters are rejected by the API, so
+    the orders are split by `build_batch_order_chunk_list` and the chunks
+    are sent concurrently over the shared connection pool, all signed by
+    the signer of the caller (`use_signer`).
+    The orders of the result are in the same order as `query.batch_orders`.
+    A failed chunk doesn't hide the others: see `CreateOrderListError`.
+    """
+
+    chunk_list = build_batch_order_chunk_list(
+        query=query,
+        max_url_length=max_url_length,
+    )
+
+    if len(chunk_list) <= 1:
+        return query_create_order_chunk(query=query)
+
+    chunk_query_list = [
+        query.model_copy(update={"batch_orders": chunk}) for chunk in chunk_list
+    ]
+    # Worker threads do not inherit the `use_signer` context of the caller.
+    signer = get_signer()
+
+    def send_chunk(chunk_query: QueryCreateOrderList) -> ResponseCreateOrderList:
+        with use_signer(signer):
+            return query_create_order_chunk(query=chunk_query)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(chunk_query_list)),
+        thread_name_prefix="create_order_list",
+    ) as executor:
+        future_list = [
+            executor.submit(send_chunk, chunk_query) for chunk_query in chunk_query_list
+        ]
+
+    result_list: list[ResponseCreateOrderList | BaseException] = []
+
+    for future in future_list:
+        error = future.exception()
+        result_list.append(future.result() if error is None else error)
+
+    return merge_chunk_result_list(
+        chunk_query_list=chunk_query_list,
+        result_list=result_list,
+    )
+
+
 if __name__ == "__main__":
     result = query_create_order_list(
         query=QueryCreateOrderList(
@@ -5,7 +5,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.future.rest.url import (
@@ -109,7 +109,7 @@ def request_delete_all_open_order(
     query: QueryDeleteOrder,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_TRADE_ALL_OPEN_ORDERS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
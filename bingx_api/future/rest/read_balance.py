@@ -0,0 +1,105 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.alias_generators import to_camel
+from requests import Request, Response, Session
+
+from robot_one.api.bingx.future.rest.core import (
+    get_session,
+    get_signed_request,
+)
+from robot_one.api.bingx.future.rest.url import SWAP_V2_USER_BALANCE
+
+
+class Balance(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        extra="allow",
+    )
+
+    asset: str
+    balance: float
+    equity: float
+    unrealized_profit: float
+    realised_profit: float
+    available_margin: float
+    used_margin: float
+    freezed_margin: float
+
+
+class Data(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    balance: Balance
+
+
+class EndpointResponse(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    code: float
+    msg: str
+    data: Data
+
+    @model_validator(mode="before")  # type: ignore
+    @classmethod
+    def validate_code(cls, data: Any) -> Any:
+        if data.get("code") != 0:
+            raise ValueError(
+                "code: " + str(data.get("code")) + "; msg: " + data.get("msg")
+            )
+
+        return data
+
+
+class QueryBalance(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    recvWindow: int = Field(default=0)
+
+
+def request_balance(
+    query: QueryBalance | None = None,
+    session: Session | None = None,
+) -> Response:
+    query = query or QueryBalance()
+    session = session or get_session()
+
+    url = SWAP_V2_USER_BALANCE
+    params_map = query.model_dump(by_alias=True, exclude_none=True)
+
+    session_request = Request(
+        method="GET",
+        params=params_map,
+        url=url,
+    )
+    prepped = session.prepare_request(request=session_request)
+    prepped = get_signed_request(prepared_request=prepped)
+
+    response = session.send(request=prepped)
+    response.raise_for_status()
+
+    return response
+
+
+def query_balance(query: QueryBalance | None = None) -> Balance:
+    response = request_balance(query=query)
+    response.raise_for_status()
+    endpoint_response = EndpointResponse.model_validate_json(response.text)
+
+    return endpoint_response.data.balance
+
+
+if __name__ == "__main__":
+    balance = query_balance()
+
+    print("result:", balance)
@@ -7,7 +7,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.future.rest.url import SWAP_V2_QUOTE_CONTRACTS
@@ -69,7 +69,7 @@ def request_contract_list(
     session: Session | None = None,
 ) -> Response:
     query = query or QueryContractList()
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_QUOTE_CONTRACTS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
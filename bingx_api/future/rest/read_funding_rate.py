@@ -5,7 +5,8 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
+    LOGGER,
 )
 from robot_one.api.bingx.future.rest.url import (
     SWAP_V2_QUOTE_PREMIUM_INDEX,
@@ -86,7 +87,7 @@ def request_current_funding_rate(
     query: QueryPreniumIndex,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_QUOTE_PREMIUM_INDEX
 
@@ -99,7 +100,7 @@ def request_current_funding_rate(
     )
     prepped = session.prepare_request(request=session_request)
 
-    print(prepped.url)
+    LOGGER.debug("<BINGX:REST>:%s:%s", prepped.method, prepped.url)
 
     response = session.send(request=prepped)
     response.raise_for_status()
@@ -119,7 +120,7 @@ def request_funding_rate_history(
     query: QueryFundingRate,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_QUOTE_FUNDING_RATE
 
@@ -1,24 +1,37 @@
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator, Literal, overload, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
+    LOGGER,
 )
 from robot_one.api.bingx.future.rest.url import (
     SWAP_V3_QUOTE_KLINES,
 )
+from robot_one.api.bingx.kline.backfill import backfill_kline
+from robot_one.api.bingx.kline.model import (
+    decode_future_kline_columns,
+    KlineColumns,
+    to_polars,
+)
+
+if TYPE_CHECKING:
+    import polars as pl
 
 __all__ = [
     "get_specific_unix_timestamp_ms",
     "get_unix_timestamp_ms",
     "Interval",
+    "KlineFormat",
     "OHLCV",
     "query_kline",
+    "query_kline_backfill",
     "QueryKLine",
     "request_kline",
     "ResponseKline",
@@ -35,6 +48,9 @@ def get_specific_unix_timestamp_ms(specific_time: datetime | None = None) -> int
     return int(specific_time.now().timestamp() * 1000)
 
 
+KlineFormat = Literal["model", "numpy", "polars"]
+
+
 class Interval(str, Enum):
     MINUTES_1 = "1m"
     MINUTES_3 = "3m"
@@ -119,7 +135,7 @@ def request_kline(
     query: QueryKLine,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V3_QUOTE_KLINES
 
@@ -132,7 +148,7 @@ def request_kline(
     )
     prepped = session.prepare_request(request=session_request)
 
-    print(prepped.url)
+    LOGGER.debug("<BINGX:REST>:%s:%s", prepped.method, prepped.url)
 
     response = session.send(request=prepped)
     response.raise_for_status()
@@ -140,14 +156,86 @@ def request_kline(
     return response
 
 
-def query_kline(query: QueryKLine) -> list[OHLCV]:
+@overload
+def query_kline(
+    query: QueryKLine,
+    as_: Literal["model"] = "model",
+) -> list[OHLCV]: ...
+
+
+@overload
+def query_kline(query: QueryKLine, as_: Literal["numpy"]) -> KlineColumns: ...
+
+
+@overload
+def query_kline(query: QueryKLine, as_: Literal["polars"]) -> "pl.DataFrame": ...
+
+
+def query_kline(
+    query: QueryKLine,
+    as_: KlineFormat = "model",
+) -> "list[OHLCV] | KlineColumns | pl.DataFrame":
+    """Candles as `OHLCV` models, or as columns with `as_="numpy" | "polars"`.
+
+    The columnar formats decode the body straight into float64/int64 arrays
+    (open, high, low, close, volume, time) without building one model per row.
+    """
+
     response = request_kline(query=query)
     response.raise_for_status()
+
+    if as_ == "numpy":
+        return decode_future_kline_columns(content=response.content)
+    if as_ == "polars":
+        return to_polars(
+            kline_columns=decode_future_kline_columns(content=response.content)
+        )
+
     endpoint_response = ResponseKline.model_validate_json(response.text)
 
     return endpoint_response.data
 
 
+def query_kline_backfill(
+    symbol: str,
+    interval: Interval,
+    start_time: int,
+    end_time: int | None = None,
+    checkpoint_path: Path | None = None,
+    limit: int = 1000,
+    max_workers: int = 4,
+    rate_per_s: float = 10,
+) -> Iterator[OHLCV]:
+    """Stream [start_time, end_time] by `time`, fetching windows concurrently.
+
+    Without `end_time`, a backfill resumed from `checkpoint_path` keeps the
+    `end_time` it started with, a new one stops at now.
+    """
+
+    def fetch(window_start: int, window_end: int) -> list[OHLCV]:
+        return query_kline(
+            query=QueryKLine(
+                end_time=window_end,
+                interval=interval,
+                limit=limit,
+                start_time=window_start,
+                symbol=symbol,
+            ),
+        )
+
+    return backfill_kline(
+        fetch=fetch,
+        start_time=start_time,
+        end_time=end_time,
+        interval=interval.to_timedelta(),
+        checkpoint_key=f"future:{symbol}:{interval.value}",
+        checkpoint_path=checkpoint_path,
+        limit=limit,
+        max_workers=max_workers,
+        rate_per_s=rate_per_s,
+    )
+
+
 if __name__ == "__main__":
     result = query_kline(
         query=QueryKLine(
@@ -5,7 +5,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.future.rest.url import SWAP_V1_TICKER_PRICE
@@ -57,7 +57,7 @@ def request_last_price(
     query: QueryLastPrice,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V1_TICKER_PRICE
 
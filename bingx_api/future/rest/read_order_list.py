@@ -1,6 +1,7 @@
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from time import sleep
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
 from pydantic import (
     BaseModel,
@@ -12,8 +13,10 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
+    get_signer,
+    use_signer,
 )
 from robot_one.api.bingx.future.rest.url import SWAP_V2_TRADE_ALL_ORDERS
 
@@ -21,9 +24,11 @@ from robot_one.api.bingx.future.rest.url import SWAP_V2_TRADE_ALL_ORDERS
 __all__ = [
     "Data",
     "EndpointResponse",
+    "iter_order_list_by_order_id",
     "OrderUpdate",
     "query_order_list_full_by_order_id",
     "query_order_list_full_by_start_time",
+    "query_order_list_by_time_window",
     "query_order_list",
     "QueryOrderList",
     "request_order_list",
@@ -176,7 +181,7 @@ def request_order_list(
     query: QueryOrderList,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_TRADE_ALL_ORDERS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -195,25 +200,27 @@ def request_order_list(
     return response
 
 
-def query_order_list(query: QueryOrderList) -> list[OrderUpdate]:
+def query_order_list(
+    query: QueryOrderList,
+    session: Session | None = None,
+) -> list[OrderUpdate]:
     """Query the user's historical orders (order status is canceled or filled)."""
 
-    response = request_order_list(query=query)
+    response = request_order_list(query=query, session=session)
     response.raise_for_status()
     endpoint_response = EndpointResponse.model_validate_json(response.text)
 
     return endpoint_response.data.orders
 
 
-def query_order_list_full_by_order_id(
+def iter_order_list_by_order_id(
     start_order_id: int,
     limit: int = 1000,
+    session: Session | None = None,
     sleep_s: float = 0,
     symbol: str | None = None,
-) -> list[OrderUpdate]:
-    """Starts after an `start_order_id` not included in the result."""
-
-    order_list_full = []
+) -> Iterator[list[OrderUpdate]]:
+    """Yield pages of orders after `start_order_id` (excluded), as they arrive."""
 
     while True:
         order_list = query_order_list(
@@ -222,8 +229,11 @@ def query_order_list_full_by_order_id(
                 limit=limit,
                 symbol=symbol,
             ),
+            session=session,
         )
-        order_list_full.extend(order_list)
+
+        if order_list:
+            yield order_list
 
         if order_list and len(order_list) == limit:
             order_id_list = [order.order_id for order in order_list]
@@ -234,11 +244,33 @@ def query_order_list_full_by_order_id(
         if sleep_s:
             sleep(sleep_s)
 
+
+def query_order_list_full_by_order_id(
+    start_order_id: int,
+    limit: int = 1000,
+    session: Session | None = None,
+    sleep_s: float = 0,
+    symbol: str | None = None,
+) -> list[OrderUpdate]:
+    """Starts after an `start_order_id` not included in the result."""
+
+    order_list_full = []
+
+    for order_list in iter_order_list_by_order_id(
+        start_order_id=start_order_id,
+        limit=limit,
+        session=session,
+        sleep_s=sleep_s,
+        symbol=symbol,
+    ):
+        order_list_full.extend(order_list)
+
     return order_list_full
 
 
 def query_order_list_full_by_start_time(
     start_time: int,
+    session: Session | None = None,
     sleep_s: float = 0,
     symbol: str | None = None,
 ) -> list[OrderUpdate]:
@@ -249,6 +281,7 @@ def query_order_list_full_by_start_time(
             start_time=start_time,
             symbol=symbol,
         ),
+        session=session,
     )
 
     order_list_full.extend(order_list)
@@ -259,6 +292,7 @@ def query_order_list_full_by_start_time(
         order_list = query_order_list_full_by_order_id(
             start_order_id=start_order_id,
             limit=1000,
+            session=session,
             sleep_s=sleep_s,
             symbol=symbol,
         )
@@ -268,6 +302,103 @@ def query_order_list_full_by_start_time(
     return order_list_full
 
 
+def query_order_list_by_time_window(
+    start_time: int,
+    end_time: int,
+    limit: int = 1000,
+    max_workers: int = 8,
+    session: Session | None = None,
+    symbol: str | None = None,
+    window: timedelta = timedelta(hours=12),
+) -> list[OrderUpdate]:
+    """Orders of [start_time, end_time], windows fetched concurrently.
+
+    A window returning a full page (`limit` orders) may hide older orders: it
+    is split in two halves fetched again, down to a single millisecond which
+    is paged by `order_id` instead. Orders are merged by `order_id`
+    (latest `update_time` wins) and returned sorted by `order_id`.
+    Without `session`, each worker thread uses the shared pooled transport.
+    Every window is signed by the signer of the caller (`use_signer`).
+    """
+
+    window_ms = int(window.total_seconds() * 1000)
+    order_map: dict[int, OrderUpdate] = {}
+    # Worker threads do not inherit the `use_signer` context of the caller.
+    signer = get_signer()
+
+    def fetch_page(
+        window_start: int,
+        window_end: int,
+        order_id: int | None = None,
+    ) -> list[OrderUpdate]:
+        return query_order_list(
+            query=QueryOrderList(
+                end_time=window_end,
+                limit=limit,
+                order_id=order_id,
+                start_time=window_start,
+                symbol=symbol,
+            ),
+            session=session,
+        )
+
+    def fetch(window_start: int, window_end: int) -> list[OrderUpdate]:
+        with use_signer(signer):
+            order_list = fetch_page(window_start, window_end)
+
+            if len(order_list) < limit or window_end > window_start:
+                return order_list
+
+            # A millisecond can't be split: page through it after the last id.
+            page = order_list
+            while len(page) >= limit:
+                order_id = max(order.order_id for order in page)
+                page = fetch_page(window_start, window_end, order_id=order_id)
+
+                if page and max(order.order_id for order in page) <= order_id:
+                    raise ValueError(
+                        f"Orders of {window_start} can't be paged past {order_id}."
+                    )
+
+                order_list.extend(page)
+
+            return order_list
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="order_list",
+    ) as executor:
+        pending: dict[Future[list[OrderUpdate]], tuple[int, int]] = {}
+
+        for window_start in range(start_time, end_time + 1, window_ms):
+            window_end = min(window_start + window_ms - 1, end_time)
+            future = executor.submit(fetch, window_start, window_end)
+            pending[future] = (window_start, window_end)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                window_start, window_end = pending.pop(future)
+                order_list = future.result()
+
+                if len(order_list) >= limit and window_end > window_start:
+                    middle = (window_start + window_end) // 2
+                    for half in [(window_start, middle), (middle + 1, window_end)]:
+                        pending[executor.submit(fetch, *half)] = half
+                    continue
+
+                for order in order_list:
+                    known_order = order_map.get(order.order_id)
+                    if (
+                        known_order is None
+                        or known_order.update_time < order.update_time
+                    ):
+                        order_map[order.order_id] = order
+
+    return [order_map[order_id] for order_id in sorted(order_map)]
+
+
 if __name__ == "__main__":
     from datetime import datetime, timedelta
 
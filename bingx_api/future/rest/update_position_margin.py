@@ -6,7 +6,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.future.rest.url import SWAP_V2_TRADE_POSITION_MARGIN
@@ -61,7 +61,7 @@ def request_update_position_margin(
     query: QueryUpdatePositionMargin,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_V2_TRADE_POSITION_MARGIN
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -1,28 +1,19 @@
-SWAP_V1_TICKER_PRICE = "https://open-api.bingx.com/openApi/swap/v1/ticker/price"
-SWAP_V1_TRADE_FULL_ORDER = "https://open-api.bingx.com/openApi/swap/v1/trade/fullOrder"
-SWAP_V2_TRADE_ALL_ORDERS = "https://open-api.bingx.com/openApi/swap/v2/trade/allOrders"
-SWAP_V2_TRADE_ALL_OPEN_ORDERS = (
-    "https://open-api.bingx.com/openApi/swap/v2/trade/allOpenOrders"
-)
-SWAP_V2_TRADE_BATCH_ORDERS = (
-    "https://open-api.bingx.com/openApi/swap/v2/trade/batchOrders"
-)
-SWAP_V2_TRADE_LEVERAGE = "https://open-api.bingx.com/openApi/swap/v2/trade/leverage"
+BASE_URL = "https://open-api.bingx.com"
 
-SWAP_V2_TRADE_OPEN_ORDERS = (
-    "https://open-api.bingx.com/openApi/swap/v2/trade/openOrders"
-)
-SWAP_V2_TRADE_ORDER = "https://open-api.bingx.com/openApi/swap/v2/trade/order"
-SWAP_V2_TRADE_POSITION_MARGIN = "https://open-api.bingx.com/openApi/swap/v2/trade/positionMargin"
-SWAP_V2_QUOTE_CONTRACTS = "https://open-api.bingx.com/openApi/swap/v2/quote/contracts"
-SWAP_V2_QUOTE_FUNDING_RATE = (
-    "https://open-api.bingx.com/openApi/swap/v2/quote/fundingRate"
-)
-SWAP_V2_QUOTE_PREMIUM_INDEX = (
-    "https://open-api.bingx.com/openApi/swap/v2/quote/premiumIndex"
-)
-SWAP_V2_USER_COMMISSION_RATE = (
-    "https://open-api.bingx.com/openApi/swap/v2/user/commissionRate"
-)
-SWAP_V2_USER_POSITIONS = "https://open-api.bingx.com/openApi/swap/v2/user/positions"
-SWAP_V3_QUOTE_KLINES = "https://open-api.bingx.com/openApi/swap/v3/quote/klines"
+SWAP_V1_TICKER_PRICE = f"{BASE_URL}/openApi/swap/v1/ticker/price"
+SWAP_V1_TRADE_FULL_ORDER = f"{BASE_URL}/openApi/swap/v1/trade/fullOrder"
+SWAP_V2_TRADE_ALL_ORDERS = f"{BASE_URL}/openApi/swap/v2/trade/allOrders"
+SWAP_V2_TRADE_ALL_OPEN_ORDERS = f"{BASE_URL}/openApi/swap/v2/trade/allOpenOrders"
+SWAP_V2_TRADE_BATCH_ORDERS = f"{BASE_URL}/openApi/swap/v2/trade/batchOrders"
+SWAP_V2_TRADE_LEVERAGE = f"{BASE_URL}/openApi/swap/v2/trade/leverage"
+
+SWAP_V2_TRADE_OPEN_ORDERS = f"{BASE_URL}/openApi/swap/v2/trade/openOrders"
+SWAP_V2_TRADE_ORDER = f"{BASE_URL}/openApi/swap/v2/trade/order"
+SWAP_V2_TRADE_POSITION_MARGIN = f"{BASE_URL}/openApi/swap/v2/trade/positionMargin"
+SWAP_V2_QUOTE_CONTRACTS = f"{BASE_URL}/openApi/swap/v2/quote/contracts"
+SWAP_V2_QUOTE_FUNDING_RATE = f"{BASE_URL}/openApi/swap/v2/quote/fundingRate"
+SWAP_V2_QUOTE_PREMIUM_INDEX = f"{BASE_URL}/openApi/swap/v2/quote/premiumIndex"
+SWAP_V2_USER_BALANCE = f"{BASE_URL}/openApi/swap/v2/user/balance"
+SWAP_V2_USER_COMMISSION_RATE = f"{BASE_URL}/openApi/swap/v2/user/commissionRate"
+SWAP_V2_USER_POSITIONS = f"{BASE_URL}/openApi/swap/v2/user/positions"
+SWAP_V3_QUOTE_KLINES = f"{BASE_URL}/openApi/swap/v3/quote/klines"
@@ -0,0 +1,594 @@
+from collections import OrderedDict
+from logging import getLogger, Logger
+from threading import Lock
+from typing import Any, Callable, NamedTuple
+
+from robot_one.api.bingx.future.rest.read_balance import Balance, query_balance
+from robot_one.api.bingx.future.rest.read_leverage import (
+    Leverage,
+    query_leverage,
+    QueryLeverage,
+)
+from robot_one.api.bingx.future.rest.read_open_order_list import (
+    OrderUpdate,
+    query_open_order_list,
+    QueryOpenOrderList,
+)
+from robot_one.api.bingx.future.rest.read_position_list import (
+    Position,
+    query_position_list,
+)
+from robot_one.api.bingx.future.ws.model.fast_decode import ResponseDataRecord
+from robot_one.api.bingx.future.ws.model.reconnect_policy import GapMarker
+from robot_one.api.bingx.future.ws.stream_account import (
+    EventType,
+    ResponseData,
+    StreamerAccount,
+)
+
+__all__ = (
+    "AccountSnapshot",
+    "AccountState",
+    "AccountStateStats",
+    "BalanceState",
+    "fetch_account_snapshot",
+    "LeverageState",
+    "OrderState",
+    "PositionState",
+)
+
+CLOSED_STATUS_SET = frozenset({"CANCELED", "CANCELLED", "EXPIRED", "FAILED", "FILLED"})
+
+PositionKey = tuple[str, str]
+
+
+class OrderState(NamedTuple):
+    order_id: int
+    client_order_id: str
+    symbol: str
+    side: str
+    position_side: str
+    type: str
+    status: str
+    price: float
+    quantity: float
+    filled_quantity: float
+    average_price: float
+    update_ms: int
+
+
+class PositionState(NamedTuple):
+    symbol: str
+    position_side: str
+    amount: float
+    entry_price: float
+    unrealized_profit: float
+    isolated: bool
+    margin: float
+    update_ms: int
+
+
+class BalanceState(NamedTuple):
+    asset: str
+    wallet_balance: float
+    cross_wallet_balance: float
+    update_ms: int
+
+
+class LeverageState(NamedTuple):
+    symbol: str
+    long_leverage: int
+    short_leverage: int
+    margin_mode: str
+    update_ms: int
+
+
+class AccountSnapshot(NamedTuple):
+    order_list: list[OrderState]
+    position_list: list[PositionState]
+    balance_list: list[BalanceState]
+    leverage_list: list[LeverageState]
+
+
+class AccountStateStats(NamedTuple):
+    applied_count: int
+    stale_count: int
+    out_of_order_count: int
+    unknown_order_count: int
+    gap_count: int
+    resync_count: int
+
+
+def order_from_rest(order: OrderUpdate) -> OrderState:
+    return OrderState(
+        order_id=order.order_id,
+        client_order_id=order.client_order_id,
+        symbol=order.symbol,
+        side=order.side,
+        position_side=order.position_side,
+        type=order.type,
+        status=order.status,
+        price=order.price,
+        quantity=order.orig_qty,
+        filled_quantity=order.executed_qty,
+        average_price=order.avg_price,
+        update_ms=0,
+    )
+
+
+def position_from_rest(position: Position) -> PositionState:
+    return PositionState(
+        symbol=position.symbol,
+        position_side=position.position_side,
+        amount=position.position_amt,
+        entry_price=position.avg_price,
+        unrealized_profit=position.unrealized_profit,
+        isolated=position.isolated,
+        margin=position.initial_margin,
+        update_ms=0,
+    )
+
+
+def balance_from_rest(balance: Balance) -> BalanceState:
+    # REST has no cross wallet balance, the wallet balance stands for it
+    # until the first ACCOUNT_UPDATE.
+    return BalanceState(
+        asset=balance.asset,
+        wallet_balance=balance.balance,
+        cross_wallet_balance=balance.balance,
+        update_ms=0,
+    )
+
+
+def leverage_from_rest(
+    symbol: str,
+    leverage: Leverage,
+    margin_mode: str = "",
+) -> LeverageState:
+    return LeverageState(
+        symbol=symbol,
+        long_leverage=leverage.long_leverage,
+        short_leverage=leverage.short_leverage,
+        margin_mode=margin_mode,
+        update_ms=0,
+    )
+
+
+def fetch_account_snapshot() -> AccountSnapshot:
+    """The whole account read from REST, to seed an `AccountState`.
+
+    Leverages are read for the symbols with a position or an open order
+    only, one request each.
+    """
+
+    order_list = query_open_order_list(query=QueryOpenOrderList())
+    position_list = query_position_list()
+
+    margin_mode_map = {
+        position.symbol: "isolated" if position.isolated else "cross"
+        for position in position_list
+    }
+    symbol_set = {order.symbol for order in order_list} | set(margin_mode_map)
+
+    return AccountSnapshot(
+        order_list=[order_from_rest(order=order) for order in order_list],
+        position_list=[
+            position_from_rest(position=position) for position in position_list
+        ],
+        balance_list=[balance_from_rest(balance=query_balance())],
+        leverage_list=[
+            leverage_from_rest(
+                symbol=symbol,
+                leverage=query_leverage(query=QueryLeverage(symbol=symbol)),
+                margin_mode=margin_mode_map.get(symbol, ""),
+            )
+            for symbol in sorted(symbol_set)
+        ],
+    )
+
+
+class AccountState:
+    """Open orders, positions, balances and leverages of the futures account.
+
+    Seeded once from REST (`resync`), then kept current by the events of a
+    `StreamerAccount`, models or `fast_decode` records alike: lookups are
+    dict reads, no lock and no REST call.
+
+    BingX account events carry no sequence number, the event time `E`
+    orders them instead. An event older than the last update of its order,
+    position or balance is stale and dropped, one older than the previous
+    event is counted as out of order. Snapshot entries are stamped with the
+    newest `E` seen before the REST requests: any later event wins over
+    them. An update of an order never seen as `NEW` means an event was
+    missed, it is counted and applied.
+
+    A `GapMarker` (`ProducerAccount(gap_marker=True)`) means events were
+    lost while reconnecting: the state is `stale` until the next `resync`,
+    run at once when a `snapshot_source` is set.
+    """
+
+    def __init__(
+        self,
+        closed_order_capacity: int = 10_000,
+        logger: Logger | None = None,
+        snapshot_source: Callable[[], AccountSnapshot] | None = (
+            fetch_account_snapshot
+        ),
+    ) -> None:
+        """
+        Args:
+            closed_order_capacity (int):
+                Closed orders remembered to drop their late, stale updates
+                instead of reopening them.
+            snapshot_source (Callable[[], AccountSnapshot], optional):
+                REST snapshot read by `resync`, `None` to only rely on the
+                stream and `seed`.
+        """
+
+        self._closed_order_capacity = closed_order_capacity
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._snapshot_source = snapshot_source
+
+        self._lock = Lock()
+        self._balance_map: dict[str, BalanceState] = {}
+        self._client_order_map: dict[str, int] = {}
+        self._closed_order_map: OrderedDict[int, int] = OrderedDict()
+        self._closed_position_map: dict[PositionKey, int] = {}
+        self._leverage_map: dict[str, LeverageState] = {}
+        self._order_map: dict[int, OrderState] = {}
+        self._position_map: dict[PositionKey, PositionState] = {}
+
+        self._last_event_ms = 0
+        self._stale = True
+
+        self._applied_count = 0
+        self._gap_count = 0
+        self._out_of_order_count = 0
+        self._resync_count = 0
+        self._stale_count = 0
+        self._unknown_order_count = 0
+
+    @property
+    def balance_list(self) -> list[BalanceState]:
+        with self._lock:
+            return list(self._balance_map.values())
+
+    @property
+    def last_event_ms(self) -> int:
+        return self._last_event_ms
+
+    @property
+    def order_list(self) -> list[OrderState]:
+        with self._lock:
+            return list(self._order_map.values())
+
+    @property
+    def position_list(self) -> list[PositionState]:
+        with self._lock:
+            return list(self._position_map.values())
+
+    @property
+    def stale(self) -> bool:
+        """`True` until the first `seed` and after a gap, until `resync`."""
+
+        return self._stale
+
+    @property
+    def stats(self) -> AccountStateStats:
+        return AccountStateStats(
+            applied_count=self._applied_count,
+            stale_count=self._stale_count,
+            out_of_order_count=self._out_of_order_count,
+            unknown_order_count=self._unknown_order_count,
+            gap_count=self._gap_count,
+            resync_count=self._resync_count,
+        )
+
+    def get_balance(self, asset: str) -> BalanceState | None:
+        return self._balance_map.get(asset)
+
+    def get_leverage(self, symbol: str) -> LeverageState | None:
+        return self._leverage_map.get(symbol)
+
+    def get_order(self, order_id: int) -> OrderState | None:
+        return self._order_map.get(order_id)
+
+    def get_order_by_client_id(self, client_order_id: str) -> OrderState | None:
+        order_id = self._client_order_map.get(client_order_id)
+
+        return None if order_id is None else self._order_map.get(order_id)
+
+    def get_position(self, symbol: str, position_side: str) -> PositionState | None:
+        return self._position_map.get((symbol, position_side))
+
+    def seed(self, snapshot: AccountSnapshot, update_ms: int) -> None:
+        """Replace the whole state with `snapshot`, taken after `update_ms`.
+
+        Entries updated by an event newer than `update_ms` are kept, older
+        ones missing from the snapshot are closed. Snapshot entries the
+        stream closed at or after `update_ms` stay closed: the REST view may
+        predate the closing event, no later event would close them again.
+        Balances and leverages missing from the snapshot, which reads only
+        some of them, are kept.
+        """
+
+        with self._lock:
+            closed_order_map = self._closed_order_map
+            closed_position_map = self._closed_position_map
+
+            order_map = {
+                order.order_id: order._replace(update_ms=update_ms)
+                for order in snapshot.order_list
+                if closed_order_map.get(order.order_id, -1) < update_ms
+            }
+            for order_id, order in self._order_map.items():
+                if order.update_ms > update_ms:
+                    order_map[order_id] = order
+
+            position_map = {
+                (p.symbol, p.position_side): p._replace(update_ms=update_ms)
+                for p in snapshot.position_list
+                if p.amount
+                and closed_position_map.get((p.symbol, p.position_side), -1) < update_ms
+            }
+            for key, position in self._position_map.items():
+                if position.update_ms > update_ms:
+                    position_map[key] = position
+
+            balance_map = {
+                balance.asset: balance._replace(update_ms=update_ms)
+                for balance in snapshot.balance_list
+            }
+            for asset, balance in self._balance_map.items():
+                if balance.update_ms > update_ms or asset not in balance_map:
+                    balance_map[asset] = balance
+
+            leverage_map = {
+                leverage.symbol: leverage._replace(update_ms=update_ms)
+                for leverage in snapshot.leverage_list
+            }
+            for symbol, leverage in self._leverage_map.items():
+                if leverage.update_ms > update_ms or symbol not in leverage_map:
+                    leverage_map[symbol] = leverage
+
+            self._order_map = order_map
+            self._client_order_map = {
+                order.client_order_id: order_id
+                for order_id, order in order_map.items()
+                if order.client_order_id
+            }
+            self._position_map = position_map
+            self._balance_map = balance_map
+            self._leverage_map = leverage_map
+            self._stale = False
+
+        self._logger.debug(
+            "<BINGX:ACCOUNT_STATE>:SEEDED:ORDERS:%s:POSITIONS:%s:BALANCES:%s",
+            len(order_map),
+            len(position_map),
+            len(balance_map),
+        )
+
+    def resync(self) -> None:
+        """Seed from `snapshot_source`, stamped with the newest event time seen."""
+
+        snapshot_source = self._snapshot_source
+
+        if snapshot_source is None:
+            raise ValueError("AccountState without snapshot_source")
+
+        update_ms = self._last_event_ms
+
+        self.seed(snapshot=snapshot_source(), update_ms=update_ms)
+        self._resync_count += 1
+
+    def apply(self, response: ResponseData | ResponseDataRecord | GapMarker) -> bool:
+        """Update the state with one item of `StreamerAccount`.
+
+        Returns `False` when the event is stale or not an account event.
+        """
+
+        if response.__class__ is GapMarker:
+            self._gap_count += 1
+            self._stale = True
+            self._logger.warning("<BINGX:ACCOUNT_STATE>:GAP:%s", response)
+
+            if self._snapshot_source is not None:
+                self.resync()
+
+            return False
+
+        # Either a pydantic update or a `*Record` tuple, both read by name.
+        data: Any = response.data  # type: ignore[union-attr]
+        e = data.e
+        event_ms = data.E
+
+        if event_ms is None:
+            event_ms = self._last_event_ms
+        elif event_ms < self._last_event_ms:
+            self._out_of_order_count += 1
+        else:
+            self._last_event_ms = event_ms
+
+        with self._lock:
+            if e == EventType.ORDER_TRADE_UPDATE:
+                applied = self._apply_order(o=data.o, event_ms=event_ms)
+            elif e == EventType.ACCOUNT_UPDATE:
+                applied = self._apply_account(a=data.a, event_ms=event_ms)
+            elif e == EventType.ACCOUNT_CONFIG_UPDATE:
+                applied = self._apply_config(
+                    ac=getattr(data, "ac", None),
+                    event_ms=event_ms,
+                )
+            else:
+                applied = False
+
+        if applied:
+            self._applied_count += 1
+        else:
+            self._stale_count += 1
+
+        return applied
+
+    def _apply_order(self, o: Any, event_ms: int) -> bool:
+        order_id = o.i
+        order_map = self._order_map
+        current = order_map.get(order_id)
+
+        if current is None:
+            closed_ms = self._closed_order_map.get(order_id)
+
+            if closed_ms is not None and event_ms <= closed_ms:
+                return False
+
+            if o.X != "NEW":
+                self._unknown_order_count += 1
+                self._logger.warning(
+                    "<BINGX:ACCOUNT_STATE>:UNKNOWN_ORDER:%s:%s", order_id, o.X
+                )
+        elif event_ms < current.update_ms:
+            return False
+
+        if o.X in CLOSED_STATUS_SET:
+            order_map.pop(order_id, None)
+            self._client_order_map.pop(o.c, None)
+
+            closed_order_map = self._closed_order_map
+            closed_order_map[order_id] = event_ms
+            if len(closed_order_map) > self._closed_order_capacity:
+                closed_order_map.popitem(last=False)
+
+            return True
+
+        order_map[order_id] = OrderState(
+            order_id=order_id,
+            client_order_id=o.c,
+            symbol=o.s,
+            side=o.S,
+            position_side=o.ps,
+            type=o.o,
+            status=o.X,
+            price=o.p,
+            quantity=o.q,
+            filled_quantity=o.z or 0.0,
+            average_price=o.ap or 0.0,
+            update_ms=event_ms,
+        )
+
+        if o.c:
+            self._client_order_map[o.c] = order_id
+
+        return True
+
+    def _apply_account(self, a: Any, event_ms: int) -> bool:
+        if a is None:
+            return False
+
+        applied = False
+        balance_map = self._balance_map
+        position_map = self._position_map
+
+        for balance in a.B or []:
+            asset = balance["a"]
+            current_balance = balance_map.get(asset)
+
+            if current_balance is not None and event_ms < current_balance.update_ms:
+                continue
+
+            balance_map[asset] = BalanceState(
+                asset=asset,
+                wallet_balance=float(balance.get("wb", 0)),
+                cross_wallet_balance=float(balance.get("cw", 0)),
+                update_ms=event_ms,
+            )
+            applied = True
+
+        for position in a.P or []:
+            key = (position["s"], position["ps"])
+            current_position = position_map.get(key)
+
+            if current_position is not None and event_ms < current_position.update_ms:
+                continue
+
+            closed_ms = self._closed_position_map.get(key)
+            if current_position is None and closed_ms is not None:
+                if event_ms < closed_ms:
+                    continue
+
+            amount = float(position.get("pa", 0))
+            applied = True
+
+            if not amount:
+                position_map.pop(key, None)
+                self._closed_position_map[key] = event_ms
+                continue
+
+            position_map[key] = PositionState(
+                symbol=key[0],
+                position_side=key[1],
+                amount=amount,
+                entry_price=float(position.get("ep", 0)),
+                unrealized_profit=float(position.get("up", 0)),
+                isolated=position.get("mt") == "isolated",
+                margin=float(position.get("iw", 0)),
+                update_ms=event_ms,
+            )
+
+        return applied
+
+    def _apply_config(self, ac: dict | None, event_ms: int) -> bool:
+        if not ac:
+            return False
+
+        symbol = ac["s"]
+        current = self._leverage_map.get(symbol)
+
+        if current is not None and event_ms < current.update_ms:
+            return False
+
+        self._leverage_map[symbol] = LeverageState(
+            symbol=symbol,
+            long_leverage=int(ac.get("l", 0)),
+            short_leverage=int(ac.get("S", 0)),
+            margin_mode=ac.get("mt", ""),
+            update_ms=event_ms,
+        )
+
+        return True
+
+    def follow(self, streamer: StreamerAccount, timeout: float | None = 1.0) -> None:
+        """Start `streamer`, `resync`, then apply its events until it stops.
+
+        Blocking: run it on a thread and read the state from others.
+        `timeout` bounds how long a stop goes unnoticed.
+        """
+
+        with streamer:
+            if self._snapshot_source is not None:
+                self.resync()
+
+            for response_list in streamer.iter_batch(timeout=timeout):
+                for response in response_list:
+                    self.apply(response=response)
+
+
+if __name__ == "__main__":
+    import logging
+    from threading import Thread
+    from time import sleep
+
+    from robot_one.api.bingx.future.ws.stream_account import ProducerAccount
+
+    logging.basicConfig(level=logging.INFO)
+
+    account_state = AccountState()
+    streamer = StreamerAccount(producer=ProducerAccount(daemon=True, gap_marker=True))
+
+    Thread(target=account_state.follow, args=(streamer,), daemon=True).start()
+
+    try:
+        while True:
+            sleep(5)
+            print(account_state.position_list, account_state.order_list)
+    except KeyboardInterrupt:
+        streamer.stop()
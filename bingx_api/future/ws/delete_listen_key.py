@@ -2,7 +2,7 @@ from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 from requests import Response, Request, Session
 
-from robot_one.api.bingx.future.rest.core import build_session
+from robot_one.api.bingx.future.rest.core import get_session
 from robot_one.api.bingx.future.ws.url import SWAP_USER_AUTH_USER_DATA_STREAM
 
 
@@ -19,7 +19,7 @@ def request_delete_listen_key(
     query: QueryDeleteListenKey,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SWAP_USER_AUTH_USER_DATA_STREAM
 
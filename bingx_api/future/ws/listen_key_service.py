@@ -0,0 +1,152 @@
+import heapq
+from itertools import count
+from logging import getLogger, Logger
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Protocol
+
+__all__ = (
+    "get_listen_key_service",
+    "ListenKeyService",
+    "Refreshable",
+    "set_listen_key_service",
+)
+
+
+class Refreshable(Protocol):
+    def refresh_due(self) -> float | None:
+        """Refresh now, returns the delay before the next call, `None` to stop."""
+
+
+class ListenKeyService:
+    """One thread refreshing every listen key of the process.
+
+    Refreshes are kept in a heap ordered by due time, the thread waits on a
+    `Condition` until the earliest one, a new schedule or `stop()`, so it
+    never sleeps past a shutdown. Canceled entries are skipped when popped.
+    """
+
+    def __init__(self, logger: Logger | None = None) -> None:
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+
+        self._condition = Condition()
+        self._heap: list[tuple[float, int, Refreshable]] = []
+        self._schedule_map: dict[Refreshable, int] = {}
+        self._sequence_iterator = count()
+        self._stopped = False
+        self._thread: Thread | None = None
+
+    @property
+    def scheduled_count(self) -> int:
+        return len(self._schedule_map)
+
+    def schedule(self, refreshable: Refreshable, delay_s: float) -> None:
+        """Call `refreshable.refresh_due()` in `delay_s`, replaces a pending call."""
+
+        with self._condition:
+            sequence = next(self._sequence_iterator)
+            self._schedule_map[refreshable] = sequence
+            heapq.heappush(self._heap, (monotonic() + delay_s, sequence, refreshable))
+
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped = False
+                self._thread = Thread(
+                    target=self.run,
+                    daemon=True,
+                    name=self.__class__.__name__,
+                )
+                self._thread.start()
+
+            self._condition.notify()
+
+    def cancel(self, refreshable: Refreshable) -> None:
+        with self._condition:
+            self._schedule_map.pop(refreshable, None)
+            self._condition.notify()
+
+    def pop_due(self) -> Refreshable | None:
+        """Wait for the next due entry, `None` once stopped."""
+
+        condition = self._condition
+        heap = self._heap
+        schedule_map = self._schedule_map
+
+        with condition:
+            while not self._stopped:
+                if not heap:
+                    condition.wait()
+                    continue
+
+                due_s, sequence, refreshable = heap[0]
+
+                if schedule_map.get(refreshable) != sequence:
+                    heapq.heappop(heap)
+                    continue
+
+                wait_s = due_s - monotonic()
+                if wait_s > 0:
+                    condition.wait(timeout=wait_s)
+                    continue
+
+                heapq.heappop(heap)
+                del schedule_map[refreshable]
+
+                return refreshable
+
+        return None
+
+    def run(self) -> None:
+        logger = self._logger
+
+        while (refreshable := self.pop_due()) is not None:
+            try:
+                delay_s = refreshable.refresh_due()
+            except Exception as e:
+                logger.fatal("<BINGX:REST>::LISTEN_KEY_SERVICE:%s", e)
+                continue
+
+            if delay_s is not None:
+                with self._condition:
+                    if refreshable not in self._schedule_map:
+                        self.schedule(refreshable=refreshable, delay_s=delay_s)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Wake the thread up and wait for it, pending refreshes are dropped."""
+
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._schedule_map.clear()
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+
+LISTEN_KEY_SERVICE_LOCK = Lock()
+_listen_key_service: ListenKeyService | None = None
+
+
+def get_listen_key_service() -> ListenKeyService:
+    global _listen_key_service
+
+    with LISTEN_KEY_SERVICE_LOCK:
+        if _listen_key_service is None:
+            _listen_key_service = ListenKeyService()
+
+        return _listen_key_service
+
+
+def set_listen_key_service(
+    listen_key_service: ListenKeyService,
+) -> ListenKeyService | None:
+    """Replace the process-wide ListenKeyService, returns the previous one."""
+
+    global _listen_key_service
+
+    with LISTEN_KEY_SERVICE_LOCK:
+        previous_listen_key_service = _listen_key_service
+        _listen_key_service = listen_key_service
+
+    return previous_listen_key_service
@@ -0,0 +1,296 @@
+from collections import deque, OrderedDict
+from enum import Enum
+from queue import Empty, Full
+from threading import Condition, Lock
+from time import monotonic, perf_counter_ns
+from typing import Any, Callable, Generic, NamedTuple, TypeVar
+
+from robot_one.api.bingx.future.ws.model.latency_metrics import LatencyHistogram
+
+__all__ = (
+    "BoundedQueue",
+    "OverflowPolicy",
+    "QueueStats",
+)
+
+ItemType = TypeVar("ItemType")
+# Longest uninterrupted wait of a blocked `put`, between two `closed` checks.
+BLOCK_WAIT_S = 0.1
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+
+
+class QueueStats(NamedTuple):
+    depth: int
+    dropped_count: int
+    full_count: int
+    max_depth: int
+    put_count: int
+
+
+class BoundedQueue(Generic[ItemType]):
+    """`SimpleQueue` replacement with a capacity and an overflow policy.
+
+    Once `maxsize` items are pending (0 means unbounded), `put`:
+    - BLOCK: waits for room, the producer is slowed down to the consumer pace,
+      until `timeout` or `close`: `Full` is raised then,
+    - DROP_NEWEST: discards the new item,
+    - DROP_OLDEST: discards the oldest pending item,
+    - CONFLATE: replaces, in place, the pending item with the same
+      `conflate_key(item)`, always, not only when full. A new key arriving
+      on a full queue discards the oldest pending item.
+
+    `stats` counts dropped items, how many times the queue was full and the
+    highest depth reached, to size consumers from production metrics.
+    With a `wait_histogram`, items are stored with their enqueue time and
+    the wait of each dequeued item is recorded.
+    """
+
+    def __init__(
+        self,
+        conflate_key: Callable[[ItemType], Any] | None = None,
+        maxsize: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        wait_histogram: LatencyHistogram | None = None,
+    ) -> None:
+        if overflow_policy is OverflowPolicy.CONFLATE and conflate_key is None:
+            raise ValueError("OverflowPolicy.CONFLATE requires a `conflate_key`.")
+
+        self._conflate_key = conflate_key
+        self._conflating = overflow_policy is OverflowPolicy.CONFLATE
+        self._maxsize = maxsize
+        self._overflow_policy = overflow_policy
+        self._wait_histogram = wait_histogram
+
+        self._closed = False
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+        self._item_deque: deque[ItemType] = deque()
+        self._item_map: OrderedDict[Any, ItemType] = OrderedDict()
+
+        self._dropped_count = 0
+        self._full_count = 0
+        self._max_depth = 0
+        self._put_count = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self._overflow_policy
+
+    @property
+    def wait_histogram(self) -> LatencyHistogram | None:
+        return self._wait_histogram
+
+    @property
+    def stats(self) -> QueueStats:
+        with self._lock:
+            return QueueStats(
+                depth=self.qsize(),
+                dropped_count=self._dropped_count,
+                full_count=self._full_count,
+                max_depth=self._max_depth,
+                put_count=self._put_count,
+            )
+
+    def qsize(self) -> int:
+        return len(self._item_map) if self._conflating else len(self._item_deque)
+
+    def empty(self) -> bool:
+        return not self.qsize()
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self.qsize()
+
+    def close(self) -> None:
+        """Release the blocked `put`, they raise `Full`, and those to come.
+
+        Pending items can still be read.
+        """
+
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+
+    def _wait_not_full(self, timeout: float | None) -> bool:
+        """Wait for room, the lock held, in `BLOCK_WAIT_S` slices.
+
+        False once `timeout` expired or the queue is closed.
+        """
+
+        deadline_s = None if timeout is None else monotonic() + timeout
+
+        while self.full():
+            if self._closed:
+                return False
+
+            wait_s = BLOCK_WAIT_S
+            if deadline_s is not None:
+                wait_s = min(wait_s, deadline_s - monotonic())
+                if wait_s <= 0:
+                    return False
+
+            self._not_full.wait(timeout=wait_s)
+
+        return True
+
+    def put(
+        self,
+        item: ItemType,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        overflow_policy = self._overflow_policy
+
+        with self._lock:
+            self._put_count += 1
+
+            if self._conflating:
+                key = self._conflate_key(item)  # type: ignore
+                item_map = self._item_map
+
+                if self._wait_histogram is not None:
+                    item = (perf_counter_ns(), item)  # type: ignore
+
+                if key in item_map:
+                    item_map[key] = item
+                    self._dropped_count += 1
+                    return
+
+                if self.full():
+                    self._full_count += 1
+                    self._dropped_count += 1
+                    item_map.popitem(last=False)
+
+                item_map[key] = item
+            else:
+                if self.full():
+                    self._full_count += 1
+
+                    if overflow_policy is OverflowPolicy.DROP_NEWEST:
+                        self._dropped_count += 1
+                        return
+
+                    if overflow_policy is OverflowPolicy.DROP_OLDEST:
+                        self._dropped_count += 1
+                        self._item_deque.popleft()
+                    elif not block or not self._wait_not_full(timeout=timeout):
+                        raise Full
+
+                if self._wait_histogram is not None:
+                    item = (perf_counter_ns(), item)  # type: ignore
+
+                self._item_deque.append(item)
+
+            depth = self.qsize()
+            if depth > self._max_depth:
+                self._max_depth = depth
+
+            self._not_empty.notify()
+
+    def put_marker(self, item: Any) -> None:
+        """Append `item` ignoring `maxsize` and conflation, it is never dropped.
+
+        For in-band notices to the consumer, e.g. `GapMarker`.
+        """
+
+        with self._lock:
+            self._put_count += 1
+
+            if self._wait_histogram is not None:
+                item = (perf_counter_ns(), item)
+
+            if self._conflating:
+                self._item_map[object()] = item
+            else:
+                self._item_deque.append(item)
+
+            depth = self.qsize()
+            if depth > self._max_depth:
+                self._max_depth = depth
+
+            self._not_empty.notify()
+
+    def put_nowait(self, item: ItemType) -> None:
+        self.put(item=item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> ItemType:
+        with self._lock:
+            if not self.qsize() and (
+                not block or not self._not_empty.wait_for(self.qsize, timeout=timeout)
+            ):
+                raise Empty
+
+            if self._conflating:
+                item = self._item_map.popitem(last=False)[1]
+            else:
+                item = self._item_deque.popleft()
+
+            self._not_full.notify()
+
+            wait_histogram = self._wait_histogram
+            if wait_histogram is not None:
+                timed_item: tuple[int, ItemType] = item  # type: ignore[assignment]
+                put_ns, item = timed_item
+                wait_histogram.record(perf_counter_ns() - put_ns)
+
+            return item
+
+    def get_nowait(self) -> ItemType:
+        return self.get(block=False)
+
+    def get_batch(
+        self,
+        max_items: int,
+        timeout: float | None = None,
+    ) -> list[ItemType]:
+        """Up to `max_items` pending items, oldest first, under one lock.
+
+        Waits, at most `timeout` seconds, for the first item only: an empty
+        list means the timeout expired.
+        """
+
+        with self._lock:
+            if not self._not_empty.wait_for(self.qsize, timeout=timeout):
+                return []
+
+            if self._conflating:
+                item_map = self._item_map
+                item_list = [
+                    item_map.popitem(last=False)[1]
+                    for _ in range(min(max_items, len(item_map)))
+                ]
+            else:
+                item_deque = self._item_deque
+                item_list = [
+                    item_deque.popleft() for _ in range(min(max_items, len(item_deque)))
+                ]
+
+            self._not_full.notify(len(item_list))
+
+            wait_histogram = self._wait_histogram
+            if wait_histogram is not None:
+                get_ns = perf_counter_ns()
+                record = wait_histogram.record
+
+                timed_list: list[tuple[int, ItemType]] = item_list  # type: ignore[assignment]
+
+                for put_ns, _ in timed_list:
+                    record(get_ns - put_ns)
+
+                item_list = [item for _, item in timed_list]
+
+            return item_list
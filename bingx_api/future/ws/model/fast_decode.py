@@ -0,0 +1,182 @@
+from typing import Any, NamedTuple
+
+from orjson import loads
+
+__all__ = (
+    "AccountUpdateRecord",
+    "decode_account_data",
+    "decode_last_price",
+    "LastPriceRecord",
+    "OrderUpdateRecord",
+    "ResponseAccountUpdateRecord",
+    "ResponseDataRecord",
+    "ResponseOrderTradeUpdateRecord",
+)
+
+
+class LastPriceRecord(NamedTuple):
+    """`LastPrice` as a tuple, same field names."""
+
+    e: str
+    E: int
+    s: str
+    c: float
+
+
+class OrderUpdateRecord(NamedTuple):
+    """`OrderUpdate` as a tuple, same field names."""
+
+    ap: float | None
+    c: str
+    i: int | None
+    n: float | None
+    N: str | None
+    o: str
+    p: float
+    ps: str
+    q: float
+    rp: float | None
+    S: str
+    s: str
+    sp: float | None
+    T: int | None
+    wt: str | None
+    X: str
+    x: str | None
+    z: float | None
+
+
+class ResponseOrderTradeUpdateRecord(NamedTuple):
+    e: str
+    E: int
+    o: OrderUpdateRecord
+
+
+class AccountUpdateRecord(NamedTuple):
+    """`AccountUpdate` as a tuple, `B` and `P` stay raw dicts like the model."""
+
+    m: str | None
+    B: list[dict] | None
+    P: list[dict] | None
+
+
+class ResponseAccountUpdateRecord(NamedTuple):
+    e: str
+    E: int | None
+    T: int | None
+    a: AccountUpdateRecord | None
+
+
+class ResponseDataRecord(NamedTuple):
+    """`ResponseData` counterpart: `response.data.e`, `response.data.o.X`...
+
+    read the same on the record and on the model.
+    """
+
+    data: Any
+
+
+def to_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def decode_last_price(message: bytes) -> LastPriceRecord:
+    """`ResponseLastPrice.model_validate_json(message).data` without pydantic.
+
+    Works for futures and spot `<symbol>@lastPrice` messages.
+
+    Raises:
+        ValueError: The message `code` is not 0, like `validate_code`.
+    """
+
+    response = loads(message)
+
+    if response.get("code") != 0:
+        raise ValueError(
+            "code: " + str(response.get("code")) + "; msg: " + response.get("msg")
+        )
+
+    data = response["data"]
+
+    return LastPriceRecord(data["e"], data.get("E", 0), data["s"], float(data["c"]))
+
+
+def decode_order_update(o: dict) -> OrderUpdateRecord:
+    get = o.get
+
+    return OrderUpdateRecord(
+        to_float(get("ap")),
+        get("c", ""),
+        get("i"),
+        to_float(get("n")),
+        get("N"),
+        o["o"],
+        float(o["p"]),
+        o["ps"],
+        float(o["q"]),
+        to_float(get("rp")),
+        o["S"],
+        o["s"],
+        to_float(get("sp")),
+        get("T"),
+        get("wt"),
+        o["X"],
+        get("x"),
+        to_float(get("z")),
+    )
+
+
+def decode_account_data(data: dict) -> ResponseDataRecord | None:
+    """`ResponseData(data=data)` without pydantic for the hot events.
+
+    `ORDER_TRADE_UPDATE` and `ACCOUNT_UPDATE` only, `None` for any other
+    event: the caller falls back to `ResponseData`.
+    """
+
+    e = data.get("e")
+
+    if e == "ORDER_TRADE_UPDATE":
+        return ResponseDataRecord(
+            ResponseOrderTradeUpdateRecord(
+                e,
+                data["E"],
+                decode_order_update(o=data["o"]),
+            )
+        )
+
+    if e == "ACCOUNT_UPDATE":
+        a = data.get("a")
+
+        return ResponseDataRecord(
+            ResponseAccountUpdateRecord(
+                e,
+                data.get("E"),
+                data.get("T"),
+                (
+                    None
+                    if a is None
+                    else AccountUpdateRecord(a.get("m"), a.get("B"), a.get("P"))
+                ),
+            )
+        )
+
+    return None
+
+
+if __name__ == "__main__":
+    print(
+        decode_last_price(
+            message=b'{"code":0,"dataType":"BTC-USDT@lastPrice","data":'
+            b'{"e":"lastPriceUpdate","E":1710351327012,"s":"BTC-USDT","c":"64000.5"}}'
+        )
+    )
+    print(
+        decode_account_data(
+            data=loads(
+                b'{"e":"ORDER_TRADE_UPDATE","E":1710664488898,"o":{"s":"XRP-USDT",'
+                b'"c":"","i":1769281218845814784,"S":"SELL","o":"LIMIT","q":"80.0",'
+                b'"p":"0.6167","sp":"0","ap":"0","x":"TRADE","X":"NEW","N":"USDT",'
+                b'"n":"0","T":0,"wt":"MARK_PRICE","ps":"SHORT","rp":"0","z":"0"}}'
+            )
+        )
+    )
@@ -0,0 +1,107 @@
+import struct
+from pathlib import Path
+from threading import Lock
+from time import time_ns
+from typing import BinaryIO, NamedTuple
+
+__all__ = (
+    "Frame",
+    "FrameRecorder",
+    "read_frame_list",
+)
+
+FILE_MAGIC = b"BXWSREC1"
+FRAME_HEADER = struct.Struct("<qI")
+
+
+class Frame(NamedTuple):
+    receive_ns: int
+    data: bytes
+
+
+class FrameRecorder:
+    """Append raw websocket frames, as received, to `path`.
+
+    The file starts with `FILE_MAGIC`, then each frame is its receive time
+    (`time_ns`) and length, `FRAME_HEADER`, followed by the gzip bytes. An
+    existing recording is appended to. Writes are buffered and locked: the
+    channels of a pool can share one recorder.
+    """
+
+    def __init__(self, path: Path | str, buffer_size: int = 1 << 20) -> None:
+        path = Path(path)
+        empty = not path.exists() or not path.stat().st_size
+
+        if not empty:
+            with path.open("rb") as magic_file:
+                if magic_file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                    raise ValueError(f"Not a frame recording: {path}")
+
+        file = path.open("ab", buffering=buffer_size)
+
+        if empty:
+            file.write(FILE_MAGIC)
+
+        self._file: BinaryIO = file
+        self._frame_count = 0
+        self._lock = Lock()
+        self._path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, data: str | bytes, receive_ns: int | None = None) -> None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        header = FRAME_HEADER.pack(receive_ns or time_ns(), len(data))
+
+        with self._lock:
+            self._file.write(header)
+            self._file.write(data)
+            self._frame_count += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def read_frame_list(path: Path | str) -> list[Frame]:
+    """Every frame of a recording, a frame truncated by a crash is dropped."""
+
+    content = Path(path).read_bytes()
+
+    if not content.startswith(FILE_MAGIC):
+        raise ValueError(f"Not a frame recording: {path}")
+
+    frame_list = []
+    header_size = FRAME_HEADER.size
+    offset = len(FILE_MAGIC)
+    unpack_from = FRAME_HEADER.unpack_from
+
+    while offset + header_size <= len(content):
+        receive_ns, length = unpack_from(content, offset)
+        offset += header_size
+
+        if offset + length > len(content):
+            break
+
+        frame_list.append(Frame(receive_ns, content[offset : offset + length]))
+        offset += length
+
+    return frame_list
@@ -0,0 +1,117 @@
+from enum import Enum
+from threading import Lock
+from typing import NamedTuple
+
+import numpy as np
+
+__all__ = (
+    "LatencyHistogram",
+    "LatencyMetrics",
+    "LatencySnapshot",
+    "LatencyStage",
+)
+
+
+class LatencyStage(str, Enum):
+    """Stages of a message, from the socket to the consumer.
+
+    - DECOMPRESS, CLASSIFY: `ProducerChannel` thread, per frame,
+    - CHANNEL_QUEUE: wait in the channel queue, enqueue to dequeue,
+    - PARSE: decoding by `ProducerLastPrice`/`ProducerAccount`,
+    - QUEUE: wait in the decoded queue, until the consumer dequeues,
+    - SKEW: local wall clock at parse minus the exchange event time `E`.
+    """
+
+    DECOMPRESS = "decompress"
+    CLASSIFY = "classify"
+    CHANNEL_QUEUE = "channel_queue"
+    PARSE = "parse"
+    QUEUE = "queue"
+    SKEW = "skew"
+
+
+class LatencySnapshot(NamedTuple):
+    sample_count: int
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+class LatencyHistogram:
+    """Last `window` durations (ns) of one stage, in a ring buffer.
+
+    `record` is a plain array store, not synchronised: with several writer
+    threads (e.g. the channels of a pool) a few samples may be lost.
+    Snapshots may miss the values written meanwhile.
+    """
+
+    def __init__(self, window: int = 8192) -> None:
+        self._array = np.zeros(window, dtype=np.int64)
+        self._count = 0
+        self._window = window
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, value_ns: int) -> None:
+        self._array[self._count % self._window] = value_ns
+        self._count += 1
+
+    def snapshot(self) -> LatencySnapshot:
+        count = self._count
+        value_array = self._array[: min(count, self._window)] / 1_000
+
+        if not len(value_array):
+            return LatencySnapshot(
+                sample_count=0,
+                p50_us=0.0,
+                p99_us=0.0,
+                max_us=0.0,
+            )
+
+        p50_us, p99_us = np.percentile(value_array, [50, 99])
+
+        return LatencySnapshot(
+            sample_count=count,
+            p50_us=float(p50_us),
+            p99_us=float(p99_us),
+            max_us=float(value_array.max()),
+        )
+
+
+class LatencyMetrics:
+    """Rolling latency histograms per `LatencyStage`.
+
+    Off by default: producers only time their stages when given a
+    `latency_metrics`, pass the same instance to a producer and to the
+    channel it reads to cover the whole pipeline.
+    """
+
+    def __init__(self, window: int = 8192) -> None:
+        self._histogram_map: dict[LatencyStage, LatencyHistogram] = {}
+        self._lock = Lock()
+        self._window = window
+
+    def histogram(self, stage: LatencyStage) -> LatencyHistogram:
+        histogram = self._histogram_map.get(stage)
+
+        if histogram is None:
+            with self._lock:
+                histogram = self._histogram_map.setdefault(
+                    stage,
+                    LatencyHistogram(window=self._window),
+                )
+
+        return histogram
+
+    def snapshot(self) -> dict[LatencyStage, LatencySnapshot]:
+        """Percentiles of every stage recorded so far, in pipeline order."""
+
+        histogram_map = self._histogram_map
+
+        return {
+            stage: histogram_map[stage].snapshot()
+            for stage in LatencyStage
+            if stage in histogram_map
+        }
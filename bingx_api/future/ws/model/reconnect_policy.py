@@ -0,0 +1,59 @@
+import random
+from typing import NamedTuple
+
+__all__ = (
+    "GapMarker",
+    "ReconnectPolicy",
+)
+
+
+class GapMarker(NamedTuple):
+    """Queued in place of the messages missed while a channel reconnected.
+
+    Consumers test `item.__class__ is GapMarker` and resynchronise, e.g.
+    read a REST snapshot, instead of assuming a continuous stream.
+    """
+
+    start_ms: int
+    end_ms: int
+    failure_count: int
+    url: str
+
+
+class ReconnectPolicy(NamedTuple):
+    """Delay before each reconnection attempt of a channel.
+
+    The first attempt after losing a healthy connection is immediate. Each
+    failed attempt then doubles (`factor`) the delay from `base_s` up to
+    `cap_s`, minus a random share up to `jitter` so connections dropped
+    together do not reconnect together. After `breaker_threshold` failures
+    in a row the circuit opens: one probe every `breaker_open_s` until a
+    connection delivers a message again. `max_failure` failures in a row
+    give up, `None` never does.
+
+    Immutable, one instance can be shared by every channel.
+    """
+
+    base_s: float = 0.1
+    cap_s: float = 10.0
+    factor: float = 2.0
+    jitter: float = 0.5
+    breaker_threshold: int = 10
+    breaker_open_s: float = 60.0
+    max_failure: int | None = None
+
+    def next_delay(self, failure_count: int) -> float | None:
+        """Delay after `failure_count` failed attempts in a row, `None` to stop."""
+
+        if self.max_failure is not None and failure_count >= self.max_failure:
+            return None
+
+        if not failure_count:
+            return 0.0
+
+        if failure_count >= self.breaker_threshold:
+            delay_s = self.breaker_open_s
+        else:
+            delay_s = min(self.cap_s, self.base_s * self.factor ** (failure_count - 1))
+
+        return delay_s * (1.0 - self.jitter * random.random())
@@ -0,0 +1,59 @@
+from threading import Condition
+from typing import Callable, Generic, TypeVar
+
+__all__ = ("SlotMap",)
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+
+class SlotMap(Generic[KeyType, ValueType]):
+    """Newest value per key, a conflating alternative to an unbounded queue.
+
+    Writing a key overwrites its slot: memory is bounded by the number of keys
+    and a slow reader only ever sees fresh values. Readers either drain the
+    keys changed since their last read or block until one changes.
+    """
+
+    def __init__(self, get_key: Callable[[ValueType], KeyType]) -> None:
+        self._get_key = get_key
+
+        self._changed_map: dict[KeyType, None] = {}
+        self._condition = Condition()
+        self._slot_map: dict[KeyType, ValueType] = {}
+
+    def __len__(self) -> int:
+        return len(self._slot_map)
+
+    def get(self, key: KeyType) -> ValueType | None:
+        return self._slot_map.get(key)
+
+    def put(self, value: ValueType) -> None:
+        key = self._get_key(value)
+
+        with self._condition:
+            self._slot_map[key] = value
+            self._changed_map[key] = None
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict[KeyType, ValueType]:
+        with self._condition:
+            return dict(self._slot_map)
+
+    def drain_changed(self) -> dict[KeyType, ValueType]:
+        """Newest value of every key written since the previous drain."""
+
+        with self._condition:
+            slot_map = self._slot_map
+            changed_map = {key: slot_map[key] for key in self._changed_map}
+            self._changed_map.clear()
+
+        return changed_map
+
+    def wait_changed(self, timeout: float | None = None) -> dict[KeyType, ValueType]:
+        """`drain_changed` once a key changed, empty after `timeout` seconds."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._changed_map, timeout=timeout)
+
+            return self.drain_changed()
@@ -0,0 +1,334 @@
+from logging import Logger
+from multiprocessing import parent_process, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import sleep
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from robot_one.api.bingx.future.ws.model.fast_decode import (
+    decode_last_price,
+    LastPriceRecord,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import GapMarker
+from robot_one.api.bingx.future.ws.stream_last_price import (
+    LastPrice,
+    ProducerLastPrice,
+)
+
+__all__ = (
+    "PriceBoard",
+    "PriceSlot",
+    "ProducerPriceBoard",
+)
+
+HEADER_DTYPE = np.dtype([("capacity", "<u4"), ("symbol_count", "<u4")])
+SYMBOL_DTYPE = np.dtype("S32")
+SLOT_DTYPE = np.dtype([("sequence", "<u8"), ("price", "<f8"), ("time", "<i8")])
+
+SymbolType = str
+
+
+class PriceSlot(NamedTuple):
+    price: float
+    time: int
+
+
+class PriceBoard:
+    """Latest price and event time per symbol in a shared memory block.
+
+    One writer process, any number of reader processes attached by `name`.
+    Layout: a header (capacity, symbol count), `capacity` fixed width symbols
+    then `capacity` slots of (sequence, price, time).
+
+    Every slot is a seqlock: the writer makes its sequence odd, writes, then
+    makes it even again. A reader retries until it reads the same even
+    sequence before and after copying the slot, `max_read_retry` times at
+    most: a writer dying mid-write leaves its slot odd for good. Readers never
+    take a lock and never block the writer. Symbols are appended by the writer then published
+    by incrementing the symbol count, readers pick new ones up lazily.
+    """
+
+    @staticmethod
+    def build_size(capacity: int) -> int:
+        return (
+            HEADER_DTYPE.itemsize
+            + capacity * SYMBOL_DTYPE.itemsize
+            + capacity * SLOT_DTYPE.itemsize
+        )
+
+    def __init__(
+        self,
+        name: str | None = None,
+        capacity: int = 1024,
+        create: bool = False,
+        max_read_retry: int = 1000,
+    ) -> None:
+        """
+        Args:
+            name (str, optional):
+                Shared memory name, generated when creating without one.
+            capacity (int):
+                Maximum number of symbols, only used with `create`.
+            create (bool):
+                Create (and own) the block, otherwise attach to `name`.
+            max_read_retry (int):
+                Reads of a slot being written before `read_index` gives up.
+        """
+
+        if create:
+            shared_memory = SharedMemory(
+                name=name,
+                create=True,
+                size=self.build_size(capacity=capacity),
+            )
+        else:
+            # Readers must not unlink the block when they exit.
+            try:
+                shared_memory = SharedMemory(name=name, track=False)  # type: ignore
+            except TypeError:  # Python < 3.13
+                shared_memory = SharedMemory(name=name)
+
+                # Child processes share the resource tracker of their parent.
+                if parent_process() is None:
+                    resource_tracker.unregister(
+                        shared_memory._name, "shared_memory"  # type: ignore
+                    )
+
+        buffer = shared_memory.buf
+        header = np.ndarray(shape=(), dtype=HEADER_DTYPE, buffer=buffer)
+
+        if create:
+            header["capacity"] = capacity
+            header["symbol_count"] = 0
+        else:
+            capacity = int(header["capacity"])
+
+        symbol_array = np.ndarray(
+            shape=(capacity,),
+            dtype=SYMBOL_DTYPE,
+            buffer=buffer,
+            offset=HEADER_DTYPE.itemsize,
+        )
+        slot_array = np.ndarray(
+            shape=(capacity,),
+            dtype=SLOT_DTYPE,
+            buffer=buffer,
+            offset=HEADER_DTYPE.itemsize + capacity * SYMBOL_DTYPE.itemsize,
+        )
+
+        if create:
+            slot_array[:] = 0
+
+        self._capacity = capacity
+        self._header = header
+        self._index_map: dict[SymbolType, int] = {}
+        self._max_read_retry = max_read_retry
+        self._owner = create
+        self._shared_memory = shared_memory
+        self._symbol_array = symbol_array
+        self._slot_array = slot_array
+        self._price_array = slot_array["price"]
+        self._sequence_array = slot_array["sequence"]
+        self._time_array = slot_array["time"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+        if self._owner:
+            self.unlink()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def symbol_list(self) -> list[SymbolType]:
+        self.refresh_index_map()
+        return list(self._index_map)
+
+    def refresh_index_map(self) -> None:
+        index_map = self._index_map
+        symbol_array = self._symbol_array
+
+        for index in range(len(index_map), int(self._header["symbol_count"])):
+            index_map[symbol_array[index].decode()] = index
+
+    def get_index(self, symbol: SymbolType) -> int | None:
+        index = self._index_map.get(symbol)
+
+        if index is None:
+            self.refresh_index_map()
+            index = self._index_map.get(symbol)
+
+        return index
+
+    def add_symbol(self, symbol: SymbolType) -> int:
+        """Writer only: slot index of `symbol`, allocated on first use."""
+
+        index = self.get_index(symbol=symbol)
+
+        if index is None:
+            index = len(self._index_map)
+
+            if index >= self._capacity:
+                raise ValueError(f"PriceBoard is full: {self._capacity} symbols.")
+
+            self._symbol_array[index] = symbol.encode()
+            self._header["symbol_count"] = index + 1
+            self._index_map[symbol] = index
+
+        return index
+
+    def write(self, symbol: SymbolType, price: float, time: int) -> None:
+        """Writer only: publish the latest `price` and event `time`."""
+
+        index = self.add_symbol(symbol=symbol)
+        sequence_array = self._sequence_array
+
+        sequence_array[index] += 1
+        self._price_array[index] = price
+        self._time_array[index] = time
+        sequence_array[index] += 1
+
+    def read(self, symbol: SymbolType) -> PriceSlot | None:
+        """Consistent copy of the slot of `symbol`, `None` before its first write."""
+
+        index = self.get_index(symbol=symbol)
+
+        if index is None:
+            return None
+
+        return self.read_index(index=index)
+
+    def read_index(self, index: int) -> PriceSlot | None:
+        """Seqlock read of slot `index`, `None` before its first write.
+
+        `None` too once `max_read_retry` reads found the slot being written,
+        yielding the CPU between two reads.
+        """
+
+        price_array = self._price_array
+        sequence_array = self._sequence_array
+        time_array = self._time_array
+
+        for _ in range(self._max_read_retry):
+            sequence = int(sequence_array[index])
+
+            if not sequence & 1:
+                price = float(price_array[index])
+                time = int(time_array[index])
+
+                if int(sequence_array[index]) == sequence:
+                    return PriceSlot(price=price, time=time) if sequence else None
+
+            sleep(0)
+
+        return None
+
+    def read_all(self) -> dict[SymbolType, PriceSlot]:
+        self.refresh_index_map()
+
+        slot_map = {}
+        for symbol, index in self._index_map.items():
+            slot = self.read_index(index=index)
+
+            if slot is not None:
+                slot_map[symbol] = slot
+
+        return slot_map
+
+    def close(self) -> None:
+        self._header = self._symbol_array = self._slot_array = None  # type: ignore
+        self._price_array = self._sequence_array = self._time_array = None  # type: ignore
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        self._shared_memory.unlink()
+
+
+class ProducerPriceBoard(ProducerLastPrice):
+    """`ProducerLastPrice` publishing into a `PriceBoard` instead of a queue.
+
+    A single websocket connection and a single decode per message serve every
+    process attached to the board. Spot prices are published by passing a
+    spot `StreamerChannel` as `streamer_channel`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        price_board: PriceBoard,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._price_board = price_board
+
+    @property
+    def price_board(self) -> PriceBoard:
+        return self._price_board
+
+    def run(self) -> None:
+        decode: Callable[[bytes], LastPrice | LastPriceRecord] = (
+            decode_last_price if self._fast_decode else self.parse_last_price
+        )
+        event_stop = self._event_stop
+        logger: Logger = self._logger
+        price_board = self._price_board
+        streamer_channel = self._streamer_channel
+
+        try:
+            for message in streamer_channel:
+                if event_stop.is_set():
+                    logger.debug("<STREAMER_CHANNEL>:STOP_READING")
+                    break
+
+                if message.__class__ is GapMarker:
+                    continue
+
+                last_price = decode(message)
+
+                price_board.write(
+                    symbol=last_price.s,
+                    price=last_price.c,
+                    time=getattr(last_price, "E", 0),
+                )
+        finally:
+            streamer_channel.stop()
+
+
+if __name__ == "__main__":
+    import logging
+    import time
+
+    logging.basicConfig(level=logging.FATAL)
+
+    with PriceBoard(capacity=16, create=True) as writer_board:
+        producer = ProducerPriceBoard(
+            daemon=True,
+            fast_decode=True,
+            price_board=writer_board,
+            symbol_list=["BTC-USDT", "ETH-USDT"],
+        )
+        producer.start()
+
+        # Any other process: PriceBoard(name=writer_board.name)
+        reader_board = PriceBoard(name=writer_board.name)
+
+        try:
+            while True:
+                time.sleep(1)
+                print(reader_board.read_all())
+        except KeyboardInterrupt:
+            print("Closing the websocket connection.")
+        finally:
+            producer.event_stop.set()
+            reader_board.close()
@@ -2,12 +2,13 @@ from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 from requests import Response, Request, Session
 
-from robot_one.api.bingx.future.rest.core import get_signed_request, build_session
-from robot_one.api.bingx.api_config import build_api_config
+from robot_one.api.bingx.future.rest.core import (
+    get_session,
+    get_signed_request,
+    get_signer,
+)
 from robot_one.api.bingx.future.ws.url import SWAP_USER_AUTH_USER_DATA_STREAM
 
-API_CONFIG = build_api_config()
-
 __all__ = [
     "query_listen_key",
     "request_listen_key",
@@ -25,10 +26,11 @@ class ResponseListenKey(BaseModel):
 
 
 def request_listen_key(
-    api_key: str = API_CONFIG.API_KEY,
+    api_key: str | None = None,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
+    api_key = api_key or get_signer().api_key
 
     url = SWAP_USER_AUTH_USER_DATA_STREAM
 
@@ -2,18 +2,40 @@ from enum import Enum
 from logging import getLogger, Logger
 from queue import SimpleQueue
 from threading import Event
-from typing import Literal
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Literal
 
 from orjson import loads
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 from websockets.exceptions import ConnectionClosed
 
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import (
+    GapMarker,
+    ReconnectPolicy,
+)
+from robot_one.api.bingx.future.ws.model.fast_decode import (
+    decode_account_data,
+    ResponseDataRecord,
+)
 from robot_one.api.bingx.future.ws.model.base_streamer import (
     BaseProducer,
     BaseStreamer,
+    ChannelStreamer,
+)
+from robot_one.api.bingx.future.ws.url import SWAP_MARKET
+from robot_one.api.bingx.future.ws.valid_listen_key import (
+    get_valid_listen_key,
+    ValidListenKey,
 )
-from robot_one.api.bingx.future.ws.valid_listen_key import ValidListenKey
 from robot_one.api.bingx.future.ws.stream_channel import (
     ProducerChannel,
     StreamerChannel,
@@ -28,6 +50,7 @@ __all__ = (
     "ResponseAccountUpdate",
     "ResponseConfigUpdate",
     "ResponseData",
+    "ResponseDataType",
     "ResponseOrderTradeUpdate",
     "StreamerAccount",
     "TradeInformation",
@@ -303,24 +326,74 @@ class ResponseListenKey(BaseModel):
     listen_key: str
 
 
+# `fast_decode` queues records, read like the model.
+ResponseDataType = ResponseData | ResponseDataRecord
+
+
 class ProducerAccount(BaseProducer):
     def __init__(
         self,
         *args,
         catch_exception: bool = True,
+        conflate_key: Callable[[ResponseDataType], Any] | None = None,
+        fast_decode: bool = False,
+        gap_marker: bool = False,
+        latency_metrics: LatencyMetrics | None = None,
         listen_key: ValidListenKey | None = None,
         logger: Logger | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        queue_maxsize: int = 0,
+        reconnect_policy: ReconnectPolicy | None = None,
+        streamer_channel: ChannelStreamer | None = None,
+        url: str = SWAP_MARKET,
         **kwargs,
     ):
+        """
+        Args:
+            gap_marker (bool):
+                Queue a `GapMarker` after each reconnection of the channel:
+                account events may have been missed, resynchronise from REST.
+            latency_metrics (LatencyMetrics, optional):
+                Records the decoding, queue wait and clock skew of each
+                event, and the stages of the channel.
+            listen_key (ValidListenKey, optional):
+                Defaults to the key shared by every streamer of the account,
+                see `get_valid_listen_key`. Unused with `streamer_channel`.
+            fast_decode (bool):
+                Decode `ORDER_TRADE_UPDATE` and `ACCOUNT_UPDATE` into
+                `ResponseDataRecord` tuples, read like `ResponseData`, other
+                events are still validated. Keep pydantic, the default, to
+                debug unexpected payloads.
+            streamer_channel (ChannelStreamer, optional):
+                Channel to read instead of the account websocket, e.g. a
+                `StreamerReplay` of recorded account traffic.
+        """
+
         super().__init__(*args, **kwargs)
 
         self._catch_exception = catch_exception
+        self._fast_decode = fast_decode
+        self._gap_marker = gap_marker
+        self._latency_metrics = latency_metrics
+        self._reconnect_policy = reconnect_policy
+        self._streamer_channel = streamer_channel
+        self._url = url
         self._logger = logger or getLogger(name=__name__)
-        self._listen_key = listen_key or ValidListenKey()
+        self._listen_key = listen_key
 
+        self._current_channel: ChannelStreamer | None = None
         self._event_crash = Event()
         self._event_stop = Event()
-        self._queue_iterator = SimpleQueue[ResponseData]()
+        self._queue_iterator = BoundedQueue[ResponseDataType](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            wait_histogram=(
+                latency_metrics.histogram(stage=LatencyStage.QUEUE)
+                if latency_metrics is not None
+                else None
+            ),
+        )
         self._subscription_queue = SimpleQueue[QueryChannel]()
 
     @property
@@ -328,7 +401,19 @@ class ProducerAccount(BaseProducer):
         return self._catch_exception
 
     @property
-    def listen_key(self) -> ValidListenKey:
+    def fast_decode(self) -> bool:
+        return self._fast_decode
+
+    @property
+    def gap_marker(self) -> bool:
+        return self._gap_marker
+
+    @property
+    def latency_metrics(self) -> LatencyMetrics | None:
+        return self._latency_metrics
+
+    @property
+    def listen_key(self) -> ValidListenKey | None:
         return self._listen_key
 
     @property
@@ -336,7 +421,7 @@ class ProducerAccount(BaseProducer):
         return self._logger
 
     @property
-    def queue_iterator(self) -> SimpleQueue[ResponseData]:
+    def queue_iterator(self) -> BoundedQueue[ResponseDataType]:
         return self._queue_iterator
 
     @property
@@ -347,17 +432,91 @@ class ProducerAccount(BaseProducer):
     def event_stop(self) -> Event:
         return self._event_stop
 
+    @property
+    def streamer_channel(self) -> ChannelStreamer | None:
+        return self._streamer_channel
+
+    @property
+    def url(self) -> str:
+        return self._url
+
     @property
     def subscription_queue(self) -> SimpleQueue[QueryChannel]:
         return self.subscription_queue
 
+    def stop(self) -> None:
+        super().stop()
+
+        # Without it, the channel would keep reconnecting for nobody.
+        current_channel = self._current_channel
+        if current_channel is not None:
+            current_channel.stop()
+
+    def read_channel(self, streamer_channel: ChannelStreamer) -> None:
+        """Decode and queue the messages of `streamer_channel` until stopped."""
+
+        fast_decode = self._fast_decode
+        event_stop = self._event_stop
+        latency_metrics = self._latency_metrics
+        logger = self._logger
+        queue_iterator = self._queue_iterator
+
+        if latency_metrics is not None:
+            record_parse = latency_metrics.histogram(stage=LatencyStage.PARSE).record
+            record_skew = latency_metrics.histogram(stage=LatencyStage.SKEW).record
+
+        logger.debug("<ACCOUNT_READER>:START_READING")
+
+        for message in streamer_channel:
+            if event_stop.is_set():
+                logger.debug("<ACCOUNT_READER>:STOP_READING")
+                break
+
+            if message.__class__ is GapMarker:
+                queue_iterator.put_marker(message)
+                continue
+
+            start_ns = perf_counter_ns()
+            message_obj = loads(message)
+            response_update = (
+                decode_account_data(data=message_obj) if fast_decode else None
+            ) or ResponseData(data=message_obj)
+
+            if latency_metrics is not None:
+                record_parse(perf_counter_ns() - start_ns)
+
+                event_ms = getattr(response_update.data, "E", None)
+                if event_ms is not None:
+                    record_skew(time_ns() - event_ms * 1_000_000)
+
+            logger.debug(
+                "<ACCOUNT_READER>:READ:RESPONSE_UPDATE:%s",
+                response_update,
+            )
+            queue_iterator.put(response_update)
+
     def run(self):
         catch_exception = self._catch_exception
         logger = self._logger
-        listen_key = self._listen_key
-        queue_iterator = self._queue_iterator
+        url = self._url
+        gap_marker = self._gap_marker
+        latency_metrics = self._latency_metrics
+        reconnect_policy = self._reconnect_policy
         event_crash = self._event_crash
         event_stop = self._event_stop
+        streamer_channel = self._streamer_channel
+
+        if streamer_channel is not None:
+            self._current_channel = streamer_channel
+
+            try:
+                self.read_channel(streamer_channel=streamer_channel)
+            finally:
+                streamer_channel.stop()
+
+            return
+
+        listen_key = self._listen_key = self._listen_key or get_valid_listen_key()
 
         while not event_stop.is_set():
             try:
@@ -365,26 +524,17 @@ class ProducerAccount(BaseProducer):
                     streamer_channel = StreamerChannel(
                         producer=ProducerChannel(
                             catch_exception=catch_exception,
+                            gap_marker=gap_marker,
+                            latency_metrics=latency_metrics,
                             listen_key=refreshed_listen_key,
+                            reconnect_policy=reconnect_policy,
+                            url=url,
                         ),
                     )
+                    self._current_channel = streamer_channel
 
                     with streamer_channel as channel_stream:
-                        logger.debug("<ACCOUNT_READER>:START_READING")
-
-                        for message in channel_stream:
-                            if event_stop.is_set():
-                                logger.debug("<ACCOUNT_READER>:STOP_READING")
-                                break
-
-                            message_obj = loads(message)
-                            response_update = ResponseData(data=message_obj)
-
-                            logger.debug(
-                                "<ACCOUNT_READER>:READ:RESPONSE_UPDATE:%s",
-                                response_update,
-                            )
-                            queue_iterator.put_nowait(response_update)
+                        self.read_channel(streamer_channel=channel_stream)
             except ConnectionClosed as e:
                 if not catch_exception:
                     raise e
@@ -393,7 +543,7 @@ class ProducerAccount(BaseProducer):
                 logger.fatal("<ACCOUNT_READER>:%s", e)
 
 
-StreamerAccount = BaseStreamer[ProducerAccount, ResponseData]
+StreamerAccount = BaseStreamer[ProducerAccount, ResponseDataType]
 
 if __name__ == "__main__":
     import logging
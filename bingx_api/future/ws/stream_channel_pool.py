@@ -0,0 +1,317 @@
+from logging import getLogger, Logger
+from threading import Event, Lock
+from typing import Any, Callable
+from zlib import crc32
+
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.frame_recorder import FrameRecorder
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import ReconnectPolicy
+from robot_one.api.bingx.future.ws.model.base_streamer import (
+    BaseChannelProducer,
+    BaseStreamer,
+)
+from robot_one.api.bingx.future.ws.stream_channel import (
+    get_data_type,
+    ProducerChannel,
+    Subscription,
+)
+
+__all__ = (
+    "build_shard_map",
+    "ProducerChannelPool",
+    "StreamerChannelPool",
+)
+
+ShardMap = dict[int, list[Subscription]]
+
+
+def build_shard_map(
+    current_map: ShardMap,
+    expected_list: list[Subscription],
+    max_subscription_per_connection: int,
+    min_connection: int = 1,
+) -> ShardMap:
+    """Spread `expected_list` over connections, moving as little as possible.
+
+    Enough connections are opened for `expected_list` to fit. Subscriptions
+    still expected stay on their connection, a new one goes to the connection
+    `crc32(data_type) % connection_count` or the next one with room.
+    """
+
+    expected_set = set(expected_list)
+    shard_map: ShardMap = {
+        index: [s for s in subscription_list if s in expected_set]
+        for index, subscription_list in current_map.items()
+    }
+    assigned_set = {
+        s for subscription_list in shard_map.values() for s in subscription_list
+    }
+
+    connection_count = max(
+        min_connection,
+        -(-len(expected_list) // max_subscription_per_connection),
+    )
+    for index in range(connection_count):
+        shard_map.setdefault(index, [])
+
+    for subscription in expected_list:
+        if subscription in assigned_set:
+            continue
+
+        index_list = sorted(shard_map)
+        preferred = crc32(subscription.data_type.encode()) % len(index_list)
+
+        for offset in range(len(index_list)):
+            index = index_list[(preferred + offset) % len(index_list)]
+            if len(shard_map[index]) < max_subscription_per_connection:
+                break
+        else:
+            index = max(index_list) + 1
+            shard_map[index] = []
+
+        shard_map[index].append(subscription)
+        assigned_set.add(subscription)
+
+    return shard_map
+
+
+class ProducerChannelPool(BaseChannelProducer):
+    """`ProducerChannel` spread over several websocket connections.
+
+    Every connection holds at most `max_subscription_per_connection`
+    subscriptions and pushes its messages in the same `queue_iterator`: the
+    pool is read as a single stream. A disconnection only affects the
+    subscriptions of one connection. `url` defaults to the one of
+    `channel_class`.
+    `subscribe(expected_list=...)` rebalances: removed subscriptions are
+    unsubscribed where they live, new ones go to the connection picked by
+    `build_shard_map` and connections left empty are closed.
+    A `latency_metrics` or `frame_recorder` is shared by every connection.
+    """
+
+    def __init__(
+        self,
+        *args,
+        catch_exception: bool = True,
+        channel_class: type[ProducerChannel] = ProducerChannel,
+        conflate_key: Callable[[bytes], Any] = get_data_type,
+        frame_recorder: FrameRecorder | None = None,
+        gap_marker: bool = False,
+        latency_metrics: LatencyMetrics | None = None,
+        logger: Logger | None = None,
+        max_connection_retry: int | None = None,
+        max_subscription_per_connection: int = 50,
+        min_connection: int = 1,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        queue_maxsize: int = 0,
+        reconnect_policy: ReconnectPolicy | None = None,
+        subscription_list: list[Subscription] | None = None,
+        url: str | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self._catch_exception = catch_exception
+        self._channel_class = channel_class
+        self._frame_recorder = frame_recorder
+        self._gap_marker = gap_marker
+        self._latency_metrics = latency_metrics
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._max_connection_retry = max_connection_retry
+        self._max_subscription_per_connection = max_subscription_per_connection
+        self._min_connection = min_connection
+        self._reconnect_policy = reconnect_policy
+        self._url = url
+
+        self._event_stop = Event()
+        self._lock = Lock()
+        self._producer_channel_map: dict[int, ProducerChannel] = {}
+        self._queue_iterator = BoundedQueue[bytes](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            wait_histogram=(
+                latency_metrics.histogram(stage=LatencyStage.CHANNEL_QUEUE)
+                if latency_metrics is not None
+                else None
+            ),
+        )
+        self._running = False
+        self._shard_map: ShardMap = {}
+
+        self.subscribe(expected_list=subscription_list or [])
+
+    @property
+    def event_stop(self) -> Event:
+        return self._event_stop
+
+    @property
+    def latency_metrics(self) -> LatencyMetrics | None:
+        return self._latency_metrics
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def max_subscription_per_connection(self) -> int:
+        return self._max_subscription_per_connection
+
+    @property
+    def producer_channel_list(self) -> list[ProducerChannel]:
+        with self._lock:
+            return list(self._producer_channel_map.values())
+
+    @property
+    def queue_iterator(self) -> BoundedQueue[bytes]:
+        return self._queue_iterator
+
+    @property
+    def subscription_list(self) -> list[Subscription]:
+        with self._lock:
+            return [
+                subscription
+                for subscription_list in self._shard_map.values()
+                for subscription in subscription_list
+            ]
+
+    @subscription_list.setter
+    def subscription_list(self, subscription_list: list[Subscription]) -> None:
+        self.subscribe(expected_list=subscription_list)
+
+    @property
+    def url(self) -> str | None:
+        return self._url
+
+    def build_producer_channel(
+        self,
+        subscription_list: list[Subscription],
+    ) -> ProducerChannel:
+        url = self._url
+        url_kwargs: dict[str, Any] = {} if url is None else {"url": url}
+
+        return self._channel_class(
+            catch_exception=self._catch_exception,
+            daemon=True,
+            frame_recorder=self._frame_recorder,
+            gap_marker=self._gap_marker,
+            latency_metrics=self._latency_metrics,
+            logger=self._logger,
+            max_connection_retry=self._max_connection_retry,
+            queue_iterator=self._queue_iterator,
+            reconnect_policy=self._reconnect_policy,
+            subscription_list=list(subscription_list),
+            **url_kwargs,
+        )
+
+    def close_producer_channel(self, producer_channel: ProducerChannel) -> None:
+        producer_channel.event_stop.set()
+
+        websocket = producer_channel.websocket
+        if websocket is not None:
+            websocket.close()
+
+    def run(self) -> None:
+        event_stop = self._event_stop
+        logger = self._logger
+
+        with self._lock:
+            for producer_channel in self._producer_channel_map.values():
+                producer_channel.start()
+
+            self._running = True
+
+        logger.debug("<BINGX:WS_POOL>:STARTED:%s", len(self._producer_channel_map))
+
+        event_stop.wait()
+
+        with self._lock:
+            for producer_channel in self._producer_channel_map.values():
+                self.close_producer_channel(producer_channel=producer_channel)
+
+        # The channels share it, none of them closes it on its own stop.
+        self._queue_iterator.close()
+
+        logger.debug("<BINGX:WS_POOL>:STOPPED")
+
+    def subscribe(self, expected_list: list[Subscription] | None = None) -> None:
+        logger = self._logger
+
+        with self._lock:
+            if expected_list is None:
+                for producer_channel in self._producer_channel_map.values():
+                    producer_channel.subscribe()
+                return
+
+            shard_map = build_shard_map(
+                current_map=self._shard_map,
+                expected_list=expected_list,
+                max_subscription_per_connection=self._max_subscription_per_connection,
+                min_connection=self._min_connection,
+            )
+            producer_channel_map = self._producer_channel_map
+            running = self._running
+
+            # Connections left empty are dropped before any is opened.
+            for index in list(shard_map):
+                if index >= self._min_connection and not shard_map[index]:
+                    shard_map.pop(index)
+
+            for index in list(producer_channel_map):
+                if index not in shard_map:
+                    self.close_producer_channel(
+                        producer_channel=producer_channel_map.pop(index),
+                    )
+
+            for index, subscription_list in shard_map.items():
+                if index in producer_channel_map:
+                    producer_channel_map[index].subscribe(
+                        expected_list=subscription_list,
+                    )
+                    continue
+
+                new_channel = self.build_producer_channel(
+                    subscription_list=subscription_list,
+                )
+                producer_channel_map[index] = new_channel
+
+                if running:
+                    new_channel.start()
+
+            self._shard_map = shard_map
+
+            logger.debug(
+                "<BINGX:WS_POOL>:SHARDS:%s",
+                {index: len(s) for index, s in shard_map.items()},
+            )
+
+
+StreamerChannelPool = BaseStreamer[ProducerChannelPool, bytes]
+
+if __name__ == "__main__":
+    import logging
+
+    logging.basicConfig(level=logging.FATAL)
+
+    streamer = StreamerChannelPool(
+        producer=ProducerChannelPool(
+            max_subscription_per_connection=2,
+            subscription_list=[
+                Subscription(id="0", data_type=f"{symbol}@lastPrice")
+                for symbol in ["BTC-USDT", "ETH-USDT", "SOL-USDT", "XRP-USDT"]
+            ],
+        ),
+    )
+
+    try:
+        for received_message in streamer:
+            print(received_message)
+    except KeyboardInterrupt:
+        print("Closing the websocket connection.")
@@ -1,7 +1,7 @@
 from logging import getLogger, Logger
-from queue import SimpleQueue
 from threading import Event
-from typing import Any
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic.alias_generators import to_camel
@@ -9,7 +9,22 @@ from pydantic.alias_generators import to_camel
 from robot_one.api.bingx.future.ws.model.base_streamer import (
     BaseProducer,
     BaseStreamer,
+    ChannelStreamer,
 )
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.fast_decode import (
+    decode_last_price,
+    LastPriceRecord,
+)
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import GapMarker
+from robot_one.api.bingx.future.ws.model.slot_map import SlotMap
 from robot_one.api.bingx.future.ws.stream_channel import (
     ProducerChannel,
     StreamerChannel,
@@ -18,6 +33,7 @@ from robot_one.api.bingx.future.ws.stream_channel import (
 
 __all__ = (
     "LastPrice",
+    "LastPriceType",
     "ProducerLastPrice",
     "StreamerLastPrice",
     "ResponseLastPrice",
@@ -74,6 +90,10 @@ class ResponseLastPrice(BaseModel):
         return data
 
 
+# `fast_decode` queues records, read like the model.
+LastPriceType = LastPrice | LastPriceRecord
+
+
 class ProducerLastPrice(BaseProducer):
     @staticmethod
     def build_subscription_list(symbol_list: list[str]) -> list[Subscription]:
@@ -95,33 +115,103 @@ class ProducerLastPrice(BaseProducer):
 
         return symbol_list
 
+    @staticmethod
+    def parse_last_price(message: bytes) -> LastPrice:
+        return ResponseLastPrice.model_validate_json(json_data=message).data
+
     def __init__(
         self,
         *args,
+        conflate: bool = False,
+        conflate_key: Callable[[LastPriceType], Any] = lambda p: p.s,
+        fast_decode: bool = False,
+        gap_marker: bool = False,
+        latency_metrics: LatencyMetrics | None = None,
         logger: Logger | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        queue_maxsize: int = 0,
+        streamer_channel: ChannelStreamer | None = None,
         symbol_list: list[str] | None = None,
         **kwargs,
     ) -> None:
+        """
+        Args:
+            conflate (bool):
+                Keep only the newest price per symbol in `slot_map` instead
+                of queueing every update in `queue_iterator`.
+            fast_decode (bool):
+                Decode messages into `LastPriceRecord` tuples, same fields,
+                instead of validating `ResponseLastPrice`. Keep pydantic, the
+                default, to debug unexpected payloads.
+            gap_marker (bool):
+                Queue a `GapMarker` after each reconnection of the default
+                channel. Markers of a given `streamer_channel` are always
+                forwarded to `queue_iterator`, not to `slot_map`.
+            latency_metrics (LatencyMetrics, optional):
+                Records the decoding, queue wait and clock skew of each
+                price, and the channel stages of the default channel. Give
+                the same instance to a `streamer_channel` to cover it.
+            streamer_channel (ChannelStreamer, optional):
+                Channel to read, e.g. a `StreamerChannelPool` to spread many
+                symbols over several connections. `symbol_list` is then
+                subscribed through it.
+        """
+
         super().__init__(*args, **kwargs)
 
         event_stop = Event()
         logger = logger or getLogger(name=self.__class__.__name__)
-        queue_iterator = SimpleQueue[LastPrice]()
-        streamer_channel = StreamerChannel(
-            producer=ProducerChannel(
-                subscription_list=self.build_subscription_list(
-                    symbol_list=symbol_list or [],
-                ),
+        queue_iterator = BoundedQueue[LastPriceType](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            wait_histogram=(
+                latency_metrics.histogram(stage=LatencyStage.QUEUE)
+                if latency_metrics is not None
+                else None
             ),
         )
+        slot_map = SlotMap[SymbolType, LastPriceType](get_key=lambda p: p.s)
+        subscription_list = self.build_subscription_list(symbol_list=symbol_list or [])
+
+        if streamer_channel is None:
+            streamer_channel = StreamerChannel(
+                producer=ProducerChannel(
+                    gap_marker=gap_marker,
+                    latency_metrics=latency_metrics,
+                    subscription_list=subscription_list,
+                ),
+            )
+        elif symbol_list is not None:
+            streamer_channel.producer.subscribe(expected_list=subscription_list)
 
+        self._conflate = conflate
         self._event_stop = event_stop
+        self._fast_decode = fast_decode
+        self._latency_metrics = latency_metrics
         self._logger = logger
         self._queue_iterator = queue_iterator
+        self._slot_map = slot_map
         self._streamer_channel = streamer_channel
 
     @property
-    def streamer_channel(self) -> StreamerChannel:
+    def conflate(self) -> bool:
+        return self._conflate
+
+    @property
+    def fast_decode(self) -> bool:
+        return self._fast_decode
+
+    @property
+    def latency_metrics(self) -> LatencyMetrics | None:
+        return self._latency_metrics
+
+    @property
+    def slot_map(self) -> SlotMap[SymbolType, LastPriceType]:
+        return self._slot_map
+
+    @property
+    def streamer_channel(self) -> ChannelStreamer:
         return self._streamer_channel
 
     @property
@@ -133,27 +223,58 @@ class ProducerLastPrice(BaseProducer):
         return self._event_stop
 
     @property
-    def queue_iterator(self) -> SimpleQueue[LastPrice]:
+    def queue_iterator(self) -> BoundedQueue[LastPriceType]:
         return self._queue_iterator
 
+    def stop(self) -> None:
+        super().stop()
+
+        # Without it, the channel would keep reconnecting for nobody.
+        self._streamer_channel.stop()
+
     def run(self) -> None:
+        decode: Callable[[bytes], LastPriceType] = (
+            decode_last_price if self._fast_decode else self.parse_last_price
+        )
         event_stop = self._event_stop
+        latency_metrics = self._latency_metrics
         logger = self._logger
-        queue_iterator = self._queue_iterator
+        put = self._slot_map.put if self._conflate else self._queue_iterator.put
+        put_marker = self._queue_iterator.put_marker
         streamer_channel = self._streamer_channel
 
-        for message in streamer_channel:
-            logger.debug("<STREAMER_CHANNEL>:NEW_MESSAGE:%s>", message)
+        if latency_metrics is not None:
+            record_parse = latency_metrics.histogram(stage=LatencyStage.PARSE).record
+            record_skew = latency_metrics.histogram(stage=LatencyStage.SKEW).record
+
+        try:
+            for message in streamer_channel:
+                logger.debug("<STREAMER_CHANNEL>:NEW_MESSAGE:%s>", message)
+
+                if event_stop.is_set():
+                    logger.debug("<STREAMER_CHANNEL>:STOP_READING")
+                    break
 
-            if event_stop.is_set():
-                logger.debug("<STREAMER_CHANNEL>:STOP_READING")
-                break
+                if message.__class__ is GapMarker:
+                    put_marker(message)
+                    continue
 
-            last_price = ResponseLastPrice.model_validate_json(json_data=message).data
+                if latency_metrics is None:
+                    last_price = decode(message)
+                else:
+                    start_ns = perf_counter_ns()
+                    last_price = decode(message)
+                    record_parse(perf_counter_ns() - start_ns)
 
-            logger.debug("LAST_PRICE:%s", last_price)
+                    event_ms = getattr(last_price, "E", None)
+                    if event_ms is not None:
+                        record_skew(time_ns() - event_ms * 1_000_000)
 
-            queue_iterator.put_nowait(item=last_price)
+                logger.debug("LAST_PRICE:%s", last_price)
+
+                put(last_price)
+        finally:
+            streamer_channel.stop()
 
     @property
     def symbol_list(self) -> list[SymbolType]:
@@ -168,7 +289,27 @@ class ProducerLastPrice(BaseProducer):
         producer_channel.subscribe(expected_list=expected_list)
 
 
-StreamerLastPrice = BaseStreamer[ProducerLastPrice, LastPrice]
+class StreamerLastPrice(BaseStreamer[ProducerLastPrice, LastPriceType]):
+    """`BaseStreamer` with conflated reads.
+
+    With `ProducerLastPrice(conflate=True)`, `drain_changed` and `wait_changed`
+    return the newest price per symbol instead of iterating over every update.
+    """
+
+    def drain_changed(self) -> dict[SymbolType, LastPriceType]:
+        """Newest price of every symbol changed since the previous read."""
+
+        self._start_thread()
+        return self._producer.slot_map.drain_changed()
+
+    def wait_changed(
+        self,
+        timeout: float | None = None,
+    ) -> dict[SymbolType, LastPriceType]:
+        """Block until a symbol changes (or `timeout`), then `drain_changed`."""
+
+        self._start_thread()
+        return self._producer.slot_map.wait_changed(timeout=timeout)
 
 
 if __name__ == "__main__":
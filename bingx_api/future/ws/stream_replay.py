@@ -0,0 +1,180 @@
+from logging import getLogger, Logger
+from pathlib import Path
+from threading import Event
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from robot_one.api.bingx.future.ws.model.base_streamer import (
+    BaseChannelProducer,
+    BaseStreamer,
+)
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.frame_recorder import (
+    Frame,
+    read_frame_list,
+)
+from robot_one.api.bingx.future.ws.stream_channel import (
+    get_data_type,
+    MessageKind,
+    ProducerChannel,
+    Subscription,
+)
+
+__all__ = (
+    "ProducerReplay",
+    "StreamerReplay",
+)
+
+
+class ProducerReplay(BaseChannelProducer):
+    """Plays a `FrameRecorder` recording back, in place of a `ProducerChannel`.
+
+    Frames are decompressed and classified like `channel_class` does, content
+    messages are queued: pass a `StreamerReplay` as the `streamer_channel` of
+    `ProducerLastPrice` or `ProducerAccount` to run the parse path on real
+    traffic without a network. Subscriptions are kept but do not filter the
+    recording.
+
+    `speed` 1.0 keeps the recorded gaps between frames, bursts included, 2.0
+    plays twice as fast and `None` as fast as possible. `event_done` is set
+    once the last of `repeat` passes is queued.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *args,
+        channel_class: type[ProducerChannel] = ProducerChannel,
+        conflate_key: Callable[[bytes], Any] = get_data_type,
+        logger: Logger | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        queue_maxsize: int = 0,
+        repeat: int = 1,
+        speed: float | None = 1.0,
+        subscription_list: list[Subscription] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._channel_class = channel_class
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._path = Path(path)
+        self._repeat = repeat
+        self._speed = speed
+        self._subscription_list = subscription_list or []
+
+        self._content_count = 0
+        self._event_done = Event()
+        self._event_stop = Event()
+        self._queue_iterator = BoundedQueue[bytes](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+        )
+
+    @property
+    def content_count(self) -> int:
+        """Content messages queued so far."""
+
+        return self._content_count
+
+    @property
+    def event_done(self) -> Event:
+        return self._event_done
+
+    @property
+    def event_stop(self) -> Event:
+        return self._event_stop
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def queue_iterator(self) -> BoundedQueue[bytes]:
+        return self._queue_iterator
+
+    @property
+    def speed(self) -> float | None:
+        return self._speed
+
+    @property
+    def subscription_list(self) -> list[Subscription]:
+        return self._subscription_list
+
+    @subscription_list.setter
+    def subscription_list(self, subscription_list: list[Subscription]) -> None:
+        self.subscribe(expected_list=subscription_list)
+
+    def subscribe(self, expected_list: list[Subscription] | None = None) -> None:
+        if expected_list is not None:
+            self._subscription_list = list(expected_list)
+
+    def replay(self, frame_list: list[Frame]) -> bool:
+        """One pass over `frame_list`, returns `False` once stopped."""
+
+        channel_class = self._channel_class
+        classify = channel_class.classify
+        decompress = channel_class.decompress
+        event_stop = self._event_stop
+        put = self._queue_iterator.put
+        speed = self._speed
+
+        first_ns = frame_list[0].receive_ns
+        start_ns = perf_counter_ns()
+
+        for receive_ns, data in frame_list:
+            if event_stop.is_set():
+                return False
+
+            if speed is not None:
+                wait_ns = start_ns + (receive_ns - first_ns) / speed - perf_counter_ns()
+
+                if wait_ns > 0:
+                    event_stop.wait(timeout=wait_ns / 1_000_000_000)
+
+            message = decompress(data=data)
+
+            if classify(message=message) is MessageKind.CONTENT:
+                put(item=message)
+                self._content_count += 1
+
+        return True
+
+    def run(self) -> None:
+        logger = self._logger
+
+        frame_list = read_frame_list(path=self._path)
+        logger.debug("<BINGX:WS_REPLAY>:FRAMES:%s", len(frame_list))
+
+        if frame_list:
+            for _ in range(self._repeat):
+                if not self.replay(frame_list=frame_list):
+                    break
+
+        self._event_done.set()
+        logger.debug("<BINGX:WS_REPLAY>:DONE:%s", self._content_count)
+
+
+StreamerReplay = BaseStreamer[ProducerReplay, bytes]
+
+if __name__ == "__main__":
+    import logging
+    import sys
+
+    logging.basicConfig(level=logging.FATAL)
+
+    streamer = StreamerReplay(producer=ProducerReplay(path=sys.argv[1], daemon=True))
+
+    with streamer:
+        streamer.producer.event_done.wait()
+
+        for received_message in streamer.next_batch(max_items=sys.maxsize, timeout=0):
+            print(received_message)
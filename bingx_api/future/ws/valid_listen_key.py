@@ -1,8 +1,12 @@
 from logging import getLogger, Logger
-from threading import Event, Lock, Thread
+from threading import Event, Lock
 from time import sleep
-from requests import HTTPError
 
+from robot_one.api.bingx.future.rest.core import get_signer, Signer, use_signer
+from robot_one.api.bingx.future.ws.listen_key_service import (
+    get_listen_key_service,
+    ListenKeyService,
+)
 from robot_one.api.bingx.future.ws.read_listen_key import query_listen_key
 from robot_one.api.bingx.future.ws.update_listen_key import (
     query_update_listen_key,
@@ -10,6 +14,7 @@ from robot_one.api.bingx.future.ws.update_listen_key import (
 )
 
 __all__ = [
+    "get_valid_listen_key",
     "LockedKey",
     "ValidListenKey",
 ]
@@ -32,99 +37,177 @@ class LockedKey:
         return f"LockedKey(key='{self._key}')"
 
 
-class ValidListenKey(Thread):
+class ValidListenKey:
     def __init__(
         self,
         logger: Logger | None = None,
         refresh_s: int = 1800,
+        retry_s: int = 5,
+        service: ListenKeyService | None = None,
+        signer: Signer | None = None,
     ) -> None:
         """Listen key expires 60 minutes after creation.
         Once refreshed/extended it is valid for an extra 60 minutes.
         Bingx recommend refreshing the key every 30 minutes.
-        """
 
-        Thread.__init__(self)
+        Shared by every streamer of an account: each `with` block (or
+        `start()`/`stop()` pair) is a user, the key is created by the first
+        one and no longer refreshed after the last one. Refreshes run on the
+        `ListenKeyService` thread, not on a thread per key.
+
+        Args:
+            retry_s (int):
+                Delay before retrying a failed creation.
+            service (ListenKeyService, optional):
+                Scheduler of the refreshes, defaults to the process-wide one.
+            signer (Signer, optional):
+                Account of the key, defaults to `get_signer()` on first use.
+        """
 
         self._refresh_s = refresh_s
+        self._retry_s = retry_s
         self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._service = service
+        self._signer = signer
 
-        self._locked_key: LockedKey | None = None
-        self._stop_event = Event()
+        self._key: str | None = None
+        self._lock = Lock()
         self._ready_event = Event()
+        self._user_count = 0
 
     @property
     def refresh_s(self) -> int:
         return self._refresh_s
 
-    @property
-    def locked_key(self) -> LockedKey | None:
-        return self._locked_key
-
     @property
     def ready_event(self) -> Event:
         return self._ready_event
 
     @property
-    def stop_event(self) -> Event:
-        return self._stop_event
+    def signer(self) -> Signer | None:
+        return self._signer
 
-    def __enter__(self):
-        read_event = self._ready_event
+    @property
+    def user_count(self) -> int:
+        return self._user_count
 
+    def __enter__(self):
         self.start()
 
-        read_event.wait()
+        self._ready_event.wait()
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.stop()
 
-    def refresh_locked_key(self):
-        locked_key = self._locked_key
+    def get_key(self) -> str | None:
+        """Current key, a plain attribute read: no lock."""
+
+        return self._key
+
+    def create_key(self) -> str:
+        with use_signer(self._signer or get_signer()):
+            return query_listen_key()
+
+    def update_key(self, key: str) -> None:
+        query_update_listen_key(query=QueryUpdateListenKey(listen_key=key))
+
+    def refresh_key(self) -> bool:
+        """Create or extend the key, returns `False` when creation failed.
+
+        Never raises: a failed extension creates a new key at once, a failed
+        creation is retried `retry_s` later by `refresh_due`.
+        """
+
+        key = self._key
         logger = self._logger
-        ready_event = self._ready_event
 
-        if locked_key is None:
-            self._locked_key = LockedKey(key=query_listen_key())
-            ready_event.set()
-            logger.debug("<BINGX:REST>::NEW:LISTEN_KEY:%s", self._locked_key)
-        else:
+        if key is not None:
             try:
-                query_update_listen_key(
-                    query=QueryUpdateListenKey(
-                        listen_key=locked_key.get_key(),
-                    )
-                )
-
-                logger.debug("<BINGX:REST>::REFRESHED:LISTEN_KEY:%s", self._locked_key)
-            except HTTPError as e:
-                logger.fatal(e)
-                self._locked_key = None
-
-    def run(self):
-        refresh_s = self._refresh_s
-        logger = self._logger
-        stop_event = self._stop_event
+                self.update_key(key=key)
+
+                logger.debug("<BINGX:REST>::REFRESHED:LISTEN_KEY:%s", key)
+                return True
+            except Exception as e:
+                logger.fatal("<BINGX:REST>::REFRESH:LISTEN_KEY:%s", e)
+
+        try:
+            self._key = self.create_key()
+        except Exception as e:
+            logger.fatal("<BINGX:REST>::NEW:LISTEN_KEY:%s", e)
+            return False
+
+        self._ready_event.set()
+        logger.debug("<BINGX:REST>::NEW:LISTEN_KEY:%s", self._key)
+
+        return True
+
+    def refresh_due(self) -> float | None:
+        with self._lock:
+            if not self._user_count:
+                return None
+
+            return self._refresh_s if self.refresh_key() else self._retry_s
+
+    def start(self) -> None:
+        """Add a user, the first one creates the key and schedules its refresh.
+
+        A failed creation is retried by the service, `ready_event` is set
+        once a key is available.
+        """
+
+        with self._lock:
+            self._user_count += 1
+
+            if self._user_count > 1:
+                return
+
+            if self._signer is None:
+                self._signer = get_signer()
+
+            delay_s = self._refresh_s if self.refresh_key() else self._retry_s
+
+            service = self._service or get_listen_key_service()
+            service.schedule(refreshable=self, delay_s=delay_s)
+
+    def stop(self) -> None:
+        """Remove a user, the last one stops refreshing and drops the key."""
+
+        with self._lock:
+            if not self._user_count:
+                return
+
+            self._user_count -= 1
+
+            if self._user_count:
+                return
+
+            (self._service or get_listen_key_service()).cancel(refreshable=self)
+
+            self._key = None
+            self._ready_event.clear()
+
+            self._logger.debug("<BINGX:REST>::STOP_REFRESHING:WS_LISTEN_KEY")
+
+
+VALID_LISTEN_KEY_LOCK = Lock()
+_valid_listen_key_map: dict[str, ValidListenKey] = {}
 
-        logger.debug("<BINGX:REST>::NEW:WS_LISTEN_KEY:%s", self.locked_key)
 
-        while True:
-            self.refresh_locked_key()
+def get_valid_listen_key(signer: Signer | None = None) -> ValidListenKey:
+    """`ValidListenKey` shared by every streamer of the account of `signer`."""
 
-            if stop_event.is_set():
-                logger.debug(
-                    "<BINGX:REST>::STOP_REFRESHING:WS_LISTEN_KEY:%s",
-                    self._locked_key,
-                )
-                break
+    signer = signer or get_signer()
 
-            logger.debug("<BINGX:REST>::SLEEPING:INTERVAL_S:%s", refresh_s)
+    with VALID_LISTEN_KEY_LOCK:
+        valid_listen_key = _valid_listen_key_map.get(signer.api_key)
 
-            sleep(refresh_s)
+        if valid_listen_key is None:
+            valid_listen_key = ValidListenKey(signer=signer)
+            _valid_listen_key_map[signer.api_key] = valid_listen_key
 
-    def stop(self):
-        self._stop_event.set()
+        return valid_listen_key
 
 
 if __name__ == "__main__":
@@ -135,8 +218,6 @@ if __name__ == "__main__":
     valid_listen_key = ValidListenKey(refresh_s=10)
 
     with valid_listen_key as fresh_key:
-        locked = fresh_key.locked_key
-        if locked:
-            print(locked.get_key())
+        print(fresh_key.get_key())
 
         sleep(40)
@@ -0,0 +1,186 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from logging import getLogger, Logger
+from operator import attrgetter
+from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep, time_ns
+from typing import Any, Callable, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+__all__ = [
+    "backfill_kline",
+    "build_window_list",
+    "KlineBackfillCheckpoint",
+    "RateLimiter",
+]
+
+KlineType = TypeVar("KlineType")
+WindowType = tuple[int, int]
+
+
+class RateLimiter:
+    """Spread calls at `rate_per_s` per second at most, shared by threads."""
+
+    def __init__(self, rate_per_s: float) -> None:
+        self._interval_s = 1 / rate_per_s if rate_per_s > 0 else 0
+        self._lock = Lock()
+        self._next_s = monotonic()
+
+    def acquire(self) -> None:
+        if not self._interval_s:
+            return
+
+        with self._lock:
+            now_s = monotonic()
+            wait_s = self._next_s - now_s
+            self._next_s = max(self._next_s, now_s) + self._interval_s
+
+        if wait_s > 0:
+            sleep(wait_s)
+
+
+class KlineBackfillCheckpoint(BaseModel):
+    key: str
+    start_time: int
+    end_time: int
+    next_time: int
+
+    @classmethod
+    def load(cls, path: Path) -> "KlineBackfillCheckpoint | None":
+        if not path.exists():
+            return None
+
+        return cls.model_validate_json(path.read_text())
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(self.model_dump_json())
+        tmp_path.replace(path)
+
+
+def build_window_list(
+    start_time: int,
+    end_time: int,
+    interval: timedelta,
+    limit: int = 1000,
+) -> list[WindowType]:
+    """Split [start_time, end_time] in windows of `limit` candles at most."""
+
+    window_ms = int(interval.total_seconds() * 1000) * limit
+
+    return [
+        (window_start, min(window_start + window_ms - 1, end_time))
+        for window_start in range(start_time, end_time + 1, window_ms)
+    ]
+
+
+def backfill_kline(
+    fetch: Callable[[int, int], list[KlineType]],
+    start_time: int,
+    end_time: int | None,
+    interval: timedelta,
+    checkpoint_key: str = "",
+    checkpoint_path: Path | None = None,
+    get_time: Callable[[Any], int] = attrgetter("time"),
+    limit: int = 1000,
+    logger: Logger | None = None,
+    max_workers: int = 4,
+    rate_per_s: float = 10,
+) -> Iterator[KlineType]:
+    """Fetch [start_time, end_time] window by window, concurrently.
+
+    Candles are yielded in `time` order without duplicates as soon as the
+    oldest pending window is complete, at most `2 * max_workers` windows are
+    in memory.
+    With `checkpoint_path`, the progress is saved after each window handed to
+    the caller: calling again with the same `checkpoint_key` and `start_time`
+    resumes from there, up to the `end_time` of the checkpoint when `end_time`
+    is `None` (now otherwise, for a new backfill).
+
+    Args:
+        fetch (Callable[[int, int], list]):
+            Read the candles of one window: `fetch(window_start, window_end)`.
+        get_time (Callable):
+            Key used to sort and deduplicate the candles.
+        rate_per_s (float):
+            Maximum number of `fetch` calls per second (0 for no limit).
+    """
+
+    logger = logger or getLogger(name=__name__)
+    rate_limiter = RateLimiter(rate_per_s=rate_per_s)
+
+    checkpoint = None
+    if checkpoint_path is not None:
+        checkpoint = KlineBackfillCheckpoint.load(path=checkpoint_path)
+
+    if (
+        checkpoint is not None
+        and checkpoint.key == checkpoint_key
+        and checkpoint.start_time == start_time
+        and end_time in [None, checkpoint.end_time]
+    ):
+        logger.debug("<KLINE_BACKFILL>:RESUME:%s", checkpoint)
+    else:
+        checkpoint = KlineBackfillCheckpoint(
+            key=checkpoint_key,
+            start_time=start_time,
+            end_time=time_ns() // 1_000_000 if end_time is None else end_time,
+            next_time=start_time,
+        )
+
+    end_time = checkpoint.end_time
+
+    window_list = build_window_list(
+        start_time=checkpoint.next_time,
+        end_time=end_time,
+        interval=interval,
+        limit=limit,
+    )
+
+    def fetch_window(window: WindowType) -> list[KlineType]:
+        rate_limiter.acquire()
+        kline_list = fetch(*window)
+        logger.debug("<KLINE_BACKFILL>:FETCHED:%s:%s", window, len(kline_list))
+        return sorted(kline_list, key=get_time)
+
+    last_time = checkpoint.next_time - 1
+    pending: deque[tuple[WindowType, Future[list[KlineType]]]] = deque()
+    window_iterator = iter(window_list)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="kline_backfill",
+    ) as executor:
+        try:
+            for window in window_iterator:
+                pending.append((window, executor.submit(fetch_window, window)))
+                if len(pending) >= 2 * max_workers:
+                    break
+
+            while pending:
+                window, future = pending.popleft()
+
+                for kline in future.result():
+                    kline_time = get_time(kline)
+                    if last_time < kline_time <= end_time:
+                        last_time = kline_time
+                        yield kline
+
+                if checkpoint_path is not None:
+                    checkpoint.next_time = window[1] + 1
+                    checkpoint.save(path=checkpoint_path)
+
+                next_window = next(window_iterator, None)
+                if next_window is not None:
+                    pending.append(
+                        (next_window, executor.submit(fetch_window, next_window))
+                    )
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    if checkpoint_path is not None:
+        checkpoint_path.unlink(missing_ok=True)
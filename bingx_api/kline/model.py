@@ -0,0 +1,196 @@
+from operator import itemgetter
+from typing import Any, Callable, Iterable, NamedTuple, TYPE_CHECKING
+
+import numpy as np
+
+# orjson when installed, the standard library otherwise.
+loads: Callable[[bytes | str], Any]
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+if TYPE_CHECKING:
+    import polars as pl
+
+__all__ = [
+    "COLUMN_DTYPE_MAP",
+    "build_empty_kline_columns",
+    "build_kline_columns",
+    "decode_future_kline_columns",
+    "decode_spot_kline_columns",
+    "KlineColumns",
+    "merge_kline_columns",
+    "slice_kline_columns",
+    "to_polars",
+]
+
+FUTURE_PRICE_GETTER = itemgetter("open", "high", "low", "close", "volume")
+# Spot rows: [open_time, open, high, low, close, filled_price, time, volume]
+SPOT_PRICE_INDEX_LIST = [1, 2, 3, 4, 7]
+
+COLUMN_DTYPE_MAP = {
+    "time": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+
+
+class KlineColumns(NamedTuple):
+    """Candles stored column by column, sorted by `time` (open time, in ms)."""
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return len(self.time)
+
+
+def build_empty_kline_columns() -> KlineColumns:
+    return KlineColumns(
+        **{name: np.empty(0, dtype=dtype) for name, dtype in COLUMN_DTYPE_MAP.items()}
+    )
+
+
+def build_kline_columns(
+    kline_list: Iterable, time_attribute: str = "time"
+) -> KlineColumns:
+    """From `OHLCV` (future) or `KLineEntry` (spot, `time_attribute="open_time"`)."""
+
+    kline_list = list(kline_list)
+
+    return KlineColumns(
+        time=np.fromiter(
+            (getattr(kline, time_attribute) for kline in kline_list),
+            dtype=np.int64,
+            count=len(kline_list),
+        ),
+        open=np.fromiter((k.open for k in kline_list), dtype=np.float64),
+        high=np.fromiter((k.high for k in kline_list), dtype=np.float64),
+        low=np.fromiter((k.low for k in kline_list), dtype=np.float64),
+        close=np.fromiter((k.close for k in kline_list), dtype=np.float64),
+        volume=np.fromiter((k.volume for k in kline_list), dtype=np.float64),
+    )
+
+
+def load_kline_data(content: bytes | str) -> list:
+    payload = loads(content)
+
+    if payload.get("code") != 0:
+        raise ValueError(
+            "code: " + str(payload.get("code")) + "; msg: " + payload.get("msg")
+        )
+
+    return payload.get("data") or []
+
+
+def build_price_columns(price_table: np.ndarray) -> tuple[np.ndarray, ...]:
+    """(open, high, low, close, volume) rows of one contiguous block."""
+
+    return tuple(np.ascontiguousarray(price_table.reshape(-1, 5).T))
+
+
+def decode_future_kline_columns(content: bytes | str) -> KlineColumns:
+    """`ResponseKline` (future) body to columns, without any `OHLCV` model.
+
+    Candles keep the order of the response.
+    """
+
+    data = load_kline_data(content=content)
+
+    open_, high, low, close, volume = build_price_columns(
+        np.array(list(map(FUTURE_PRICE_GETTER, data)), dtype=np.float64)
+    )
+
+    return KlineColumns(
+        time=np.fromiter(
+            (entry["time"] for entry in data), dtype=np.int64, count=len(data)
+        ),
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+    )
+
+
+def decode_spot_kline_columns(content: bytes | str) -> KlineColumns:
+    """`ResponseKline` (spot) body to columns, without any `KLineEntry` model.
+
+    `time` is the candle open time, as with `time_attribute="open_time"`.
+    """
+
+    table = np.array(load_kline_data(content=content), dtype=np.float64)
+
+    if not table.size:
+        return build_empty_kline_columns()
+
+    if table.ndim != 2 or table.shape[1] != 8:
+        raise ValueError(f"Invalid data shape, expected (n, 8): {table.shape}")
+
+    open_, high, low, close, volume = build_price_columns(
+        table[:, SPOT_PRICE_INDEX_LIST]
+    )
+
+    return KlineColumns(
+        time=table[:, 0].astype(np.int64),
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+    )
+
+
+def to_polars(kline_columns: KlineColumns) -> "pl.DataFrame":
+    import polars as pl
+
+    return pl.DataFrame(kline_columns._asdict())
+
+
+def merge_kline_columns(*kline_columns_list: KlineColumns) -> KlineColumns:
+    """Concatenate, sort by `time` and drop duplicated candles.
+
+    On duplicated `time` the candle of the last argument wins: fresher data
+    replaces the candle which was still forming.
+    """
+
+    time = np.concatenate([c.time for c in kline_columns_list])
+    order = np.argsort(time, kind="stable")
+    time = time[order]
+
+    keep = np.ones(len(time), dtype=bool)
+    keep[:-1] = time[1:] != time[:-1]
+    index = order[keep]
+
+    return KlineColumns(
+        **{
+            name: np.concatenate([getattr(c, name) for c in kline_columns_list])[index]
+            for name in COLUMN_DTYPE_MAP
+        }
+    )
+
+
+def slice_kline_columns(
+    kline_columns: KlineColumns,
+    start_time: int | None = None,
+    end_time: int | None = None,
+) -> KlineColumns:
+    """Views (no copy) on the candles with `start_time <= time <= end_time`."""
+
+    time = kline_columns.time
+    start = 0 if start_time is None else int(np.searchsorted(time, start_time, "left"))
+    end = (
+        len(time) if end_time is None else int(np.searchsorted(time, end_time, "right"))
+    )
+
+    return KlineColumns(*(column[start:end] for column in kline_columns))
@@ -0,0 +1,350 @@
+import json
+import os
+from datetime import datetime
+from logging import getLogger, Logger
+from pathlib import Path
+from threading import Lock
+from typing import Literal
+
+import numpy as np
+
+from robot_one.api.bingx.future.rest import read_kline as future_read_kline
+from robot_one.api.bingx.future.rest.read_kline import Interval
+from robot_one.api.bingx.kline.model import (
+    build_empty_kline_columns,
+    build_kline_columns,
+    COLUMN_DTYPE_MAP,
+    KlineColumns,
+    merge_kline_columns,
+    slice_kline_columns,
+)
+from robot_one.api.bingx.spot.rest import read_kline as spot_read_kline
+
+__all__ = [
+    "align_open_time",
+    "fetch_kline_columns",
+    "get_interval_ms",
+    "KlineStore",
+    "MarketType",
+    "merge_range_list",
+    "subtract_range_list",
+]
+
+MarketType = Literal["future", "spot"]
+RangeType = tuple[int, int]
+
+COVERAGE_FILENAME = "coverage.json"
+# Weekly candles open on Monday 00:00 UTC, the epoch was a Thursday.
+WEEK_OFFSET_MS = 4 * 24 * 3600 * 1000
+
+
+def get_interval_ms(interval: Interval) -> int:
+    """Fixed length of an `interval` candle, months have none."""
+
+    if interval is Interval.MONTHS_1:
+        raise ValueError("KlineStore doesn't support 1M: months vary in length.")
+
+    return int(interval.to_timedelta().total_seconds() * 1000)
+
+
+def align_open_time(time: int, interval: Interval) -> int:
+    """Open time of the `interval` candle containing `time`."""
+
+    interval_ms = get_interval_ms(interval=interval)
+    offset_ms = WEEK_OFFSET_MS if interval is Interval.WEEKS_1 else 0
+
+    return time - (time - offset_ms) % interval_ms
+
+
+def merge_range_list(range_list: list[RangeType], step: int = 1) -> list[RangeType]:
+    """Merge overlapping or adjacent (closer than `step`) inclusive ranges."""
+
+    merged_list: list[RangeType] = []
+
+    for start, end in sorted(range_list):
+        if merged_list and start <= merged_list[-1][1] + step:
+            merged_list[-1] = (merged_list[-1][0], max(merged_list[-1][1], end))
+        else:
+            merged_list.append((start, end))
+
+    return merged_list
+
+
+def subtract_range_list(
+    start: int,
+    end: int,
+    range_list: list[RangeType],
+    step: int = 1,
+) -> list[RangeType]:
+    """Parts of the inclusive range [start, end] not covered by `range_list`."""
+
+    missing_list: list[RangeType] = []
+    cursor = start
+
+    for covered_start, covered_end in merge_range_list(range_list, step=step):
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            missing_list.append((cursor, covered_start - step))
+        cursor = covered_end + step
+
+    if cursor <= end:
+        missing_list.append((cursor, end))
+
+    return missing_list
+
+
+def fetch_kline_columns(
+    market: MarketType,
+    symbol: str,
+    interval: Interval,
+    start_time: int,
+    end_time: int,
+    limit: int = 1000,
+    max_workers: int = 4,
+) -> KlineColumns:
+    """Read [start_time, end_time] from the REST API, `max_workers` calls at once."""
+
+    if market == "future":
+        return build_kline_columns(
+            kline_list=future_read_kline.query_kline_backfill(
+                end_time=end_time,
+                interval=interval,
+                limit=limit,
+                max_workers=max_workers,
+                start_time=start_time,
+                symbol=symbol,
+            ),
+        )
+
+    return build_kline_columns(
+        kline_list=spot_read_kline.query_kline_backfill(
+            end_time=end_time,
+            interval=spot_read_kline.Interval(interval.value),
+            limit=limit,
+            max_workers=max_workers,
+            start_time=start_time,
+            symbol=symbol,
+        ),
+        time_attribute="open_time",
+    )
+
+
+class KlineStore:
+    """On-disk candles, one NumPy file per column, memory-mapped on read.
+
+    Layout: `<root>/<market>/<symbol>/<interval>/<column>.npy` plus a
+    `coverage.json` listing the time ranges (candle open times, in ms)
+    already fetched, so `sync` only requests the gaps and the tail.
+    Only closed candles are marked as covered: the candle still forming is
+    fetched again on the next `sync`.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        logger: Logger | None = None,
+    ) -> None:
+        self._root = Path(root)
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+
+        self._lock = Lock()
+        self._mmap_cache: dict[Path, tuple[int, KlineColumns]] = {}
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    def build_path(self, market: MarketType, symbol: str, interval: Interval) -> Path:
+        return self._root / market / symbol / interval.value
+
+    def read_coverage(
+        self,
+        market: MarketType,
+        symbol: str,
+        interval: Interval,
+    ) -> list[RangeType]:
+        path = self.build_path(market=market, symbol=symbol, interval=interval)
+        coverage_path = path / COVERAGE_FILENAME
+
+        if not coverage_path.exists():
+            return []
+
+        return [(start, end) for start, end in json.loads(coverage_path.read_text())]
+
+    def read(
+        self,
+        market: MarketType,
+        symbol: str,
+        interval: Interval,
+        start_time: int | None = None,
+        end_time: int | None = None,
+    ) -> KlineColumns:
+        """Zero-copy views on the memory-mapped columns."""
+
+        path = self.build_path(market=market, symbol=symbol, interval=interval)
+        coverage_path = path / COVERAGE_FILENAME
+
+        if not coverage_path.exists():
+            return build_empty_kline_columns()
+
+        version = coverage_path.stat().st_mtime_ns
+        cached = self._mmap_cache.get(path)
+
+        if cached is not None and cached[0] == version:
+            kline_columns = cached[1]
+        else:
+            kline_columns = KlineColumns(
+                **{
+                    name: np.load(path / f"{name}.npy", mmap_mode="r")
+                    for name in COLUMN_DTYPE_MAP
+                }
+            )
+            self._mmap_cache[path] = (version, kline_columns)
+
+        return slice_kline_columns(
+            kline_columns=kline_columns,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def find_missing_range_list(
+        self,
+        market: MarketType,
+        symbol: str,
+        interval: Interval,
+        start_time: int,
+        end_time: int,
+    ) -> list[RangeType]:
+        interval_ms = get_interval_ms(interval=interval)
+        start_time = align_open_time(time=start_time, interval=interval)
+        end_time = align_open_time(time=end_time, interval=interval)
+
+        return subtract_range_list(
+            start=start_time,
+            end=end_time,
+            range_list=self.read_coverage(market, symbol, interval),
+            step=interval_ms,
+        )
+
+    def write(
+        self,
+        market: MarketType,
+        symbol: str,
+        interval: Interval,
+        kline_columns: KlineColumns,
+        coverage: list[RangeType],
+    ) -> None:
+        """Replace the files, the coverage is written last."""
+
+        path = self.build_path(market=market, symbol=symbol, interval=interval)
+        path.mkdir(parents=True, exist_ok=True)
+
+        for name, dtype in COLUMN_DTYPE_MAP.items():
+            tmp_path = path / f"{name}.npy.tmp"
+            with tmp_path.open(mode="wb") as f:
+                np.save(
+                    f, np.ascontiguousarray(getattr(kline_columns, name), dtype=dtype)
+                )
+            os.replace(tmp_path, path / f"{name}.npy")
+
+        tmp_path = path / f"{COVERAGE_FILENAME}.tmp"
+        tmp_path.write_text(json.dumps(coverage))
+        os.replace(tmp_path, path / COVERAGE_FILENAME)
+
+    def sync(
+        self,
+        market: MarketType,
+        symbol: str,
+        interval: Interval,
+        start_time: int,
+        end_time: int | None = None,
+    ) -> KlineColumns:
+        """Fetch what is missing in [start_time, end_time] then read it back."""
+
+        interval_ms = get_interval_ms(interval=interval)
+        now_ms = int(datetime.now().timestamp() * 1000)
+        end_time = now_ms if end_time is None else end_time
+
+        with self._lock:
+            missing_range_list = self.find_missing_range_list(
+                market=market,
+                symbol=symbol,
+                interval=interval,
+                start_time=start_time,
+                end_time=end_time,
+            )
+
+            if missing_range_list:
+                self._logger.debug(
+                    "<KLINE_STORE>:SYNC:%s:%s:%s:MISSING:%s",
+                    market,
+                    symbol,
+                    interval.value,
+                    missing_range_list,
+                )
+
+                fetched_list = [
+                    fetch_kline_columns(
+                        market=market,
+                        symbol=symbol,
+                        interval=interval,
+                        start_time=missing_start,
+                        end_time=missing_end,
+                    )
+                    for missing_start, missing_end in missing_range_list
+                ]
+                kline_columns = merge_kline_columns(
+                    self.read(market=market, symbol=symbol, interval=interval),
+                    *fetched_list,
+                )
+
+                # THE CANDLE STILL FORMING ISN'T MARKED AS COVERED
+                closed_end = (
+                    align_open_time(time=now_ms, interval=interval) - interval_ms
+                )
+                covered_list = [
+                    (missing_start, min(missing_end, closed_end))
+                    for missing_start, missing_end in missing_range_list
+                    if missing_start <= closed_end
+                ]
+                coverage = merge_range_list(
+                    self.read_coverage(market, symbol, interval) + covered_list,
+                    step=interval_ms,
+                )
+
+                self.write(
+                    market=market,
+                    symbol=symbol,
+                    interval=interval,
+                    kline_columns=kline_columns,
+                    coverage=coverage,
+                )
+
+        return self.read(
+            market=market,
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+
+if __name__ == "__main__":
+    from datetime import timedelta
+
+    store = KlineStore(root=Path("kline_store"))
+    result = store.sync(
+        market="future",
+        symbol="BTC-USDT",
+        interval=Interval.HOURS_1,
+        start_time=int((datetime.now() - timedelta(days=30)).timestamp() * 1000),
+    )
+
+    print("result:", result.size, result.close[-5:])
@@ -0,0 +1,680 @@
+import hmac
+import math
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from logging import getLogger, Logger
+from threading import Lock, Thread
+from time import sleep, time_ns
+from typing import Callable
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from orjson import dumps
+
+from robot_one.api.bingx.api_config import get_api_config
+
+__all__ = (
+    "INTERVAL_MS_MAP",
+    "MockRestServer",
+)
+
+INTERVAL_MS_MAP = {
+    "m": 60_000,
+    "h": 3_600_000,
+    "d": 86_400_000,
+    "w": 604_800_000,
+    "M": 2_592_000_000,
+}
+
+ParamMap = dict[str, str]
+Handler = Callable[[ParamMap], dict]
+
+
+def get_time_ms() -> int:
+    return time_ns() // 1_000_000
+
+
+def parse_interval_ms(interval: str) -> int:
+    return int(interval[:-1]) * INTERVAL_MS_MAP[interval[-1]]
+
+
+class MockRestServer:
+    """Local stand-in of the BingX REST API, for offline load tests.
+
+    Signed endpoints check the `X-BX-APIKEY` header, the `timestamp`
+    against `recv_window_ms` and the HMAC-SHA256 `signature` of the query
+    string, as `get_signed_request` builds it. Failures answer HTTP 200 with
+    a non-zero `code`, like BingX.
+
+    Orders live in memory: LIMIT orders stay open until canceled, MARKET
+    orders are filled at once and move the futures positions. Klines and
+    contracts are generated for `contract_count` symbols, `S0000-USDT`...
+
+    Point the client at it with `set_transport(Transport(base_url=url))`
+    (`AsyncTransport` for asyncio) or the `BINGX_API_BASE_URL` variable.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        contract_count: int = 10,
+        host: str = "127.0.0.1",
+        latency_s: float = 0.0,
+        logger: Logger | None = None,
+        port: int = 0,
+        recv_window_ms: int = 5000,
+    ) -> None:
+        """
+        Args:
+            api_key (str, optional):
+                Expected `X-BX-APIKEY`, defaults to the client configuration.
+            api_secret (str, optional):
+                Signing secret, defaults to the client configuration.
+            latency_s (float):
+                Delay added to every response, to model the network.
+        """
+
+        if api_key is None or api_secret is None:
+            api_config = get_api_config()
+            api_key = api_key or api_config.API_KEY
+            api_secret = api_secret or api_config.API_SECRET
+
+        self._api_key = api_key
+        self._api_secret = api_secret.encode("utf-8")
+        self._host = host
+        self._latency_s = latency_s
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._port = port
+        self._recv_window_ms = recv_window_ms
+        self._symbol_list = [f"S{i:04d}-USDT" for i in range(contract_count)]
+
+        self._count_lock = Lock()
+        self._lock = Lock()
+        self._order_id_iterator = count(1_800_000_000_000_000_000)
+        self._future_order_map: dict[int, dict] = {}
+        self._position_map: dict[tuple[str, str], dict] = {}
+        self._spot_order_map: dict[int, dict] = {}
+        self._http_server: ThreadingHTTPServer | None = None
+        self._thread: Thread | None = None
+
+        self._route_map: dict[tuple[str, str], tuple[bool, Handler]] = {
+            ("GET", "/openApi/swap/v2/quote/contracts"): (
+                False,
+                self.read_future_contract_list,
+            ),
+            ("GET", "/openApi/swap/v3/quote/klines"): (False, self.read_future_kline),
+            ("GET", "/openApi/swap/v2/user/positions"): (
+                True,
+                self.read_position_list,
+            ),
+            ("GET", "/openApi/swap/v2/user/balance"): (True, self.read_balance),
+            ("GET", "/openApi/swap/v2/trade/leverage"): (True, self.read_leverage),
+            ("POST", "/openApi/swap/v2/trade/order"): (True, self.create_future_order),
+            ("GET", "/openApi/swap/v2/trade/order"): (True, self.read_future_order),
+            ("DELETE", "/openApi/swap/v2/trade/order"): (
+                True,
+                self.delete_future_order,
+            ),
+            ("GET", "/openApi/swap/v2/trade/openOrders"): (
+                True,
+                self.read_future_open_order_list,
+            ),
+            ("GET", "/openApi/spot/v1/common/symbols"): (
+                False,
+                self.read_spot_contract_list,
+            ),
+            ("GET", "/openApi/spot/v2/market/kline"): (False, self.read_spot_kline),
+            ("POST", "/openApi/spot/v1/trade/order"): (True, self.create_spot_order),
+            ("GET", "/openApi/spot/v1/trade/query"): (True, self.read_spot_order),
+            ("POST", "/openApi/spot/v1/trade/cancelOrders"): (
+                True,
+                self.delete_spot_order_list,
+            ),
+            ("GET", "/openApi/spot/v1/trade/openOrders"): (
+                True,
+                self.read_spot_open_order_list,
+            ),
+        }
+
+        self.error_count = 0
+        self.request_count = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def symbol_list(self) -> list[str]:
+        return self._symbol_list
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def get_price(self, symbol: str, time: int = 0) -> float:
+        index = self._symbol_list.index(symbol) if symbol in self._symbol_list else 0
+        return round((10.0 + index) * (1 + 0.01 * math.sin(time / 3_600_000)), 4)
+
+    def check_signature(
+        self,
+        api_key: str | None,
+        param_map: ParamMap,
+        query_string: str,
+    ) -> dict | None:
+        """Error response of an invalid signed request, `None` when valid."""
+
+        payload, _, signature = query_string.rpartition("&signature=")
+        expected_signature = hmac.new(
+            key=self._api_secret,
+            msg=unquote(payload).encode("utf-8"),
+            digestmod=sha256,
+        ).hexdigest()
+
+        if api_key != self._api_key:
+            return {"code": 100413, "msg": "Incorrect apiKey"}
+
+        if not hmac.compare_digest(signature, expected_signature):
+            return {"code": 100001, "msg": "Signature verification failed"}
+
+        timestamp = param_map.get("timestamp", "")
+        if (
+            not timestamp.isdigit()
+            or abs(get_time_ms() - int(timestamp)) > self._recv_window_ms
+        ):
+            return {"code": 100421, "msg": "Null timestamp or timestamp mismatch"}
+
+        return None
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        api_key: str | None,
+    ) -> tuple[int, bytes]:
+        """HTTP status and body of one request."""
+
+        url_split = urlsplit(path)
+        param_map = {k: v[0] for k, v in parse_qs(url_split.query).items()}
+        route = self._route_map.get((method, url_split.path))
+
+        with self._count_lock:
+            self.request_count += 1
+
+        if self._latency_s:
+            sleep(self._latency_s)
+
+        if route is None:
+            with self._count_lock:
+                self.error_count += 1
+            return 404, dumps({"code": 100400, "msg": "this api is not exist"})
+
+        signed, handler = route
+
+        error = (
+            self.check_signature(
+                api_key=api_key,
+                param_map=param_map,
+                query_string=url_split.query,
+            )
+            if signed
+            else None
+        )
+
+        if error is None:
+            with self._lock:
+                response = handler(param_map)
+        else:
+            response = error
+
+        if response.get("code"):
+            with self._count_lock:
+                self.error_count += 1
+
+        return 200, dumps(response)
+
+    def build_future_kline_list(self, param_map: ParamMap) -> list[tuple[int, float]]:
+        interval_ms = parse_interval_ms(interval=param_map.get("interval", "1h"))
+        limit = min(int(param_map.get("limit", 500)), 1440)
+        end_time = int(param_map.get("endTime", get_time_ms()))
+        start_time = int(param_map.get("startTime", end_time - limit * interval_ms))
+
+        first_time = -(-start_time // interval_ms) * interval_ms
+        time_list = list(range(first_time, end_time + 1, interval_ms))[:limit]
+
+        return [(time, self.get_price(param_map["symbol"], time)) for time in time_list]
+
+    def read_future_kline(self, param_map: ParamMap) -> dict:
+        data = [
+            {
+                "open": str(price),
+                "close": str(round(price * 1.001, 4)),
+                "high": str(round(price * 1.002, 4)),
+                "low": str(round(price * 0.998, 4)),
+                "volume": "1000.00",
+                "time": time,
+            }
+            for time, price in reversed(self.build_future_kline_list(param_map))
+        ]
+
+        return {"code": 0, "msg": "", "data": data}
+
+    def read_spot_kline(self, param_map: ParamMap) -> dict:
+        interval_ms = parse_interval_ms(interval=param_map.get("interval", "1h"))
+        data = [
+            [
+                time,
+                price,
+                round(price * 1.002, 4),
+                round(price * 0.998, 4),
+                round(price * 1.001, 4),
+                1000.0,
+                time + interval_ms - 1,
+                round(price * 1000.0, 4),
+            ]
+            for time, price in reversed(self.build_future_kline_list(param_map))
+        ]
+
+        return {"code": 0, "timestamp": get_time_ms(), "data": data}
+
+    def read_future_contract_list(self, param_map: ParamMap) -> dict:
+        data = [
+            {
+                "contractId": 100 + index,
+                "symbol": symbol,
+                "size": "0.0001",
+                "quantityPrecision": 4,
+                "pricePrecision": 4,
+                "feeRate": 0.0005,
+                "tradeMinLimit": 1,
+                "currency": "USDT",
+                "asset": symbol.split("-")[0],
+                "status": 1,
+                "apiStateOpen": "true",
+                "apiStateClose": "true",
+            }
+            for index, symbol in enumerate(self._symbol_list)
+        ]
+
+        return {"code": 0, "msg": "", "data": data}
+
+    def read_spot_contract_list(self, param_map: ParamMap) -> dict:
+        symbol_list = [
+            {
+                "symbol": symbol,
+                "minQty": 0.1,
+                "maxQty": 100000.0,
+                "minNotional": 5.0,
+                "maxNotional": 20000.0,
+                "status": 1,
+                "tickSize": 0.0001,
+                "stepSize": 0.1,
+                "apiStateSell": True,
+                "apiStateBuy": True,
+                "timeOnline": 1700000000000,
+            }
+            for symbol in self._symbol_list
+        ]
+
+        return {"code": 0, "msg": "", "debugMsg": "", "data": {"symbols": symbol_list}}
+
+    def read_balance(self, param_map: ParamMap) -> dict:
+        balance = {
+            "userId": "0",
+            "asset": "USDT",
+            "balance": "10000.0000",
+            "equity": "10000.0000",
+            "unrealizedProfit": "0.0000",
+            "realisedProfit": "0.0000",
+            "availableMargin": "10000.0000",
+            "usedMargin": "0.0000",
+            "freezedMargin": "0.0000",
+        }
+
+        return {"code": 0, "msg": "", "data": {"balance": balance}}
+
+    def read_leverage(self, param_map: ParamMap) -> dict:
+        leverage = {
+            "longLeverage": 10,
+            "shortLeverage": 10,
+            "maxLongLeverage": 125,
+            "maxShortLeverage": 125,
+        }
+
+        return {"code": 0, "msg": "", "data": leverage}
+
+    def read_position_list(self, param_map: ParamMap) -> dict:
+        symbol = param_map.get("symbol")
+        data = [
+            position
+            for position in self._position_map.values()
+            if symbol is None or position["symbol"] == symbol
+        ]
+
+        return {"code": 0, "msg": "", "data": data}
+
+    def update_position(self, order: dict) -> None:
+        symbol = order["symbol"]
+        position_side = order["positionSide"]
+        quantity = float(order["executedQty"])
+        price = float(order["avgPrice"])
+
+        if (order["side"] == "SELL") == (position_side == "LONG"):
+            quantity = -quantity
+
+        position = self._position_map.setdefault(
+            (symbol, position_side),
+            {
+                "positionId": next(self._order_id_iterator),
+                "symbol": symbol,
+                "currency": "USDT",
+                "positionAmt": "0",
+                "availableAmt": "0",
+                "positionSide": position_side,
+                "isolated": True,
+                "avgPrice": "0",
+                "initialMargin": "0",
+                "leverage": 10,
+                "unrealizedProfit": "0",
+                "realisedProfit": "0",
+                "liquidationPrice": 0,
+            },
+        )
+
+        amount = float(position["positionAmt"]) + quantity
+        if amount <= 0:
+            self._position_map.pop((symbol, position_side))
+            return
+
+        position["positionAmt"] = position["availableAmt"] = str(amount)
+        position["avgPrice"] = str(price)
+        position["initialMargin"] = str(round(amount * price / 10, 4))
+
+    def create_future_order(self, param_map: ParamMap) -> dict:
+        symbol = param_map["symbol"]
+        type = param_map["type"]
+        time = get_time_ms()
+        price = float(param_map.get("price") or self.get_price(symbol, time))
+        filled = type == "MARKET"
+        order_id = next(self._order_id_iterator)
+
+        order = {
+            "advanceAttr": 0,
+            "avgPrice": str(price) if filled else "0.0000",
+            "clientOrderId": param_map.get("clientOrderID", ""),
+            "commission": "0",
+            "cumQuote": "0",
+            "executedQty": param_map["quantity"] if filled else "0",
+            "leverage": "10X",
+            "onlyOnePosition": False,
+            "orderId": order_id,
+            "orderType": "",
+            "origQty": param_map["quantity"],
+            "positionID": 0,
+            "positionSide": param_map.get("positionSide", "LONG"),
+            "postOnly": False,
+            "price": str(price),
+            "profit": "0.0000",
+            "reduceOnly": False,
+            "side": param_map["side"],
+            "status": "FILLED" if filled else "NEW",
+            "stopGuaranteed": False,
+            "stopLossEntrustPrice": 0,
+            "stopPrice": param_map.get("stopPrice", ""),
+            "symbol": symbol,
+            "takeProfitEntrustPrice": 0,
+            "time": time,
+            "trailingStopDistance": 0,
+            "trailingStopRate": 0,
+            "triggerOrderId": 0,
+            "type": type,
+            "updateTime": time,
+            "workingType": param_map.get("workingType", "MARK_PRICE"),
+        }
+        self._future_order_map[order_id] = order
+
+        if filled:
+            self.update_position(order=order)
+
+        created_order = {
+            "symbol": symbol,
+            "orderId": order["orderId"],
+            "side": order["side"],
+            "positionSide": order["positionSide"],
+            "type": type,
+            "clientOrderID": order["clientOrderId"],
+            "price": order["price"],
+            "quantity": order["origQty"],
+            "workingType": order["workingType"],
+        }
+
+        return {"code": 0, "msg": "", "data": {"order": created_order}}
+
+    def find_future_order(self, param_map: ParamMap) -> dict | None:
+        order_id = param_map.get("orderId")
+        if order_id is not None:
+            return self._future_order_map.get(int(order_id))
+
+        client_order_id = param_map.get("clientOrderId")
+        for order in self._future_order_map.values():
+            if client_order_id and order["clientOrderId"] == client_order_id:
+                return order
+
+        return None
+
+    def read_future_order(self, param_map: ParamMap) -> dict:
+        order = self.find_future_order(param_map=param_map)
+
+        if order is None:
+            return {"code": 80016, "msg": "order not exist"}
+
+        return {"code": 0, "msg": "", "data": {"order": order}}
+
+    def delete_future_order(self, param_map: ParamMap) -> dict:
+        order = self.find_future_order(param_map=param_map)
+
+        if order is None or order["status"] != "NEW":
+            return {"code": 80018, "msg": "order is already filled or canceled"}
+
+        order["status"] = "CANCELLED"
+        order["updateTime"] = get_time_ms()
+
+        return {"code": 0, "msg": "", "data": {"order": order}}
+
+    def read_future_open_order_list(self, param_map: ParamMap) -> dict:
+        symbol = param_map.get("symbol")
+        order_list = [
+            order
+            for order in self._future_order_map.values()
+            if order["status"] == "NEW" and symbol in (None, order["symbol"])
+        ]
+
+        return {"code": 0, "msg": "", "data": {"orders": order_list}}
+
+    def create_spot_order(self, param_map: ParamMap) -> dict:
+        symbol = param_map["symbol"]
+        type = param_map["type"]
+        time = get_time_ms()
+        price = float(param_map.get("price") or self.get_price(symbol, time))
+        quantity = float(param_map["quantity"])
+        filled = type == "MARKET"
+        order_id = next(self._order_id_iterator)
+
+        order = {
+            "symbol": symbol,
+            "orderId": order_id,
+            "price": price,
+            "StopPrice": float(param_map.get("stopPrice", 0)),
+            "origQty": quantity,
+            "executedQty": quantity if filled else 0.0,
+            "cummulativeQuoteQty": round(price * quantity, 8) if filled else 0.0,
+            "status": "FILLED" if filled else "NEW",
+            "type": type,
+            "side": param_map["side"],
+            "time": time,
+            "updateTime": time,
+            "origQuoteOrderQty": float(param_map.get("quoteOrderQty", 0)),
+            "fee": 0.0,
+            "clientOrderID": param_map.get("newClientOrderId", ""),
+        }
+        self._spot_order_map[order_id] = order
+
+        created_order = {
+            "symbol": symbol,
+            "orderId": order["orderId"],
+            "transactTime": time,
+            "price": price,
+            "origQty": quantity,
+            "executedQty": order["executedQty"],
+            "cummulativeQuoteQty": order["cummulativeQuoteQty"],
+            "status": order["status"],
+            "type": type,
+            "side": order["side"],
+            "clientOrderID": order["clientOrderID"],
+        }
+
+        return {"code": 0, "msg": "", "debugMsg": "", "data": created_order}
+
+    def read_spot_order(self, param_map: ParamMap) -> dict:
+        order = self._spot_order_map.get(int(param_map.get("orderId", 0)))
+
+        if order is None:
+            return {"code": 100404, "msg": "order not exist"}
+
+        return {"code": 0, "msg": "", "data": order}
+
+    def delete_spot_order_list(self, param_map: ParamMap) -> dict:
+        order_id_list = [int(i) for i in param_map.get("orderIds", "").split(",") if i]
+        order_list = []
+
+        for order_id in order_id_list:
+            order = self._spot_order_map.get(order_id)
+
+            if order is None or order["status"] != "NEW":
+                return {
+                    "code": 100404,
+                    "msg": f"order not exist: {order_id}",
+                    "debugMsg": "",
+                }
+
+            order_list.append(order)
+
+        deleted_order_list = []
+        for order in order_list:
+            order["status"] = "CANCELED"
+            order["updateTime"] = get_time_ms()
+            deleted_order_list.append(
+                {
+                    "symbol": order["symbol"],
+                    "orderId": order["orderId"],
+                    "price": order["price"],
+                    "stopPrice": order["StopPrice"],
+                    "origQty": order["origQty"],
+                    "executedQty": order["executedQty"],
+                    "cummulativeQuoteQty": order["cummulativeQuoteQty"],
+                    "status": order["status"],
+                    "type": order["type"],
+                    "side": order["side"],
+                    "clientOrderID": order["clientOrderID"],
+                }
+            )
+
+        return {
+            "code": 0,
+            "msg": "",
+            "debugMsg": "",
+            "data": {"orders": deleted_order_list},
+        }
+
+    def read_spot_open_order_list(self, param_map: ParamMap) -> dict:
+        symbol = param_map.get("symbol")
+        order_list = [
+            order
+            for order in self._spot_order_map.values()
+            if order["status"] == "NEW" and symbol in (None, order["symbol"])
+        ]
+
+        return {"code": 0, "msg": "", "data": {"orders": order_list}}
+
+    def build_handler_class(self) -> type[BaseHTTPRequestHandler]:
+        mock_server = self
+
+        class MockRequestHandler(BaseHTTPRequestHandler):
+            # Headers and body are written apart, keep-alive needs TCP_NODELAY.
+            disable_nagle_algorithm = True
+            protocol_version = "HTTP/1.1"
+
+            def respond(self) -> None:
+                content_length = int(self.headers.get("Content-Length") or 0)
+                if content_length:
+                    self.rfile.read(content_length)
+
+                status, body = mock_server.handle(
+                    method=self.command,
+                    path=self.path,
+                    api_key=self.headers.get("X-BX-APIKEY"),
+                )
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_DELETE = do_GET = do_POST = respond
+
+            def log_message(self, format: str, *args) -> None:
+                mock_server._logger.debug("<MOCK:REST>:" + format, *args)
+
+        return MockRequestHandler
+
+    def start(self) -> None:
+        """Serve from a daemon thread, return once `url` accepts connections."""
+
+        http_server = ThreadingHTTPServer(
+            (self._host, self._port),
+            self.build_handler_class(),
+        )
+        http_server.daemon_threads = True
+        self._http_server = http_server
+        self._port = http_server.server_address[1]
+
+        thread = Thread(target=http_server.serve_forever, daemon=True)
+        self._thread = thread
+        thread.start()
+
+    def stop(self) -> None:
+        http_server = self._http_server
+
+        if http_server is not None:
+            http_server.shutdown()
+            http_server.server_close()
+
+
+if __name__ == "__main__":
+    from robot_one.api.bingx.future.rest.core import set_transport, Transport
+    from robot_one.api.bingx.future.rest.create_order import (
+        query_create_order,
+        QueryCreateOrder,
+    )
+    from robot_one.api.bingx.future.rest.read_position_list import (
+        query_position_list,
+    )
+
+    with MockRestServer() as mock_server:
+        set_transport(Transport(base_url=mock_server.url))
+
+        print(
+            query_create_order(
+                query=QueryCreateOrder(
+                    quantity=2,
+                    side="BUY",
+                    symbol="S0001-USDT",
+                    type="MARKET",
+                ),
+            )
+        )
+        print(query_position_list())
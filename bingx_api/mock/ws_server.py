@@ -0,0 +1,412 @@
+import asyncio
+import gzip
+import random
+from itertools import count
+from logging import getLogger, Logger
+from threading import Event, Thread
+from time import strftime, time_ns
+from typing import Callable, Literal
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+from orjson import dumps, loads
+from websockets.asyncio.server import serve, Server, ServerConnection
+from websockets.exceptions import ConnectionClosed
+
+from robot_one.api.bingx.future.ws.valid_listen_key import ValidListenKey
+
+__all__ = (
+    "MockListenKey",
+    "MockWsServer",
+)
+
+MarketType = Literal["spot", "swap"]
+
+
+def get_time_ms() -> int:
+    return time_ns() // 1_000_000
+
+
+class MockListenKey(ValidListenKey):
+    """`ValidListenKey` holding a fixed key, no REST call."""
+
+    def __init__(self, *args, key: str = "mock-listen-key", **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._mock_key = key
+
+    def create_key(self) -> str:
+        return self._mock_key
+
+    def update_key(self, key: str) -> None:
+        pass
+
+
+class MockWsServer:
+    """Local stand-in of the BingX websocket endpoints.
+
+    Speaks the protocol the channels expect: gzip binary frames, `Ping`
+    (`{"ping":...}` on spot) every `ping_interval_s`, a confirmation per
+    sub/unsub request, `<symbol>@lastPrice` updates for subscribed symbols
+    and, on connections opened with a `listenKey`, account events.
+
+    Every connection sends `message_rate` price updates per second, round
+    robin over its subscriptions, and `account_event_rate` account events per
+    second. `disconnect_every` closes a connection after that many content
+    messages, to exercise reconnections.
+
+    `event_time` stamps the `E` field: the default is the epoch in ms, a
+    benchmark in the same process can pass `time.perf_counter_ns` and
+    compute latencies from `E`.
+    """
+
+    def __init__(
+        self,
+        account_event_rate: float = 0.0,
+        disconnect_every: int = 0,
+        event_time: Callable[[], int] = get_time_ms,
+        host: str = "127.0.0.1",
+        logger: Logger | None = None,
+        market: MarketType = "swap",
+        message_rate: float = 1000.0,
+        ping_interval_s: float = 5.0,
+        port: int = 0,
+        symbol_count: int = 10,
+    ) -> None:
+        self._account_event_rate = account_event_rate
+        self._disconnect_every = disconnect_every
+        self._event_time = event_time
+        self._host = host
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+        self._market = market
+        self._message_rate = message_rate
+        self._ping_interval_s = ping_interval_s
+        self._port = port
+        self._symbol_list = [f"S{i:04d}-USDT" for i in range(symbol_count)]
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ready_event = Event()
+        self._server: Server | None = None
+        self._thread: Thread | None = None
+
+        self.connection_count = 0
+        self.pong_count = 0
+        self.sent_count = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def market(self) -> MarketType:
+        return self._market
+
+    @property
+    def symbol_list(self) -> list[str]:
+        return self._symbol_list
+
+    @property
+    def url(self) -> str:
+        path = "swap-market" if self._market == "swap" else "market"
+        return f"ws://{self._host}:{self._port}/{path}"
+
+    @staticmethod
+    def compress(message: dict) -> bytes:
+        return gzip.compress(dumps(message), compresslevel=1, mtime=0)
+
+    def build_ping(self) -> bytes:
+        if self._market == "swap":
+            return gzip.compress(b"Ping", mtime=0)
+
+        return self.compress(
+            {"ping": uuid4().hex, "time": strftime("%Y-%m-%dT%H:%M:%S.000+0800")}
+        )
+
+    def build_confirmation(self, id: str) -> bytes:
+        if self._market == "swap":
+            message = {"id": id, "code": 0, "msg": "", "dataType": "", "data": None}
+        else:
+            message = {
+                "code": 0,
+                "id": id,
+                "msg": "SUCCESS",
+                "timestamp": get_time_ms(),
+            }
+
+        return self.compress(message)
+
+    def build_last_price(self, data_type: str) -> bytes:
+        symbol = data_type.split("@")[0]
+
+        return self.compress(
+            {
+                "code": 0,
+                "dataType": data_type,
+                "data": {
+                    "e": "lastPriceUpdate",
+                    "E": self._event_time(),
+                    "s": symbol,
+                    "c": f"{random.uniform(10.0, 100.0):.4f}",
+                },
+            }
+        )
+
+    def build_account_event(self, order_id: int) -> bytes:
+        event_time = self._event_time()
+        symbol = random.choice(self._symbol_list)
+
+        if self._market == "spot":
+            return self.compress(
+                {
+                    "code": 0,
+                    "dataType": "spot.executionReport",
+                    "data": {
+                        "e": "executionReport",
+                        "E": event_time,
+                        "s": symbol,
+                        "S": "BUY",
+                        "o": "LIMIT",
+                        "q": 10,
+                        "p": 1.5,
+                        "x": "NEW",
+                        "X": "NEW",
+                        "i": order_id,
+                        "l": 0,
+                        "z": 0,
+                        "L": 0,
+                        "n": 0,
+                        "N": "",
+                        "T": 0,
+                        "t": 0,
+                        "O": event_time,
+                        "Z": 0,
+                        "Y": 0,
+                        "Q": 0,
+                        "m": False,
+                    },
+                }
+            )
+
+        if order_id % 2:
+            return self.compress(
+                {
+                    "e": "ACCOUNT_UPDATE",
+                    "E": event_time,
+                    "a": {
+                        "m": "ORDER",
+                        "B": [{"a": "USDT", "wb": "1000.0", "cw": "900.0", "bc": "0"}],
+                        "P": [],
+                    },
+                }
+            )
+
+        return self.compress(
+            {
+                "e": "ORDER_TRADE_UPDATE",
+                "E": event_time,
+                "o": {
+                    "s": symbol,
+                    "c": "",
+                    "i": order_id,
+                    "S": "BUY",
+                    "o": "LIMIT",
+                    "q": "10.00000000",
+                    "p": "1.50000000",
+                    "sp": "0.00000000",
+                    "ap": "0.00000000",
+                    "x": "TRADE",
+                    "X": "NEW",
+                    "N": "USDT",
+                    "n": "0.00000000",
+                    "T": 0,
+                    "wt": "MARK_PRICE",
+                    "ps": "LONG",
+                    "rp": "0.00000000",
+                    "z": "0.00000000",
+                },
+            }
+        )
+
+    async def read(
+        self,
+        connection: ServerConnection,
+        subscription_map: dict[str, None],
+    ) -> None:
+        logger = self._logger
+
+        async for message in connection:
+            if message in ("Pong", b"Pong") or (
+                isinstance(message, str) and message.startswith('{"pong"')
+            ):
+                self.pong_count += 1
+                continue
+
+            query = loads(message)
+            data_type = query.get("dataType", "")
+
+            if query.get("reqType") == "unsub":
+                subscription_map.pop(data_type, None)
+            else:
+                subscription_map[data_type] = None
+
+            logger.debug("<MOCK:WS>:%s:%s", query.get("reqType"), data_type)
+
+            await connection.send(self.build_confirmation(id=query.get("id", "")))
+
+    async def write(
+        self,
+        connection: ServerConnection,
+        listen_key: str | None,
+        subscription_map: dict[str, None],
+    ) -> None:
+        account_event_rate = self._account_event_rate if listen_key else 0.0
+        disconnect_every = self._disconnect_every
+        message_rate = self._message_rate
+        ping_interval_s = self._ping_interval_s
+
+        loop = asyncio.get_running_loop()
+        order_id_iterator = count(1)
+        start_s = loop.time()
+        next_ping_s = start_s + ping_interval_s
+        account_sent = 0
+        price_sent = 0
+        content_sent = 0
+
+        while True:
+            await asyncio.sleep(0.001)
+            now_s = loop.time()
+
+            if now_s >= next_ping_s:
+                await connection.send(self.build_ping())
+                next_ping_s = now_s + ping_interval_s
+
+            frame_list = []
+
+            price_due = int((now_s - start_s) * message_rate) - price_sent
+            data_type_list = [d for d in subscription_map if d.endswith("@lastPrice")]
+            if data_type_list:
+                for i in range(price_sent, price_sent + price_due):
+                    frame_list.append(
+                        self.build_last_price(
+                            data_type=data_type_list[i % len(data_type_list)],
+                        )
+                    )
+            price_sent += price_due
+
+            account_due = int((now_s - start_s) * account_event_rate) - account_sent
+            if self._market == "swap" or "spot.executionReport" in subscription_map:
+                for _ in range(account_due):
+                    frame_list.append(
+                        self.build_account_event(order_id=next(order_id_iterator))
+                    )
+            account_sent += account_due
+
+            for frame in frame_list:
+                await connection.send(frame)
+                content_sent += 1
+                self.sent_count += 1
+
+                if disconnect_every and content_sent >= disconnect_every:
+                    self._logger.debug("<MOCK:WS>:DISCONNECTING")
+                    await connection.close()
+                    return
+
+    async def handle(self, connection: ServerConnection) -> None:
+        query = parse_qs(urlsplit(connection.request.path).query)  # type: ignore
+        listen_key = query.get("listenKey", [None])[0]
+        subscription_map: dict[str, None] = {}
+
+        self.connection_count += 1
+
+        write_task = asyncio.create_task(
+            self.write(
+                connection=connection,
+                listen_key=listen_key,
+                subscription_map=subscription_map,
+            )
+        )
+
+        try:
+            await self.read(connection=connection, subscription_map=subscription_map)
+        except ConnectionClosed:
+            pass
+        finally:
+            write_task.cancel()
+
+    async def serve(self) -> None:
+        async with serve(self.handle, self._host, self._port) as server:
+            self._server = server
+            self._port = server.sockets[0].getsockname()[1]
+            self._ready_event.set()
+
+            await server.serve_forever()
+
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+
+        try:
+            loop.run_until_complete(self.serve())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
+
+    def start(self) -> None:
+        """Serve from a daemon thread, return once `url` accepts connections."""
+
+        thread = Thread(target=self.run, daemon=True)
+        self._thread = thread
+
+        thread.start()
+        self._ready_event.wait()
+
+    def stop(self) -> None:
+        loop = self._loop
+        server = self._server
+
+        if loop is not None and server is not None:
+            loop.call_soon_threadsafe(server.close)
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+if __name__ == "__main__":
+    import logging
+
+    from robot_one.api.bingx.future.ws.stream_last_price import (
+        ProducerLastPrice,
+        StreamerLastPrice,
+    )
+    from robot_one.api.bingx.future.ws.stream_channel import (
+        ProducerChannel,
+        StreamerChannel,
+    )
+
+    logging.basicConfig(level=logging.FATAL)
+
+    with MockWsServer(message_rate=5, symbol_count=2) as mock_server:
+        streamer = StreamerLastPrice(
+            producer=ProducerLastPrice(
+                daemon=True,
+                streamer_channel=StreamerChannel(
+                    producer=ProducerChannel(
+                        daemon=True,
+                        subscription_list=ProducerLastPrice.build_subscription_list(
+                            symbol_list=mock_server.symbol_list,
+                        ),
+                        url=mock_server.url,
+                    ),
+                ),
+            ),
+        )
+
+        try:
+            for received_message in streamer:
+                print(received_message)
+        except KeyboardInterrupt:
+            print("Closing the websocket connection.")
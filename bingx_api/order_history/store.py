@@ -0,0 +1,308 @@
+import sqlite3
+from datetime import datetime, timedelta
+from logging import getLogger, Logger
+from pathlib import Path
+from threading import Lock
+from typing import Literal, NamedTuple, Sequence
+
+from requests import Session
+
+from robot_one.api.bingx.future.rest import read_order_list as future_read_order_list
+from robot_one.api.bingx.spot.rest import read_order_list as spot_read_order_list
+
+__all__ = [
+    "MarketType",
+    "OrderHistoryStore",
+    "OrderUpdateType",
+    "Watermark",
+]
+
+MarketType = Literal["future", "spot"]
+OrderUpdateType = future_read_order_list.OrderUpdate | spot_read_order_list.OrderUpdate
+
+ALL_SYMBOL = ""
+# Orders closed or filled after the last `sync` are re-read from a little
+# before the watermark, so late updates close to it are not missed.
+SYNC_MARGIN = timedelta(minutes=10)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS order_update (
+    market TEXT NOT NULL,
+    order_id INTEGER NOT NULL,
+    symbol TEXT NOT NULL,
+    status TEXT NOT NULL,
+    side TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    update_time INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (market, order_id)
+);
+CREATE INDEX IF NOT EXISTS order_update_symbol_time
+    ON order_update (market, symbol, time);
+CREATE INDEX IF NOT EXISTS order_update_status_time
+    ON order_update (market, status, time);
+CREATE INDEX IF NOT EXISTS order_update_time
+    ON order_update (market, time);
+CREATE TABLE IF NOT EXISTS watermark (
+    market TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    order_id INTEGER NOT NULL,
+    update_time INTEGER NOT NULL,
+    PRIMARY KEY (market, symbol)
+);
+"""
+
+UPSERT_ORDER_UPDATE = """
+INSERT INTO order_update
+    (market, order_id, symbol, status, side, time, update_time, payload)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (market, order_id) DO UPDATE SET
+    symbol = excluded.symbol,
+    status = excluded.status,
+    side = excluded.side,
+    time = excluded.time,
+    update_time = excluded.update_time,
+    payload = excluded.payload
+WHERE excluded.update_time > order_update.update_time
+"""
+
+UPSERT_WATERMARK = """
+INSERT INTO watermark (market, symbol, order_id, update_time)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (market, symbol) DO UPDATE SET
+    order_id = max(watermark.order_id, excluded.order_id),
+    update_time = max(watermark.update_time, excluded.update_time)
+"""
+
+
+class Watermark(NamedTuple):
+    order_id: int
+    update_time: int
+
+
+class OrderHistoryStore:
+    """Local SQLite mirror of the historical orders (futures and spot).
+
+    One row per `(market, order_id)`, the whole `OrderUpdate` kept as JSON
+    next to indexed `symbol`, `status` and `time` columns.
+    A watermark (highest `order_id` / `update_time` synced) is kept per market
+    and symbol so `sync` only requests the orders updated since, minus
+    `SYNC_MARGIN`. Orders are upserted on `(order_id, update_time)`: an order
+    filled or canceled after an earlier `sync` replaces its stored state.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        logger: Logger | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._logger = logger or getLogger(name=self.__class__.__name__)
+
+        self._lock = Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def read_watermark(
+        self,
+        market: MarketType,
+        symbol: str | None = None,
+    ) -> Watermark | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT order_id, update_time FROM watermark"
+                " WHERE market = ? AND symbol = ?",
+                (market, symbol or ALL_SYMBOL),
+            ).fetchone()
+
+        return None if row is None else Watermark(*row)
+
+    def write(
+        self,
+        market: MarketType,
+        order_list: Sequence[OrderUpdateType],
+        symbol: str | None = None,
+    ) -> int:
+        """Upsert `order_list` and move the watermark of `symbol`.
+
+        A stored order is only replaced by one with a newer `update_time`.
+        Returns the number of orders inserted or replaced.
+        """
+
+        if not order_list:
+            return 0
+
+        row_list = [
+            (
+                market,
+                order.order_id,
+                order.symbol,
+                order.status,
+                order.side,
+                order.time,
+                order.update_time,
+                order.model_dump_json(by_alias=True),
+            )
+            for order in order_list
+        ]
+
+        with self._lock, self._connection:
+            change_count = self._connection.total_changes
+            self._connection.executemany(UPSERT_ORDER_UPDATE, row_list)
+            change_count = self._connection.total_changes - change_count
+            self._connection.execute(
+                UPSERT_WATERMARK,
+                (
+                    market,
+                    symbol or ALL_SYMBOL,
+                    max(order.order_id for order in order_list),
+                    max(order.update_time for order in order_list),
+                ),
+            )
+
+        return change_count
+
+    def fetch(
+        self,
+        market: MarketType,
+        start_time: int,
+        symbol: str | None = None,
+        session: Session | None = None,
+        watermark: Watermark | None = None,
+        margin: timedelta = SYNC_MARGIN,
+    ) -> Sequence[OrderUpdateType]:
+        """Orders since `watermark.update_time` minus `margin`, or since
+        `start_time` without watermark.
+        """
+
+        if watermark is not None:
+            start_time = watermark.update_time - int(margin.total_seconds() * 1000)
+
+        end_time = int(datetime.now().timestamp() * 1000)
+
+        if market == "future":
+            return future_read_order_list.query_order_list_by_time_window(
+                end_time=end_time,
+                session=session,
+                start_time=start_time,
+                symbol=symbol,
+            )
+
+        return spot_read_order_list.query_order_list_full(
+            query=spot_read_order_list.QueryOrderList(
+                end_time=end_time,
+                start_time=start_time,
+                symbol=symbol,
+            ),
+            session=session,
+        )
+
+    def sync(
+        self,
+        market: MarketType,
+        symbol: str | None = None,
+        start_time: int | None = None,
+        session: Session | None = None,
+        margin: timedelta = SYNC_MARGIN,
+    ) -> int:
+        """Fetch and store the orders updated since the last `sync`.
+
+        The first `sync` of a market / symbol reads from `start_time` (7 days
+        ago by default). Returns the number of orders inserted or replaced.
+        """
+
+        watermark = self.read_watermark(market=market, symbol=symbol)
+
+        if start_time is None:
+            start_time = int((datetime.now() - timedelta(days=7)).timestamp() * 1000)
+
+        order_list = self.fetch(
+            margin=margin,
+            market=market,
+            session=session,
+            start_time=start_time,
+            symbol=symbol,
+            watermark=watermark,
+        )
+
+        self.logger.debug(
+            "<ORDER_HISTORY>:SYNC:%s:%s:%s:%s",
+            market,
+            symbol,
+            watermark,
+            len(order_list),
+        )
+
+        return self.write(market=market, order_list=order_list, symbol=symbol)
+
+    def query(
+        self,
+        market: MarketType,
+        symbol: str | None = None,
+        status: str | list[str] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        limit: int | None = None,
+    ) -> list[OrderUpdateType]:
+        """Stored orders matching every given filter, sorted by `time`."""
+
+        sql = "SELECT payload FROM order_update WHERE market = ?"
+        parameter_list: list[int | str] = [market]
+
+        if symbol is not None:
+            sql += " AND symbol = ?"
+            parameter_list.append(symbol)
+
+        if status is not None:
+            status_list = [status] if isinstance(status, str) else status
+            sql += f" AND status IN ({', '.join('?' * len(status_list))})"
+            parameter_list.extend(status_list)
+
+        if start_time is not None:
+            sql += " AND time >= ?"
+            parameter_list.append(start_time)
+
+        if end_time is not None:
+            sql += " AND time <= ?"
+            parameter_list.append(end_time)
+
+        sql += " ORDER BY time, order_id"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameter_list.append(limit)
+
+        with self._lock:
+            row_list = self._connection.execute(sql, parameter_list).fetchall()
+
+        model = (
+            future_read_order_list.OrderUpdate
+            if market == "future"
+            else spot_read_order_list.OrderUpdate
+        )
+
+        return [model.model_validate_json(payload) for (payload,) in row_list]
+
+
+if __name__ == "__main__":
+    store = OrderHistoryStore(path=Path.home() / ".bingx" / "order_history.sqlite")
+
+    print("synced:", store.sync(market="future", symbol="BTC-USDT"))
+    print(
+        "result:",
+        store.query(market="future", symbol="BTC-USDT", status="FILLED", limit=10),
+    )
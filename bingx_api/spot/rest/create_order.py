@@ -11,7 +11,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.spot.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.spot.rest.url import SPOT_V1_TRADE_ORDER
@@ -132,7 +132,7 @@ def request_create_order(
     query: QueryCreateOrder,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_TRADE_ORDER
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -11,7 +11,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.spot.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.spot.rest.url import (
@@ -100,7 +100,7 @@ def request_create_order_list(
     - (GOOD) It truncate automatically the price and quantity when incorrect.
     """
 
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_TRADE_BATCH_ORDERS
 
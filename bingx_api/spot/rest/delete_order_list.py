@@ -5,7 +5,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.spot.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.spot.rest.create_order import (
@@ -154,7 +154,7 @@ def request_delete_order_list(
 
     The field `debugMsg` seems to be always empty.
     """
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_TRADE_CANCEL_ORDERS
 
@@ -5,7 +5,8 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
+    LOGGER,
 )
 from robot_one.api.bingx.spot.rest.url import SPOT_V1_COMMON_SYMBOLS
 
@@ -84,7 +85,7 @@ def request_contract_list(
     session: Session | None = None,
 ) -> Response:
     query = query or QueryContractList()
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_COMMON_SYMBOLS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -96,7 +97,7 @@ def request_contract_list(
     )
     prepped = session.prepare_request(request=session_request)
 
-    print(prepped.method, prepped.url)
+    LOGGER.debug("<BINGX:REST>:%s:%s", prepped.method, prepped.url)
 
     response = session.send(request=prepped)
     response.raise_for_status()
@@ -1,22 +1,36 @@
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Iterator, Literal, overload, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.future.rest.core import (
-    build_session,
+    get_session,
+    LOGGER,
+)
+from robot_one.api.bingx.kline.backfill import backfill_kline
+from robot_one.api.bingx.kline.model import (
+    decode_spot_kline_columns,
+    KlineColumns,
+    to_polars,
 )
 from robot_one.api.bingx.spot.rest.url import SPOT_V2_MARKET_KLINE
 
+if TYPE_CHECKING:
+    import polars as pl
+
 __all__ = [
     "get_specific_unix_timestamp_ms",
     "get_unix_timestamp_ms",
     "Interval",
     "KLineEntry",
+    "KlineFormat",
     "query_kline",
+    "query_kline_backfill",
     "QueryKLine",
     "request_kline",
     "ResponseKline",
@@ -33,6 +47,9 @@ def get_specific_unix_timestamp_ms(specific_time: datetime | None = None) -> int
     return int(specific_time.now().timestamp() * 1000)
 
 
+KlineFormat = Literal["model", "numpy", "polars"]
+
+
 class Interval(str, Enum):
     MINUTES_1 = "1m"
     MINUTES_3 = "3m"
@@ -142,7 +159,7 @@ def request_kline(
     query: QueryKLine,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V2_MARKET_KLINE
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -154,7 +171,7 @@ def request_kline(
     )
     prepped = session.prepare_request(request=session_request)
 
-    print(prepped.method, prepped.url)
+    LOGGER.debug("<BINGX:REST>:%s:%s", prepped.method, prepped.url)
 
     response = session.send(request=prepped)
     response.raise_for_status()
@@ -162,14 +179,87 @@ def request_kline(
     return response
 
 
-def query_kline(query: QueryKLine) -> list[KLineEntry]:
+@overload
+def query_kline(
+    query: QueryKLine,
+    as_: Literal["model"] = "model",
+) -> list[KLineEntry]: ...
+
+
+@overload
+def query_kline(query: QueryKLine, as_: Literal["numpy"]) -> KlineColumns: ...
+
+
+@overload
+def query_kline(query: QueryKLine, as_: Literal["polars"]) -> "pl.DataFrame": ...
+
+
+def query_kline(
+    query: QueryKLine,
+    as_: KlineFormat = "model",
+) -> "list[KLineEntry] | KlineColumns | pl.DataFrame":
+    """Candles as `KLineEntry` models, or as columns with `as_="numpy" | "polars"`.
+
+    The columnar formats decode the body straight into float64/int64 arrays
+    (open, high, low, close, volume, time) without building one model per row.
+    """
+
     response = request_kline(query=query)
     response.raise_for_status()
+
+    if as_ == "numpy":
+        return decode_spot_kline_columns(content=response.content)
+    if as_ == "polars":
+        return to_polars(
+            kline_columns=decode_spot_kline_columns(content=response.content)
+        )
+
     endpoint_response = ResponseKline.model_validate_json(response.text)
 
     return endpoint_response.data
 
 
+def query_kline_backfill(
+    symbol: str,
+    interval: Interval,
+    start_time: int,
+    end_time: int | None = None,
+    checkpoint_path: Path | None = None,
+    limit: int = 1000,
+    max_workers: int = 4,
+    rate_per_s: float = 10,
+) -> Iterator[KLineEntry]:
+    """Stream [start_time, end_time] by `open_time`, fetching windows concurrently.
+
+    Without `end_time`, a backfill resumed from `checkpoint_path` keeps the
+    `end_time` it started with, a new one stops at now.
+    """
+
+    def fetch(window_start: int, window_end: int) -> list[KLineEntry]:
+        return query_kline(
+            query=QueryKLine(
+                end_time=window_end,
+                interval=interval.value,
+                limit=limit,
+                start_time=window_start,
+                symbol=symbol,
+            ),
+        )
+
+    return backfill_kline(
+        fetch=fetch,
+        start_time=start_time,
+        end_time=end_time,
+        interval=interval.to_timedelta(),
+        checkpoint_key=f"spot:{symbol}:{interval.value}",
+        checkpoint_path=checkpoint_path,
+        get_time=attrgetter("open_time"),
+        limit=limit,
+        max_workers=max_workers,
+        rate_per_s=rate_per_s,
+    )
+
+
 if __name__ == "__main__":
     result = query_kline(
         query=QueryKLine(
@@ -10,7 +10,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.spot.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.spot.rest.url import SPOT_V1_TRADE_OPEN_ORDERS
@@ -146,7 +146,7 @@ def request_open_order_list(
     session: Session | None = None,
 ) -> Response:
     query = query or QueryOpenOrderList()
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_TRADE_OPEN_ORDERS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -12,7 +12,7 @@ from pydantic.alias_generators import to_camel
 from requests import Request, Response, Session
 
 from robot_one.api.bingx.spot.rest.core import (
-    build_session,
+    get_session,
     get_signed_request,
 )
 from robot_one.api.bingx.spot.rest.url import SPOT_V1_TRADE_HISTORY_ORDERS
@@ -167,7 +167,7 @@ def request_order_list(
     query: QueryOrderList,
     session: Session | None = None,
 ) -> Response:
-    session = session or build_session()
+    session = session or get_session()
 
     url = SPOT_V1_TRADE_HISTORY_ORDERS
     params_map = query.model_dump(by_alias=True, exclude_none=True)
@@ -186,10 +186,13 @@ def request_order_list(
     return response
 
 
-def query_order_list(query: QueryOrderList) -> list[OrderUpdate]:
+def query_order_list(
+    query: QueryOrderList,
+    session: Session | None = None,
+) -> list[OrderUpdate]:
     """Query the user's historical orders (order status is completed or canceled)."""
 
-    response = request_order_list(query=query)
+    response = request_order_list(query=query, session=session)
     response.raise_for_status()
     endpoint_response = EndpointResponse.model_validate_json(response.text)
 
@@ -198,12 +201,13 @@ def query_order_list(query: QueryOrderList) -> list[OrderUpdate]:
 
 def query_order_list_full(
     query: QueryOrderList,
+    session: Session | None = None,
     sleep_s: float = 0,
 ) -> list[OrderUpdate]:
     order_list_full = []
 
     while True:
-        order_list = query_order_list(query=query)
+        order_list = query_order_list(query=query, session=session)
         order_list_full.extend(order_list)
 
         if order_list and len(order_list) == query.page_size:
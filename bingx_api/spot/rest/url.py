@@ -1,19 +1,13 @@
-MARKET_HIS_V1_KLINE = "https://open-api.bingx.com/openApi/market/his/v1/kline"
+from robot_one.api.bingx.future.rest.url import BASE_URL
 
-SPOT_V1_COMMON_SYMBOLS = "https://open-api.bingx.com/openApi/spot/v1/common/symbols"
-SPOT_V1_TRADE_BATCH_ORDERS = (
-    "https://open-api.bingx.com/openApi/spot/v1/trade/batchOrders"
-)
-SPOT_V1_TRADE_CANCEL_ORDERS = (
-    "https://open-api.bingx.com/openApi/spot/v1/trade/cancelOrders"
-)
-SPOT_V1_TRADE_HISTORY_ORDERS = (
-    "https://open-api.bingx.com/openApi/spot/v1/trade/historyOrders"
-)
-SPOT_V1_TRADE_OPEN_ORDERS = (
-    "https://open-api.bingx.com/openApi/spot/v1/trade/openOrders"
-)
-SPOT_V1_TRADE_ORDER = "https://open-api.bingx.com/openApi/spot/v1/trade/order"
-SPOT_V1_TRADE_QUERY = "https://open-api.bingx.com/openApi/spot/v1/trade/query"
+MARKET_HIS_V1_KLINE = f"{BASE_URL}/openApi/market/his/v1/kline"
 
-SPOT_V2_MARKET_KLINE = "https://open-api.bingx.com/openApi/spot/v2/market/kline"
+SPOT_V1_COMMON_SYMBOLS = f"{BASE_URL}/openApi/spot/v1/common/symbols"
+SPOT_V1_TRADE_BATCH_ORDERS = f"{BASE_URL}/openApi/spot/v1/trade/batchOrders"
+SPOT_V1_TRADE_CANCEL_ORDERS = f"{BASE_URL}/openApi/spot/v1/trade/cancelOrders"
+SPOT_V1_TRADE_HISTORY_ORDERS = f"{BASE_URL}/openApi/spot/v1/trade/historyOrders"
+SPOT_V1_TRADE_OPEN_ORDERS = f"{BASE_URL}/openApi/spot/v1/trade/openOrders"
+SPOT_V1_TRADE_ORDER = f"{BASE_URL}/openApi/spot/v1/trade/order"
+SPOT_V1_TRADE_QUERY = f"{BASE_URL}/openApi/spot/v1/trade/query"
+
+SPOT_V2_MARKET_KLINE = f"{BASE_URL}/openApi/spot/v2/market/kline"
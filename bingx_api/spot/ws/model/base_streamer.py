@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
-from queue import SimpleQueue
 from threading import Event, Thread
-from typing import Generic, TypeVar
+from typing import Generic, Iterator, TypeVar
+
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    QueueStats,
+)
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencySnapshot,
+    LatencyStage,
+)
 
 __all__ = (
     "BaseProducer",
@@ -12,7 +20,7 @@ __all__ = (
 class BaseProducer(ABC, Thread):
     @property
     @abstractmethod
-    def queue_iterator(self) -> SimpleQueue:
+    def queue_iterator(self) -> BoundedQueue:
         pass
 
     @property
@@ -20,6 +28,11 @@ class BaseProducer(ABC, Thread):
     def event_stop(self) -> Event:
         pass
 
+    def stop(self) -> None:
+        """Ask `run` to return, a producer reading a channel stops it too."""
+
+        self.event_stop.set()
+
 
 ContentType = TypeVar("ContentType")
 ProducerType = TypeVar("ProducerType", bound=BaseProducer)
@@ -34,20 +47,20 @@ class BaseStreamer(Generic[ProducerType, ContentType]):
         self._running = False
 
     def __enter__(self):
-        self.__start_thread()
+        self._start_thread()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        self._producer.event_stop.set()
+        self._producer.stop()
 
     def __iter__(self):
-        self.__start_thread()
+        self._start_thread()
         return self
 
     def __next__(self) -> ContentType:
         return self._producer.queue_iterator.get()
 
-    def __start_thread(self) -> None:
+    def _start_thread(self) -> None:
         if not self._running:
             self._producer.start()
             self._running = True
@@ -56,8 +69,57 @@ class BaseStreamer(Generic[ProducerType, ContentType]):
     def producer(self) -> ProducerType:
         return self._producer
 
+    @property
+    def queue_stats(self) -> QueueStats:
+        return self._producer.queue_iterator.stats
+
+    def latency_snapshot(self) -> dict[LatencyStage, LatencySnapshot]:
+        """p50/p99/max per stage of the producer `latency_metrics`, empty when off."""
+
+        latency_metrics = getattr(self._producer, "latency_metrics", None)
+
+        return {} if latency_metrics is None else latency_metrics.snapshot()
+
+    def next_batch(
+        self,
+        max_items: int = 1000,
+        timeout: float | None = None,
+    ) -> list[ContentType]:
+        """Every pending item, up to `max_items`, in a single queue lock.
+
+        Blocks until one item is available, at most `timeout` seconds: an
+        empty list means the timeout expired.
+        """
+
+        self._start_thread()
+
+        return self._producer.queue_iterator.get_batch(
+            max_items=max_items,
+            timeout=timeout,
+        )
+
+    def iter_batch(
+        self,
+        max_items: int = 1000,
+        timeout: float | None = None,
+    ) -> Iterator[list[ContentType]]:
+        """`next_batch` iterator, stops once the producer is stopped and drained.
+
+        `timeout` bounds how long a stop goes unnoticed while no item arrives.
+        """
+
+        event_stop = self._producer.event_stop
+
+        while True:
+            item_list = self.next_batch(max_items=max_items, timeout=timeout)
+
+            if item_list:
+                yield item_list
+            elif event_stop.is_set():
+                break
+
     def start(self) -> ProducerType:
         return self._producer.start()
 
     def stop(self) -> None:
-        self._producer.event_stop.set()
+        self._producer.stop()
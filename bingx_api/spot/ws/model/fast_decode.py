@@ -0,0 +1,101 @@
+from typing import NamedTuple
+
+from orjson import loads
+
+__all__ = (
+    "decode_execution_report",
+    "OrderUpdateRecord",
+    "ResponseDataRecord",
+)
+
+
+class OrderUpdateRecord(NamedTuple):
+    """Spot `OrderUpdate` (`executionReport`) as a tuple, same field names."""
+
+    C: str | None
+    E: int
+    e: str
+    i: int
+    l: float
+    L: float
+    m: bool
+    n: float
+    N: str
+    O: int
+    o: str
+    p: float
+    Q: float
+    q: float
+    S: str
+    s: str
+    t: float
+    T: int
+    X: str
+    x: str
+    Y: float
+    Z: float
+    z: float
+
+
+class ResponseDataRecord(NamedTuple):
+    code: int | None
+    data_type: str
+    data: OrderUpdateRecord
+
+
+def decode_execution_report(message: bytes) -> ResponseDataRecord:
+    """`ResponseData.model_validate_json(message)` without pydantic.
+
+    Raises:
+        ValueError: The message is not a `spot.executionReport`.
+    """
+
+    response = loads(message)
+    data_type = response.get("dataType")
+
+    if data_type != "spot.executionReport":
+        raise ValueError("dataType: " + str(data_type))
+
+    data = response["data"]
+
+    return ResponseDataRecord(
+        response.get("code"),
+        data_type,
+        OrderUpdateRecord(
+            data.get("C"),
+            data["E"],
+            data["e"],
+            data["i"],
+            float(data["l"]),
+            float(data["L"]),
+            data["m"],
+            float(data["n"]),
+            data["N"],
+            data["O"],
+            data["o"],
+            float(data["p"]),
+            float(data["Q"]),
+            float(data["q"]),
+            data["S"],
+            data["s"],
+            float(data["t"]),
+            data["T"],
+            data["X"],
+            data["x"],
+            float(data["Y"]),
+            float(data["Z"]),
+            float(data["z"]),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    print(
+        decode_execution_report(
+            message=b'{"code":0,"dataType":"spot.executionReport","data":'
+            b'{"e":"executionReport","E":1712620300043,"s":"CKB-USDT","S":"BUY",'
+            b'"o":"LIMIT","q":228,"p":0.021851,"x":"CANCELED","X":"CANCELED",'
+            b'"i":1777483570864881664,"l":0,"z":0,"L":0,"n":0,"N":"","T":0,"t":0,'
+            b'"O":1712620082103,"Z":0,"Y":0,"Q":5,"m":false}}'
+        )
+    )
@@ -1,16 +1,36 @@
 from logging import getLogger, Logger
-from queue import SimpleQueue
 from threading import Event
-from typing import Literal
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import (
+    GapMarker,
+    ReconnectPolicy,
+)
+from robot_one.api.bingx.spot.ws.model.fast_decode import (
+    decode_execution_report,
+    ResponseDataRecord,
+)
 from robot_one.api.bingx.spot.ws.model.base_streamer import (
     BaseProducer,
     BaseStreamer,
 )
-from robot_one.api.bingx.spot.ws.valid_listen_key import ValidListenKey
+from robot_one.api.bingx.spot.ws.url import MARKET
+from robot_one.api.bingx.spot.ws.valid_listen_key import (
+    get_valid_listen_key,
+    ValidListenKey,
+)
 from robot_one.api.bingx.spot.ws.stream_channel import (
     ProducerChannel,
     StreamerChannel,
@@ -21,6 +41,7 @@ __all__ = (
     "OrderUpdate",
     "ProducerAccount",
     "ResponseData",
+    "ResponseDataType",
     "StreamerAccount",
     "ValidListenKey",
 )
@@ -134,33 +155,104 @@ class ResponseListenKey(BaseModel):
     listen_key: str
 
 
+# `fast_decode` queues records, read like the model.
+ResponseDataType = ResponseData | ResponseDataRecord
+
+
 class ProducerAccount(BaseProducer):
+    @staticmethod
+    def parse_response_data(message: bytes) -> ResponseData:
+        return ResponseData.model_validate_json(json_data=message)
+
     def __init__(
         self,
         *args,
         catch_exception: bool = True,
+        conflate_key: Callable[[ResponseDataType], Any] | None = None,
+        fast_decode: bool = False,
+        gap_marker: bool = False,
+        latency_metrics: LatencyMetrics | None = None,
+        listen_key: ValidListenKey | None = None,
         logger: Logger | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        queue_maxsize: int = 0,
+        reconnect_policy: ReconnectPolicy | None = None,
+        streamer_channel: StreamerChannel | None = None,
+        url: str = MARKET,
         **kwargs,
     ):
+        """
+        Args:
+            gap_marker (bool):
+                Queue a `GapMarker` after each reconnection of the channel:
+                account events may have been missed, resynchronise from REST.
+            latency_metrics (LatencyMetrics, optional):
+                Records the decoding, queue wait and clock skew of each
+                event, and the stages of the channel.
+            listen_key (ValidListenKey, optional):
+                Defaults to the key shared by every streamer of the account,
+                see `get_valid_listen_key`. Unused with `streamer_channel`.
+            fast_decode (bool):
+                Decode messages into `ResponseDataRecord` tuples, same
+                fields, instead of validating `ResponseData`. Keep pydantic,
+                the default, to debug unexpected payloads.
+            streamer_channel (StreamerChannel, optional):
+                Channel to read instead of the account websocket, e.g. a
+                `StreamerReplay` of recorded account traffic.
+        """
+
         super().__init__(*args, **kwargs)
 
         self._catch_exception = catch_exception
+        self._fast_decode = fast_decode
+        self._gap_marker = gap_marker
+        self._latency_metrics = latency_metrics
+        self._reconnect_policy = reconnect_policy
+        self._streamer_channel = streamer_channel
+        self._url = url
         self._logger = logger or getLogger(name=__name__)
+        self._listen_key = listen_key
 
+        self._current_channel: StreamerChannel | None = None
         self._event_crash = Event()
         self._event_stop = Event()
-        self._queue_iterator = SimpleQueue[ResponseData]()
+        self._queue_iterator = BoundedQueue[ResponseDataType](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            wait_histogram=(
+                latency_metrics.histogram(stage=LatencyStage.QUEUE)
+                if latency_metrics is not None
+                else None
+            ),
+        )
 
     @property
     def catch_exception(self) -> bool:
         return self._catch_exception
 
+    @property
+    def fast_decode(self) -> bool:
+        return self._fast_decode
+
+    @property
+    def gap_marker(self) -> bool:
+        return self._gap_marker
+
+    @property
+    def latency_metrics(self) -> LatencyMetrics | None:
+        return self._latency_metrics
+
+    @property
+    def listen_key(self) -> ValidListenKey | None:
+        return self._listen_key
+
     @property
     def logger(self) -> Logger:
         return self._logger
 
     @property
-    def queue_iterator(self) -> SimpleQueue[ResponseData]:
+    def queue_iterator(self) -> BoundedQueue[ResponseDataType]:
         return self._queue_iterator
 
     @property
@@ -171,22 +263,98 @@ class ProducerAccount(BaseProducer):
     def event_stop(self) -> Event:
         return self._event_stop
 
+    @property
+    def streamer_channel(self) -> StreamerChannel | None:
+        return self._streamer_channel
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    def stop(self) -> None:
+        super().stop()
+
+        # Without it, the channel would keep reconnecting for nobody.
+        current_channel = self._current_channel
+        if current_channel is not None:
+            current_channel.stop()
+
+    def read_channel(self, streamer_channel: StreamerChannel) -> None:
+        """Decode and queue the messages of `streamer_channel` until stopped."""
+
+        decode: Callable[[bytes], ResponseDataType] = (
+            decode_execution_report if self._fast_decode else self.parse_response_data
+        )
+        event_stop = self._event_stop
+        latency_metrics = self._latency_metrics
+        logger = self._logger
+        queue_iterator = self._queue_iterator
+
+        if latency_metrics is not None:
+            record_parse = latency_metrics.histogram(stage=LatencyStage.PARSE).record
+            record_skew = latency_metrics.histogram(stage=LatencyStage.SKEW).record
+
+        logger.debug("<ACCOUNT_READER>:START_READING")
+
+        for message in streamer_channel:
+            if event_stop.is_set():
+                logger.debug("<ACCOUNT_READER>:STOP_READING")
+                break
+
+            if message.__class__ is GapMarker:
+                queue_iterator.put_marker(message)
+                continue
+
+            start_ns = perf_counter_ns()
+            response_update = decode(message)
+
+            if latency_metrics is not None:
+                record_parse(perf_counter_ns() - start_ns)
+
+                event_ms = getattr(response_update.data, "E", None)
+                if event_ms is not None:
+                    record_skew(time_ns() - event_ms * 1_000_000)
+
+            logger.debug(
+                "<ACCOUNT_READER>:READ:RESPONSE_UPDATE:%s",
+                response_update,
+            )
+            queue_iterator.put(response_update)
+
     def run(self):
         catch_exception = self._catch_exception
         logger = self._logger
-        queue_iterator = self._queue_iterator
+        url = self._url
+        gap_marker = self._gap_marker
+        latency_metrics = self._latency_metrics
+        reconnect_policy = self._reconnect_policy
         event_crash = self._event_crash
         event_stop = self._event_stop
+        streamer_channel = self._streamer_channel
+
+        if streamer_channel is not None:
+            self._current_channel = streamer_channel
 
-        while not event_stop.is_set():
             try:
-                listen_key = ValidListenKey()
+                self.read_channel(streamer_channel=streamer_channel)
+            finally:
+                streamer_channel.stop()
+
+            return
+
+        listen_key = self._listen_key = self._listen_key or get_valid_listen_key()
 
+        while not event_stop.is_set():
+            try:
                 with listen_key as refreshed_listen_key:
                     streamer_channel = StreamerChannel(
                         producer=ProducerChannel(
                             catch_exception=False,
+                            gap_marker=gap_marker,
+                            latency_metrics=latency_metrics,
                             listen_key=refreshed_listen_key,
+                            reconnect_policy=reconnect_policy,
+                            url=url,
                             subscription_list=[
                                 Subscription(
                                     id="0",
@@ -195,24 +363,10 @@ class ProducerAccount(BaseProducer):
                             ],
                         ),
                     )
+                    self._current_channel = streamer_channel
 
                     with streamer_channel as channel_stream:
-                        logger.debug("<ACCOUNT_READER>:START_READING")
-
-                        for message in channel_stream:
-                            if event_stop.is_set():
-                                logger.debug("<ACCOUNT_READER>:STOP_READING")
-                                break
-
-                            response_update = ResponseData.model_validate_json(
-                                json_data=message
-                            )
-
-                            logger.debug(
-                                "<ACCOUNT_READER>:READ:RESPONSE_UPDATE:%s",
-                                response_update,
-                            )
-                            queue_iterator.put_nowait(response_update)
+                        self.read_channel(streamer_channel=channel_stream)
             except Exception as e:
                 if not catch_exception:
                     raise e
@@ -221,7 +375,7 @@ class ProducerAccount(BaseProducer):
                 logger.fatal("<ACCOUNT_READER>:%s", e)
 
 
-StreamerAccount = BaseStreamer[ProducerAccount, ResponseData]
+StreamerAccount = BaseStreamer[ProducerAccount, ResponseDataType]
 
 if __name__ == "__main__":
     import logging
@@ -1,15 +1,34 @@
-import gzip
+import re
+import zlib
 from logging import getLogger, Logger
-from queue import SimpleQueue
-from re import match
+from queue import Full
 from threading import Event
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable
 
 from pydantic import BaseModel, Field
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import WebSocketException
 from websockets.sync import client
 from websockets.sync.connection import Connection
 
 from robot_one.adapter.core.abstract.locked_obj import LockedObj
+from robot_one.api.bingx.future.ws.model.bounded_queue import (
+    BoundedQueue,
+    OverflowPolicy,
+)
+from robot_one.api.bingx.future.ws.model.frame_recorder import FrameRecorder
+from robot_one.api.bingx.future.ws.model.latency_metrics import (
+    LatencyMetrics,
+    LatencyStage,
+)
+from robot_one.api.bingx.future.ws.model.reconnect_policy import (
+    GapMarker,
+    ReconnectPolicy,
+)
+from robot_one.api.bingx.future.ws.stream_channel import (
+    get_data_type,
+    MessageKind,
+)
 from robot_one.api.bingx.spot.ws.model.base_streamer import (
     BaseProducer,
     BaseStreamer,
@@ -42,6 +61,15 @@ QUERY_CHANNEL_LIST_EXAMPLE = [
     ),
 ]
 
+PING_PREFIX = b'{"ping":'
+CONFIRMATION_PREFIX = b'{"code":0,"id":"'
+CONFIRMATION_PATTERN = re.compile(
+    rb"""\{"code":0,"id":"[^"]*","msg":"SUCCESS","timestamp":\d+\}"""
+)
+CONTENT_EVENT_PREFIX = b'{"e":"'
+CODE_OK = b'"code":0'
+GZIP_WBITS = zlib.MAX_WBITS | 16
+
 
 class Subscription(BaseModel):
     id: str = Field(description="An identifier that service will send back.")
@@ -95,48 +123,105 @@ class ProducerChannel(BaseProducer):
     ) -> None:
         logger = logger or getLogger(__name__)
 
-        for query_channel in query_channel_list:
-            query_channel_json = query_channel.model_dump_json(
-                exclude_none=True,
-                by_alias=True,
-            )
+        # Serialized first, then sent back to back: one burst on reconnection.
+        query_channel_json_list = [
+            query_channel.model_dump_json(exclude_none=True, by_alias=True)
+            for query_channel in query_channel_list
+        ]
+
+        for query_channel_json in query_channel_json_list:
             websocket.send(message=query_channel_json)
 
-            logger.debug("<BINGX:WS>:SUBSCRIBING:CHANNEL:%s", query_channel)
+        logger.debug("<BINGX:WS>:SUBSCRIBING:CHANNEL:%s", query_channel_list)
 
     @staticmethod
     def is_ping(message: bytes) -> bool:
-        return message.startswith(b'{"ping":')
+        return message.startswith(PING_PREFIX)
 
     @staticmethod
     def is_subscription_confirmation(message: bytes) -> bool:
-        pattern = r"""\{"code":0,"id":"[^"]*","msg":"SUCCESS","timestamp":\d+\}"""
-
-        return bool(match(pattern=pattern, string=message.decode(encoding="utf-8")))
+        return CONFIRMATION_PATTERN.match(message) is not None
 
     @staticmethod
     def is_error(message: bytes) -> bool:
-        return not (message.find(b'"code":0') > 0 or message.startswith(b'{"e":"'))
+        return not (
+            message.find(CODE_OK) > 0 or message.startswith(CONTENT_EVENT_PREFIX)
+        )
+
+    @staticmethod
+    def classify(message: bytes) -> MessageKind:
+        """`is_ping`, `is_error` and `is_subscription_confirmation` in one pass.
+
+        Content comes first, the bytes are never decoded.
+        """
+
+        if message.startswith(PING_PREFIX):
+            return MessageKind.PING
+
+        if message.startswith(CONTENT_EVENT_PREFIX):
+            return MessageKind.CONTENT
+
+        if message.find(CODE_OK) <= 0:
+            return MessageKind.ERROR
+
+        if (
+            message.startswith(CONFIRMATION_PREFIX)
+            and CONFIRMATION_PATTERN.match(message) is not None
+        ):
+            return MessageKind.CONFIRMATION
+
+        return MessageKind.CONTENT
 
     @staticmethod
     def decompress(data: str | bytes) -> bytes:
-        if isinstance(data, bytes):
-            decompressed_data = gzip.decompress(data)
-        elif isinstance(data, str):
-            decompressed_data = gzip.decompress(data.encode("utf-8"))
+        if isinstance(data, str):
+            data = data.encode("utf-8")
 
-        return decompressed_data
+        return zlib.decompress(data, GZIP_WBITS)
 
     def __init__(
         self,
         *args,
         catch_exception: bool = True,
+        conflate_key: Callable[[bytes], Any] = get_data_type,
+        frame_recorder: FrameRecorder | None = None,
+        gap_marker: bool = False,
+        latency_metrics: LatencyMetrics | None = None,
         listen_key: ValidListenKey | None = None,
         logger: Logger | None = None,
-        max_connection_retry: int = 3,
+        max_connection_retry: int | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        put_timeout_s: float | None = 1.0,
+        queue_iterator: BoundedQueue[bytes] | None = None,
+        queue_maxsize: int = 0,
+        reconnect_policy: ReconnectPolicy | None = None,
         subscription_list: list[Subscription] | None = None,
+        url: str = MARKET,
         **kwargs,
     ):
+        """
+        Args:
+            frame_recorder (FrameRecorder, optional):
+                Appends every raw frame, before decompression, to a
+                recording `ProducerReplay` can play back.
+            gap_marker (bool):
+                Queue a `GapMarker` once reconnected, covering the time
+                without a connection.
+            latency_metrics (LatencyMetrics, optional):
+                Records the decompression, classification and queue wait of
+                each frame. Defaults to no timing.
+            max_connection_retry (int, optional):
+                Failed reconnections in a row before giving up, ignored
+                with `reconnect_policy`. Defaults to never giving up, until
+                stopped: stopping a producer reading the channel stops it.
+            put_timeout_s (float, optional):
+                Longest wait for room in a full BLOCK queue, the message is
+                dropped after it: the socket keeps being read and pinged.
+                `None` waits until there is room or the channel is stopped.
+            reconnect_policy (ReconnectPolicy, optional):
+                Backoff and circuit breaker of the reconnections.
+        """
+
         super().__init__(*args, **kwargs)
 
         event_stop = Event()
@@ -144,16 +229,35 @@ class ProducerChannel(BaseProducer):
             obj=subscription_list or [],
         )
         logger = logger or getLogger(name=self.__class__.__name__)
-        queue_iterator = SimpleQueue[bytes]()
+        own_queue = queue_iterator is None
+        queue_iterator = queue_iterator or BoundedQueue[bytes](
+            conflate_key=conflate_key,
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            wait_histogram=(
+                latency_metrics.histogram(stage=LatencyStage.CHANNEL_QUEUE)
+                if latency_metrics is not None
+                else None
+            ),
+        )
         websocket = None
 
         self._catch_exception = catch_exception
         self._event_stop = event_stop
+        self._frame_recorder = frame_recorder
+        self._gap_marker = gap_marker
+        self._latency_metrics = latency_metrics
         self._listen_key = listen_key
         self._locked_subscription_list = locked_subscription_list
         self._logger = logger
         self._max_connection_retry = max_connection_retry
+        self._own_queue = own_queue
+        self._put_timeout_s = put_timeout_s
         self._queue_iterator = queue_iterator
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy(
+            max_failure=max_connection_retry,
+        )
+        self._url = url
         self._websocket = websocket
 
     @property
@@ -165,7 +269,23 @@ class ProducerChannel(BaseProducer):
         return self._event_stop
 
     @property
-    def queue_iterator(self) -> SimpleQueue[bytes]:
+    def frame_recorder(self) -> FrameRecorder | None:
+        return self._frame_recorder
+
+    @property
+    def gap_marker(self) -> bool:
+        return self._gap_marker
+
+    @property
+    def latency_metrics(self) -> LatencyMetrics | None:
+        return self._latency_metrics
+
+    @property
+    def put_timeout_s(self) -> float | None:
+        return self._put_timeout_s
+
+    @property
+    def queue_iterator(self) -> BoundedQueue[bytes]:
         return self._queue_iterator
 
     @property
@@ -177,9 +297,13 @@ class ProducerChannel(BaseProducer):
         return self._logger
 
     @property
-    def max_connection_retry(self) -> int:
+    def max_connection_retry(self) -> int | None:
         return self._max_connection_retry
 
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy:
+        return self._reconnect_policy
+
     @property
     def subscription_list(self) -> list[Subscription]:
         return self._locked_subscription_list.obj
@@ -188,31 +312,60 @@ class ProducerChannel(BaseProducer):
     def subscription_list(self, subscription_list: list[Subscription]) -> None:
         self.subscribe(expected_list=subscription_list)
 
+    @property
+    def url(self) -> str:
+        return self._url
+
     @property
     def websocket(self) -> Connection | None:
         return self._websocket
 
+    def stop(self) -> None:
+        super().stop()
+
+        # Releases `run` waiting on a full queue nobody reads anymore, a
+        # shared queue (`queue_iterator` argument) is left to its owner.
+        if self._own_queue:
+            self._queue_iterator.close()
+
     def build_url(self) -> str:
         listen_key = self._listen_key
+        url = self._url
 
-        if listen_key and listen_key.locked_key:
-            url = f"{MARKET}?listenKey={listen_key.locked_key.get_key()}"
-        else:
-            url = MARKET
+        key = listen_key.get_key() if listen_key else None
+        if key:
+            url = f"{url}?listenKey={key}"
 
         return url
 
     def run(self):
         catch_exception = self._catch_exception
+        classify = self.classify
+        decompress = self.decompress
         event_stop = self._event_stop
+        frame_recorder = self._frame_recorder
         logger = self._logger
-        max_connection_retry = self._max_connection_retry
+        gap_marker = self._gap_marker
+        latency_metrics = self._latency_metrics
+        put_timeout_s = self._put_timeout_s
         queue_iterator = self._queue_iterator
+        reconnect_policy = self._reconnect_policy
+
+        if latency_metrics is not None:
+            record_decompress = latency_metrics.histogram(
+                stage=LatencyStage.DECOMPRESS
+            ).record
+            record_classify = latency_metrics.histogram(
+                stage=LatencyStage.CLASSIFY
+            ).record
+
+        failure_count = 0
+        gap_start_ms = None
 
-        connection_retry = 0
-        url = self.build_url()
+        while not event_stop.is_set():
+            # The listen key may have been renewed since the last attempt.
+            url = self.build_url()
 
-        while not event_stop.is_set() and connection_retry <= max_connection_retry:
             try:
                 with client.connect(url) as websocket:
                     self._websocket = websocket
@@ -221,32 +374,84 @@ class ProducerChannel(BaseProducer):
 
                     self.subscribe()
 
+                    if gap_start_ms is not None:
+                        if gap_marker:
+                            queue_iterator.put_marker(
+                                GapMarker(
+                                    start_ms=gap_start_ms,
+                                    end_ms=time_ns() // 1_000_000,
+                                    failure_count=failure_count,
+                                    url=self._url,
+                                )
+                            )
+
+                        gap_start_ms = None
+
                     for message_gzip in websocket:
                         if event_stop.is_set():
                             logger.debug("<BINGX:WS>:STOP_READING")
                             break
 
-                        if connection_retry:
-                            connection_retry = 0
+                        if failure_count:
+                            failure_count = 0
 
-                        message = self.decompress(data=message_gzip)
+                        if frame_recorder is not None:
+                            frame_recorder.write(data=message_gzip)
 
-                        if self.is_ping(message=message):
+                        if latency_metrics is None:
+                            message = decompress(data=message_gzip)
+                            message_kind = classify(message=message)
+                        else:
+                            start_ns = perf_counter_ns()
+                            message = decompress(data=message_gzip)
+                            decompressed_ns = perf_counter_ns()
+                            message_kind = classify(message=message)
+                            record_classify(perf_counter_ns() - decompressed_ns)
+                            record_decompress(decompressed_ns - start_ns)
+
+                        if message_kind is MessageKind.CONTENT:
+                            logger.debug("<BINGX:WS>:CONTENT:MESSAGE:%s", message)
+                            try:
+                                queue_iterator.put(item=message, timeout=put_timeout_s)
+                            except Full:
+                                if event_stop.is_set():
+                                    logger.debug("<BINGX:WS>:STOP_READING")
+                                    break
+
+                                logger.warning(
+                                    "<BINGX:WS>:QUEUE_FULL:DROPPED:%s", message
+                                )
+                        elif message_kind is MessageKind.PING:
                             websocket.send(message=b"Pong")
                             logger.debug("<BINGX:WS>:SENDING:MESSAGE:%s", b"Pong")
-                        elif self.is_error(message=message):
+                        elif message_kind is MessageKind.ERROR:
                             logger.fatal("<BINGX:WS>:ERROR:MESSAGE:%s", message)
-                        elif self.is_subscription_confirmation(message=message):
-                            logger.debug("<BINGX:WS>:CONFIRMATION:MESSAGE:%s", message)
                         else:
-                            logger.debug("<BINGX:WS>:CONTENT:MESSAGE:%s", message)
-                            queue_iterator.put_nowait(item=message)
-            except ConnectionClosed as e:
+                            logger.debug("<BINGX:WS>:CONFIRMATION:MESSAGE:%s", message)
+            except (OSError, WebSocketException) as e:
                 if not catch_exception:
                     raise e
 
                 logger.fatal("<BINGX:WS>:%s", e)
-                connection_retry += 1
+            finally:
+                self._websocket = None
+
+            if event_stop.is_set():
+                break
+
+            if gap_start_ms is None:
+                gap_start_ms = time_ns() // 1_000_000
+
+            delay_s = reconnect_policy.next_delay(failure_count=failure_count)
+            if delay_s is None:
+                logger.fatal("<BINGX:WS>:GIVING_UP:FAILURE_COUNT:%s", failure_count)
+                break
+
+            failure_count += 1
+            logger.debug("<BINGX:WS>:RECONNECTING:DELAY_S:%s", delay_s)
+
+            if delay_s:
+                event_stop.wait(timeout=delay_s)
 
     def subscribe(self, expected_list: list[Subscription] | None = None) -> None:
         locked_subscription_list = self._locked_subscription_list
@@ -255,8 +460,9 @@ class ProducerChannel(BaseProducer):
 
         with locked_subscription_list as current_list:
             if websocket is None:
-                current_list[:] = expected_list or current_list
-            elif expected_list:
+                if expected_list is not None:
+                    current_list[:] = expected_list
+            elif expected_list is not None:
                 query_channel_list = self.build_query_channel_list_diff(
                     current_list=current_list,
                     expected_list=expected_list,
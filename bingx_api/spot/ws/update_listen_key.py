@@ -2,7 +2,7 @@ from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 from requests import Response, Request, Session
 
-from robot_one.api.bingx.spot.rest.core import build_session
+from robot_one.api.bingx.spot.rest.core import get_session
 from robot_one.api.bingx.spot.ws.url import USER_AUTH_USER_DATA_STREAM
 
 __all__ = [
@@ -31,7 +31,7 @@ def request_update_listen_key(
     Returns status code 200 on success.
     """
 
-    session = session or build_session()
+    session = session or get_session()
 
     url = USER_AUTH_USER_DATA_STREAM
 